@@ -7,6 +7,11 @@ from alembic import context
 import asyncio
 from app.core.database import Base
 from app.models.careersModel import CareersUsers
+from app.models.revokedTokenModel import RevokedToken
+from app.models.resumeTextModel import CareersResumeText
+from app.models.jobModel import Job, DeadJob
+from app.models.resumeBlobModel import ResumeBlob, CareersUserResume
+from app.models.userModel import User
 from dotenv import load_dotenv
 
 # Load environment variables from .env file
@@ -0,0 +1,28 @@
+"""resume blobs last seen on
+
+Revision ID: 0b7f3e9c2d58
+Revises: a46d0f2b9e81
+Create Date: 2026-10-17 21:03:17.552406+00:00
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '0b7f3e9c2d58'
+down_revision: Union[str, None] = 'a46d0f2b9e81'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.add_column('resume_blobs', sa.Column('last_seen_on', sa.DateTime(), server_default=sa.text('now()'), nullable=False))
+    op.create_index(op.f('ix_resume_blobs_last_seen_on'), 'resume_blobs', ['last_seen_on'], unique=False)
+
+
+def downgrade() -> None:
+    op.drop_index(op.f('ix_resume_blobs_last_seen_on'), table_name='resume_blobs')
+    op.drop_column('resume_blobs', 'last_seen_on')
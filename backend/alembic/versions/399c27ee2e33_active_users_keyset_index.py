@@ -0,0 +1,40 @@
+"""active users keyset index
+
+Revision ID: 399c27ee2e33
+Revises: f5ac422bfc0f
+Create Date: 2026-10-17 10:02:17.503391+00:00
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '399c27ee2e33'
+down_revision: Union[str, None] = 'f5ac422bfc0f'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # CONCURRENTLY keeps the table writable while the index builds
+    with op.get_context().autocommit_block():
+        op.create_index(
+            'ix_careersusers_active_id',
+            'careersusers',
+            ['id'],
+            unique=False,
+            postgresql_where=sa.text('is_active'),
+            postgresql_concurrently=True,
+        )
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.drop_index(
+            'ix_careersusers_active_id',
+            table_name='careersusers',
+            postgresql_concurrently=True,
+        )
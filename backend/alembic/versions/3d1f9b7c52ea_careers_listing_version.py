@@ -0,0 +1,51 @@
+"""careers listing version
+
+Revision ID: 3d1f9b7c52ea
+Revises: 856ab7801f40
+Create Date: 2026-10-17 16:21:09.518274+00:00
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '3d1f9b7c52ea'
+down_revision: Union[str, None] = '856ab7801f40'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table('careers_listing_version',
+    sa.Column('id', sa.SmallInteger(), nullable=False),
+    sa.Column('version', sa.BigInteger(), nullable=False),
+    sa.PrimaryKeyConstraint('id')
+    )
+    op.execute('INSERT INTO careers_listing_version (id, version) VALUES (1, 0)')
+    op.execute(
+        """
+        CREATE FUNCTION bump_careers_listing_version() RETURNS trigger AS $$
+        BEGIN
+            UPDATE careers_listing_version SET version = version + 1 WHERE id = 1;
+            RETURN NULL;
+        END;
+        $$ LANGUAGE plpgsql
+        """
+    )
+    # Statement-level, so a multi-row INSERT from bulk import bumps once
+    op.execute(
+        """
+        CREATE TRIGGER careersusers_bump_listing_version
+        AFTER INSERT OR UPDATE OR DELETE OR TRUNCATE ON careersusers
+        FOR EACH STATEMENT EXECUTE FUNCTION bump_careers_listing_version()
+        """
+    )
+
+
+def downgrade() -> None:
+    op.execute('DROP TRIGGER careersusers_bump_listing_version ON careersusers')
+    op.execute('DROP FUNCTION bump_careers_listing_version()')
+    op.drop_table('careers_listing_version')
@@ -0,0 +1,46 @@
+"""careersusers trigram search
+
+Revision ID: 9a65a47aaa8d
+Revises: 621ec194a776
+Create Date: 2026-10-17 12:05:31.402716+00:00
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '9a65a47aaa8d'
+down_revision: Union[str, None] = '621ec194a776'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+SEARCH_COLUMNS = ('name', 'email', 'mobile')
+
+
+def upgrade() -> None:
+    op.execute('CREATE EXTENSION IF NOT EXISTS pg_trgm')
+    # CONCURRENTLY keeps the table writable while the indexes build
+    with op.get_context().autocommit_block():
+        for column in SEARCH_COLUMNS:
+            op.create_index(
+                f'ix_careersusers_{column}_trgm',
+                'careersusers',
+                [column],
+                unique=False,
+                postgresql_using='gin',
+                postgresql_ops={column: 'gin_trgm_ops'},
+                postgresql_concurrently=True,
+            )
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        for column in SEARCH_COLUMNS:
+            op.drop_index(
+                f'ix_careersusers_{column}_trgm',
+                table_name='careersusers',
+                postgresql_concurrently=True,
+            )
@@ -0,0 +1,52 @@
+"""drop careers listing version
+
+Revision ID: a46d0f2b9e81
+Revises: e7a93c1d4f60
+Create Date: 2026-10-17 20:26:44.180937+00:00
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'a46d0f2b9e81'
+down_revision: Union[str, None] = 'e7a93c1d4f60'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # The listing ETag is now computed from the page itself; the trigger's
+    # single-row UPDATE serialised every write to careersusers
+    op.execute('DROP TRIGGER careersusers_bump_listing_version ON careersusers')
+    op.execute('DROP FUNCTION bump_careers_listing_version()')
+    op.drop_table('careers_listing_version')
+
+
+def downgrade() -> None:
+    op.create_table('careers_listing_version',
+    sa.Column('id', sa.SmallInteger(), nullable=False),
+    sa.Column('version', sa.BigInteger(), nullable=False),
+    sa.PrimaryKeyConstraint('id')
+    )
+    op.execute('INSERT INTO careers_listing_version (id, version) VALUES (1, 0)')
+    op.execute(
+        """
+        CREATE FUNCTION bump_careers_listing_version() RETURNS trigger AS $$
+        BEGIN
+            UPDATE careers_listing_version SET version = version + 1 WHERE id = 1;
+            RETURN NULL;
+        END;
+        $$ LANGUAGE plpgsql
+        """
+    )
+    op.execute(
+        """
+        CREATE TRIGGER careersusers_bump_listing_version
+        AFTER INSERT OR UPDATE OR DELETE OR TRUNCATE ON careersusers
+        FOR EACH STATEMENT EXECUTE FUNCTION bump_careers_listing_version()
+        """
+    )
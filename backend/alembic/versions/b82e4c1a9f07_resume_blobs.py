@@ -0,0 +1,46 @@
+"""resume blobs
+
+Revision ID: b82e4c1a9f07
+Revises: 3d1f9b7c52ea
+Create Date: 2026-10-17 17:04:52.118530+00:00
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'b82e4c1a9f07'
+down_revision: Union[str, None] = '3d1f9b7c52ea'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table('resume_blobs',
+    sa.Column('sha256', sa.String(length=64), nullable=False),
+    sa.Column('key', sa.String(length=500), nullable=False),
+    sa.Column('size', sa.BigInteger(), nullable=False),
+    sa.Column('content_type', sa.String(length=150), nullable=True),
+    sa.Column('created_on', sa.DateTime(), server_default=sa.text('now()'), nullable=False),
+    sa.PrimaryKeyConstraint('sha256'),
+    sa.UniqueConstraint('key')
+    )
+    op.create_table('careers_user_resumes',
+    sa.Column('careersuser_id', sa.Integer(), nullable=False),
+    sa.Column('sha256', sa.String(length=64), nullable=False),
+    sa.Column('filename', sa.String(length=255), nullable=False),
+    sa.Column('uploaded_on', sa.DateTime(), server_default=sa.text('now()'), nullable=False),
+    sa.ForeignKeyConstraint(['careersuser_id'], ['careersusers.id'], ondelete='CASCADE'),
+    sa.ForeignKeyConstraint(['sha256'], ['resume_blobs.sha256'], ),
+    sa.PrimaryKeyConstraint('careersuser_id')
+    )
+    op.create_index(op.f('ix_careers_user_resumes_sha256'), 'careers_user_resumes', ['sha256'], unique=False)
+
+
+def downgrade() -> None:
+    op.drop_index(op.f('ix_careers_user_resumes_sha256'), table_name='careers_user_resumes')
+    op.drop_table('careers_user_resumes')
+    op.drop_table('resume_blobs')
@@ -0,0 +1,38 @@
+"""careers resume texts
+
+Revision ID: c4698a30b75a
+Revises: 9a65a47aaa8d
+Create Date: 2026-10-17 13:41:09.227583+00:00
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+# revision identifiers, used by Alembic.
+revision: str = 'c4698a30b75a'
+down_revision: Union[str, None] = '9a65a47aaa8d'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table('careers_resume_texts',
+    sa.Column('id', sa.Integer(), autoincrement=True, nullable=False),
+    sa.Column('careersuser_id', sa.Integer(), nullable=False),
+    sa.Column('resume_key', sa.String(length=500), nullable=False),
+    sa.Column('content', sa.Text(), nullable=False),
+    sa.Column('search_vector', postgresql.TSVECTOR(), sa.Computed("to_tsvector('english', content)", persisted=True), nullable=True),
+    sa.Column('extracted_on', sa.DateTime(), nullable=False),
+    sa.ForeignKeyConstraint(['careersuser_id'], ['careersusers.id'], ondelete='CASCADE'),
+    sa.PrimaryKeyConstraint('id'),
+    sa.UniqueConstraint('careersuser_id')
+    )
+    op.create_index('ix_careers_resume_texts_search', 'careers_resume_texts', ['search_vector'], unique=False, postgresql_using='gin')
+
+
+def downgrade() -> None:
+    op.drop_index('ix_careers_resume_texts_search', table_name='careers_resume_texts', postgresql_using='gin')
+    op.drop_table('careers_resume_texts')
@@ -0,0 +1,37 @@
+"""revoked tokens timestamptz
+
+Revision ID: e7a93c1d4f60
+Revises: 5c2e8d4a7b13
+Create Date: 2026-10-17 19:48:31.915204+00:00
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'e7a93c1d4f60'
+down_revision: Union[str, None] = '5c2e8d4a7b13'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # Existing values were written as naive UTC
+    for column in ('expires_at', 'revoked_on'):
+        op.alter_column('revoked_tokens', column,
+                   type_=sa.DateTime(timezone=True),
+                   existing_type=sa.DateTime(),
+                   existing_nullable=False,
+                   postgresql_using=f"{column} AT TIME ZONE 'UTC'")
+
+
+def downgrade() -> None:
+    for column in ('expires_at', 'revoked_on'):
+        op.alter_column('revoked_tokens', column,
+                   type_=sa.DateTime(),
+                   existing_type=sa.DateTime(timezone=True),
+                   existing_nullable=False,
+                   postgresql_using=f"{column} AT TIME ZONE 'UTC'")
@@ -0,0 +1,43 @@
+"""user_id sequence
+
+Revision ID: f5ac422bfc0f
+Revises: fb6acab01178
+Create Date: 2026-10-17 09:12:40.118204+00:00
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'f5ac422bfc0f'
+down_revision: Union[str, None] = 'fb6acab01178'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.execute(sa.schema.CreateSequence(sa.Sequence('careersusers_user_id_seq')))
+    # Continue numbering after the highest user_<n> already handed out
+    op.execute(
+        """
+        SELECT setval(
+            'careersusers_user_id_seq',
+            COALESCE(MAX(substring(user_id FROM '^user_([0-9]+)$')::bigint), 0) + 1,
+            false
+        )
+        FROM careersusers
+        """
+    )
+    op.alter_column(
+        'careersusers',
+        'user_id',
+        server_default=sa.text("'user_' || nextval('careersusers_user_id_seq')"),
+    )
+
+
+def downgrade() -> None:
+    op.alter_column('careersusers', 'user_id', server_default=None)
+    op.execute(sa.schema.DropSequence(sa.Sequence('careersusers_user_id_seq')))
@@ -0,0 +1,215 @@
+import json
+import time
+from abc import ABC, abstractmethod
+from collections import OrderedDict
+from typing import Any, Optional
+from app.core.config import settings
+from app.core.logging import logging
+
+
+class CacheBackend(ABC):
+    """Minimal async key/value interface; values must be JSON-serializable."""
+
+    @abstractmethod
+    async def get(self, key: str) -> Optional[Any]: ...
+
+    @abstractmethod
+    async def set(self, key: str, value: Any, ttl_seconds: int): ...
+
+    @abstractmethod
+    async def delete(self, key: str): ...
+
+
+class LRUCache(CacheBackend):
+    """In-process LRU with per-entry expiry."""
+
+    def __init__(self, max_entries: int):
+        self.max_entries = max_entries
+        self._entries = OrderedDict()
+
+    async def get(self, key: str) -> Optional[Any]:
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        expires_at, value = entry
+        if time.monotonic() >= expires_at:
+            del self._entries[key]
+            return None
+        self._entries.move_to_end(key)
+        return value
+
+    async def set(self, key: str, value: Any, ttl_seconds: int):
+        self._entries[key] = (time.monotonic() + ttl_seconds, value)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+
+    async def delete(self, key: str):
+        self._entries.pop(key, None)
+
+    def __len__(self):
+        return len(self._entries)
+
+
+class FakeSharedCache(CacheBackend):
+    """Stand-in for a shared cache in tests: values round-trip through JSON
+    like they would over the wire, but live in a local dict."""
+
+    def __init__(self):
+        self._entries = {}
+
+    async def get(self, key: str) -> Optional[Any]:
+        entry = self._entries.get(key)
+        if entry is None or time.monotonic() >= entry[0]:
+            self._entries.pop(key, None)
+            return None
+        return json.loads(entry[1])
+
+    async def set(self, key: str, value: Any, ttl_seconds: int):
+        self._entries[key] = (time.monotonic() + ttl_seconds, json.dumps(value))
+
+    async def delete(self, key: str):
+        self._entries.pop(key, None)
+
+
+class RedisCache(CacheBackend):
+    """Shared backend on Redis; needs the optional ``redis`` package."""
+
+    def __init__(self, url: str):
+        import redis.asyncio as redis
+
+        self._client = redis.from_url(url)
+
+    async def get(self, key: str) -> Optional[Any]:
+        raw = await self._client.get(key)
+        return None if raw is None else json.loads(raw)
+
+    async def set(self, key: str, value: Any, ttl_seconds: int):
+        await self._client.set(key, json.dumps(value), ex=ttl_seconds)
+
+    async def delete(self, key: str):
+        await self._client.delete(key)
+
+
+class ReadThroughCache:
+    """Local LRU in front of an optional shared backend, with hit/miss counters.
+
+    Errors from the shared backend are logged and treated as misses so an
+    unavailable cache never fails a request. Invalidation only reaches the
+    local LRU of the current process, so keep CACHE_TTL_SECONDS short when
+    running several workers.
+
+    A reader takes ``version()`` before loading a value and passes it to
+    ``set``; if the key was invalidated in between, the value it loaded may
+    predate the write and is not cached.
+    """
+
+    def __init__(
+        self,
+        namespace: str,
+        local: Optional[LRUCache],
+        shared: Optional[CacheBackend] = None,
+        ttl_seconds: int = 60,
+    ):
+        self.namespace = namespace
+        self.local = local
+        self.shared = shared
+        self.ttl_seconds = ttl_seconds
+        self.hits = 0
+        self.misses = 0
+        # Version of the latest invalidation per key, bounded like the LRU;
+        # keys dropped from it count as invalidated at _forgotten_version
+        self._version = 0
+        self._invalidated = OrderedDict()
+        self._forgotten_version = 0
+        self._max_invalidated = local.max_entries if local is not None else 10000
+
+    def _key(self, key) -> str:
+        return f"{self.namespace}:{key}"
+
+    async def get(self, key) -> Optional[Any]:
+        key = self._key(key)
+        if self.local is not None:
+            value = await self.local.get(key)
+            if value is not None:
+                self.hits += 1
+                return value
+        if self.shared is not None:
+            try:
+                value = await self.shared.get(key)
+            except Exception as e:
+                logging.warning(f"Shared cache get failed for {key}: {e}")
+                value = None
+            if value is not None:
+                self.hits += 1
+                if self.local is not None:
+                    await self.local.set(key, value, self.ttl_seconds)
+                return value
+        self.misses += 1
+        return None
+
+    def version(self) -> int:
+        return self._version
+
+    async def set(self, key, value: Any, version: Optional[int] = None):
+        key = self._key(key)
+        if version is not None:
+            invalidated = self._invalidated.get(key, self._forgotten_version)
+            if invalidated > version:
+                return
+        if self.local is not None:
+            await self.local.set(key, value, self.ttl_seconds)
+        if self.shared is not None:
+            try:
+                await self.shared.set(key, value, self.ttl_seconds)
+            except Exception as e:
+                logging.warning(f"Shared cache set failed for {key}: {e}")
+
+    async def invalidate(self, key):
+        key = self._key(key)
+        self._version += 1
+        self._invalidated[key] = self._version
+        self._invalidated.move_to_end(key)
+        while len(self._invalidated) > self._max_invalidated:
+            _, forgotten = self._invalidated.popitem(last=False)
+            self._forgotten_version = max(self._forgotten_version, forgotten)
+        if self.local is not None:
+            await self.local.delete(key)
+        if self.shared is not None:
+            try:
+                await self.shared.delete(key)
+            except Exception as e:
+                logging.warning(f"Shared cache delete failed for {key}: {e}")
+
+    def stats(self) -> dict:
+        lookups = self.hits + self.misses
+        return {
+            "namespace": self.namespace,
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_ratio": round(self.hits / lookups, 4) if lookups else 0.0,
+            "local_entries": len(self.local) if self.local is not None else 0,
+        }
+
+
+def build_cache(namespace: str) -> ReadThroughCache:
+    """Cache configured from CACHE_BACKEND: ``memory``, ``redis`` or ``none``."""
+    backend = settings.CACHE_BACKEND.lower()
+    if backend == "none":
+        return ReadThroughCache(namespace, local=None)
+
+    shared = None
+    if backend == "redis":
+        if not settings.REDIS_URL:
+            logging.error("CACHE_BACKEND=redis but REDIS_URL is not set; using memory only.")
+        else:
+            try:
+                shared = RedisCache(settings.REDIS_URL)
+            except ImportError:
+                logging.error("The 'redis' package is not installed; using memory only.")
+    return ReadThroughCache(
+        namespace,
+        local=LRUCache(settings.CACHE_MAX_ENTRIES),
+        shared=shared,
+        ttl_seconds=settings.CACHE_TTL_SECONDS,
+    )
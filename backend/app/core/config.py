@@ -1,7 +1,7 @@
 from pydantic_settings import BaseSettings
 from dotenv import load_dotenv
 from pathlib import Path
-from typing import List
+from typing import Dict, List, Optional
 import json
 import os
 
@@ -22,12 +22,111 @@ class Settings(BaseSettings):
     POSTGRES_DB: str
     DATABASE_URL: str
 
+    # Engine / connection pool (size the pool per worker process)
+    DB_ECHO: bool = False
+    DB_POOL_SIZE: int = 5
+    DB_MAX_OVERFLOW: int = 10
+    DB_POOL_TIMEOUT: int = 30
+    DB_POOL_RECYCLE: int = 1800
+    DB_POOL_PRE_PING: bool = True
+    # Server-side statement_timeout in milliseconds, 0 disables it
+    DB_STATEMENT_TIMEOUT_MS: int = 0
+    # asyncpg prepared statements cached per connection (0 for pgbouncer)
+    DB_PREPARED_STATEMENT_CACHE_SIZE: int = 100
+    # Read replicas for read-only routes (JSON list in the env), each with
+    # its own pool sized like the primary's. A client's reads stay on the
+    # primary for REPLICA_READ_YOUR_WRITES_SECONDS after its own writes;
+    # replicas failing the health probe or lagging past
+    # REPLICA_MAX_LAG_SECONDS are skipped until they recover
+    DATABASE_REPLICA_URLS: List[str] = []
+    REPLICA_READ_YOUR_WRITES_SECONDS: int = 5
+    REPLICA_HEALTH_CHECK_SECONDS: float = 5.0
+    REPLICA_MAX_LAG_SECONDS: float = 10.0
+
     # Secret key, Debug, and environment settings
     SECRET_KEY: str
     DEBUG: bool
     ALLOWED_HOSTS: List[str]
     CORS_ORIGINS: List[str]
     ENVIRONMENT: str
+    # Concurrent bcrypt hash/verify calls per worker process
+    PASSWORD_HASH_CONCURRENCY: int = 4
+    # get_current_user caches: verified tokens (never past their exp) and
+    # the active user behind a token's sub
+    TOKEN_CACHE_TTL_SECONDS: int = 300
+    PRINCIPAL_CACHE_TTL_SECONDS: int = 30
+    AUTH_CACHE_MAX_ENTRIES: int = 10000
+    # Token revocation: "memory" (per process) or "postgres" (shared),
+    # fronted by a Bloom filter synced/rebuilt on these intervals
+    REVOCATION_BACKEND: str = "memory"
+    REVOCATION_SYNC_SECONDS: int = 5
+    REVOCATION_REBUILD_SECONDS: int = 3600
+    REVOCATION_BLOOM_CAPACITY: int = 100000
+    REVOCATION_BLOOM_ERROR_RATE: float = 0.001
+
+    # Listing total: seconds an exact active-user count is reused
+    USER_COUNT_CACHE_TTL_SECONDS: int = 30
+
+    # Background resume text extraction (process pool per worker process)
+    RESUME_EXTRACTION_ENABLED: bool = True
+    RESUME_EXTRACTION_WORKERS: int = 2
+    RESUME_TEXT_MAX_CHARS: int = 200000
+
+    # Durable job queue (run workers with `python -m app.worker`). When
+    # enabled, registration stages the resume under RESUME_STAGING_DIR and
+    # returns; S3 upload, text extraction and emails run in the workers.
+    # Workers read the staged files, so with workers on other hosts the
+    # directory must be a volume shared with the API containers.
+    JOB_QUEUE_ENABLED: bool = False
+    RESUME_STAGING_DIR: str = str(MEDIA_DIR / "staging")
+    JOB_MAX_ATTEMPTS: int = 5
+    JOB_RETRY_BASE_SECONDS: int = 10
+    JOB_RETRY_MAX_SECONDS: int = 3600
+    JOB_LEASE_SECONDS: int = 300
+    JOB_POLL_SECONDS: float = 1.0
+    JOB_WORKER_CONCURRENCY: int = 4
+
+    # Bulk registration import
+    BULK_IMPORT_MAX_ROWS: int = 10000
+    BULK_IMPORT_BATCH_SIZE: int = 500
+
+    # Resume blobs no user links to (replaced resumes, failed registrations)
+    # are deleted by the job workers once unused for the retention period;
+    # without a running `python -m app.worker` they are never deleted.
+    # An interval of 0 disables the purge.
+    RESUME_BLOB_RETENTION_SECONDS: int = 7 * 24 * 3600
+    RESUME_BLOB_PURGE_INTERVAL_SECONDS: int = 3600
+
+    # Read-through caches: "memory", "redis" (memory + shared) or "none"
+    CACHE_BACKEND: str = "memory"
+    CACHE_TTL_SECONDS: int = 60
+    CACHE_MAX_ENTRIES: int = 10000
+    REDIS_URL: Optional[str] = None
+
+    # Logging: root level, per-logger overrides (JSON object in the env,
+    # e.g. {"sqlalchemy.engine": "INFO"}), "text" or "json" output, rotation
+    LOG_LEVEL: str = "INFO"
+    LOG_LEVELS: Dict[str, str] = {"sqlalchemy.engine": "WARNING"}
+    LOG_FORMAT: str = "text"
+    LOG_MAX_BYTES: int = 10 * 1024 * 1024
+    LOG_BACKUP_COUNT: int = 5
+
+    # Prometheus metrics on /metrics (per worker process) and how often the
+    # event loop lag probe runs
+    METRICS_ENABLED: bool = True
+    EVENT_LOOP_LAG_INTERVAL_SECONDS: float = 0.5
+
+    # Opt-in request profiling (install requirements-profiling.txt; startup
+    # fails without it). Requests sending X-Profile-Token: PROFILING_TOKEN,
+    # or a PROFILING_SAMPLE_RATE share of all requests, are profiled; the
+    # newest PROFILING_MAX_PROFILES are kept and served under /debug/profiles
+    # to holders of the token
+    PROFILING_ENABLED: bool = False
+    PROFILING_TOKEN: Optional[str] = None
+    PROFILING_SAMPLE_RATE: float = 0.0
+    PROFILING_INTERVAL_SECONDS: float = 0.001
+    PROFILING_MAX_PROFILES: int = 50
+    PROFILING_DIR: str = str(Path(__file__).resolve().parent.parent / "profiles")
 
     # Email settings
     EMAIL_HOST: str
@@ -37,11 +136,34 @@ class Settings(BaseSettings):
     EMAIL_HOST_PASSWORD: str
     MAIN_FROM_NAME: str
 
-    # Aws s3 bucket
-    AWS_ACCESS_KEY_ID: str
-    AWS_SECRET_ACCESS_KEY: str
-    AWS_BUCKET: str
-    AWS_REGION: str
+    # Resume storage: "s3" or "local" (files under MEDIA_ROOT, linked as
+    # MEDIA_URL/<key> and served from there by this app, or by a front proxy
+    # mapping MEDIA_URL/resumes to MEDIA_ROOT/resumes)
+    STORAGE_BACKEND: str = "s3"
+    MEDIA_ROOT: str = str(MEDIA_DIR)
+    MEDIA_URL: str = "/media"
+
+    # Aws s3 bucket (only needed with STORAGE_BACKEND=s3; without keys boto3
+    # falls back to its default credential chain)
+    AWS_ACCESS_KEY_ID: Optional[str] = None
+    AWS_SECRET_ACCESS_KEY: Optional[str] = None
+    AWS_BUCKET: str = ""
+    AWS_REGION: str = "us-east-1"
+    # Custom endpoint (e.g. a local S3 stand-in); leave unset for AWS
+    AWS_S3_ENDPOINT_URL: Optional[str] = None
+    # Upload worker threads / in-flight uploads and boto3 HTTP connections
+    S3_MAX_CONCURRENCY: int = 8
+    S3_MAX_POOL_CONNECTIONS: int = 16
+    # Streaming resume uploads (S3 requires parts of at least 5 MB)
+    MAX_RESUME_SIZE_BYTES: int = 10 * 1024 * 1024
+    S3_MULTIPART_PART_SIZE: int = 8 * 1024 * 1024
+    # Presigned direct-to-S3 resume uploads
+    PRESIGNED_URL_EXPIRES_SECONDS: int = 900
+    RESUME_ALLOWED_CONTENT_TYPES: List[str] = [
+        "application/pdf",
+        "application/msword",
+        "application/vnd.openxmlformats-officedocument.wordprocessingml.document",
+    ]
 
     class Config:
         env_file = ".env"
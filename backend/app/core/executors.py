@@ -0,0 +1,26 @@
+import asyncio
+from concurrent.futures import Executor
+from functools import partial
+
+
+class BoundedExecutor:
+    """Run blocking callables off the event loop with a cap on in-flight calls.
+
+    Callers over the limit wait on the semaphore inside the event loop instead
+    of piling up in the executor's queue, so cancelled requests never leave
+    orphaned work behind.
+    """
+
+    def __init__(self, executor: Executor, max_concurrency: int):
+        self._executor = executor
+        self._semaphore = asyncio.Semaphore(max_concurrency)
+
+    async def run(self, func, *args, **kwargs):
+        async with self._semaphore:
+            loop = asyncio.get_running_loop()
+            return await loop.run_in_executor(
+                self._executor, partial(func, *args, **kwargs)
+            )
+
+    def shutdown(self, wait: bool = True):
+        self._executor.shutdown(wait=wait)
@@ -1,6 +1,12 @@
 import os
+import copy
+import json
+import atexit
+import queue
 import logging
 from logging.config import dictConfig
+from logging.handlers import QueueHandler, QueueListener, RotatingFileHandler
+from app.core.config import settings
 
 # Set your desired log directory path
 log_dir = os.path.join(os.path.dirname(os.path.abspath(__file__)), "../logger")
@@ -11,45 +17,120 @@ os.makedirs(log_dir, exist_ok=True)
 # Define the log file path inside the logger directory
 log_file_path = os.path.join(log_dir, "logger_app.log")
 
-LOGGING_CONFIG = {
-    "version": 1,
-    "disable_existing_loggers": False,
-    "formatters": {
-        "default": {
-            "format": "{levelname} {asctime} {name} {message}",
-            "style": "{",
-            "datefmt": "%Y-%m-%d %H:%M:%S",
-        },
-        "error_formatter": {
-            "format": "{levelname} {asctime} {name} {message}",
-            "style": "{",
-            "datefmt": "%Y-%m-%d %H:%M:%S",
-        },
-    },
-    "handlers": {
-        "file": {
-            "level": "DEBUG",
-            "class": "logging.FileHandler",
-            "filename": log_file_path,
-            "formatter": "default",
-        },
-        "error_file": {
-            "level": "ERROR",
-            "class": "logging.FileHandler",
-            "filename": os.path.join(log_dir, "error_app.log"),
-            "formatter": "error_formatter",
-        },
-    },
-    "root": {
-        "handlers": ["file", "error_file"],
-        "level": "DEBUG",
-    },
-}
+TEXT_FORMAT = "{levelname} {asctime} {name} {message}"
+DATE_FORMAT = "%Y-%m-%d %H:%M:%S"
+
+
+class JsonFormatter(logging.Formatter):
+    """One JSON object per line, for log shippers."""
+
+    def format(self, record):
+        payload = {
+            "timestamp": self.formatTime(record, DATE_FORMAT),
+            "level": record.levelname,
+            "logger": record.name,
+            "message": record.getMessage(),
+        }
+        if record.exc_info:
+            payload["exc_info"] = self.formatException(record.exc_info)
+        elif record.exc_text:
+            payload["exc_info"] = record.exc_text
+        return json.dumps(payload, default=str)
+
+
+def build_file_handlers(directory: str = log_dir, log_format: str = None):
+    if (log_format or settings.LOG_FORMAT).lower() == "json":
+        formatter = JsonFormatter()
+    else:
+        formatter = logging.Formatter(TEXT_FORMAT, datefmt=DATE_FORMAT, style="{")
+
+    handlers = []
+    for filename, level in (("logger_app.log", logging.DEBUG), ("error_app.log", logging.ERROR)):
+        handler = RotatingFileHandler(
+            os.path.join(directory, filename),
+            maxBytes=settings.LOG_MAX_BYTES,
+            backupCount=settings.LOG_BACKUP_COUNT,
+            encoding="utf-8",
+        )
+        handler.setLevel(level)
+        handler.setFormatter(formatter)
+        handlers.append(handler)
+    return handlers
+
+
+class DeferredQueueHandler(QueueHandler):
+    """QueueHandler that leaves the handlers' formatting to the listener thread.
+
+    The stock prepare() runs the full formatter on the calling thread. Here
+    only what may change before the listener gets to the record is fixed:
+    %-style args (third-party loggers pass them, and they may be mutated)
+    are merged into the message, and a traceback is rendered to exc_text so
+    the record holds no frames. Timestamps and layout are formatted by the
+    listener.
+    """
+
+    _exception_formatter = logging.Formatter()
+
+    def prepare(self, record):
+        record = copy.copy(record)
+        record.message = record.msg = record.getMessage()
+        record.args = None
+        if record.exc_info:
+            record.exc_text = self._exception_formatter.formatException(record.exc_info)
+            record.exc_info = None
+        return record
+
+
+_listener = None
+
+
+def configure_logging(directory: str = log_dir, log_format: str = None):
+    """Route all records through a queue to a background writer thread.
+
+    Logging calls on the event loop only build the record and enqueue it;
+    formatting and file I/O (with rotation) happen on the listener thread.
+    Levels come from LOG_LEVEL and LOG_LEVELS.
+    """
+    global _listener
+    stop_logging()
+
+    dictConfig(
+        {
+            "version": 1,
+            "disable_existing_loggers": False,
+            "root": {"level": settings.LOG_LEVEL.upper(), "handlers": []},
+            "loggers": {
+                name: {"level": level.upper()}
+                for name, level in settings.LOG_LEVELS.items()
+            },
+        }
+    )
+
+    log_queue = queue.SimpleQueue()
+    logging.getLogger().addHandler(DeferredQueueHandler(log_queue))
+    _listener = QueueListener(
+        log_queue,
+        *build_file_handlers(directory, log_format),
+        respect_handler_level=True,
+    )
+    _listener.start()
+
+
+def stop_logging():
+    """Flush queued records and detach the pipeline (safe to call twice)."""
+    global _listener
+    root = logging.getLogger()
+    for handler in list(root.handlers):
+        if isinstance(handler, QueueHandler):
+            root.removeHandler(handler)
+    if _listener is not None:
+        _listener.stop()
+        for handler in _listener.handlers:
+            handler.close()
+        _listener = None
+
 
 # Apply the logging configuration
-dictConfig(LOGGING_CONFIG)
+configure_logging()
+atexit.register(stop_logging)
 logger = logging.getLogger(__name__)
-
-# Example usage
-logger.debug("This is a debug message")
-logger.error("This is an error message")
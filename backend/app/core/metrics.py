@@ -0,0 +1,186 @@
+import asyncio
+import time
+from contextvars import ContextVar
+from typing import Optional
+from prometheus_client import (
+    CONTENT_TYPE_LATEST,
+    REGISTRY,
+    Counter,
+    Gauge,
+    Histogram,
+    generate_latest,
+)
+from prometheus_client.core import GaugeMetricFamily
+from sqlalchemy import event
+from app.core.logging import logging
+
+# Metrics are per worker process, like /health/db-pool
+
+REQUEST_SECONDS = Histogram(
+    "http_request_duration_seconds",
+    "Request latency by route template.",
+    ["method", "route", "status"],
+)
+REQUEST_SQL_STATEMENTS = Histogram(
+    "http_request_sql_statements",
+    "SQL statements executed while serving one request.",
+    ["route"],
+    buckets=(0, 1, 2, 3, 5, 8, 13, 21, 50, 100),
+)
+REQUEST_SQL_SECONDS = Histogram(
+    "http_request_sql_seconds",
+    "Time spent in SQL statements while serving one request.",
+    ["route"],
+)
+S3_REQUEST_SECONDS = Histogram(
+    "s3_request_duration_seconds",
+    "S3 API call latency, excluding time queued for the S3 executor.",
+    ["operation"],
+)
+S3_BYTES = Counter(
+    "s3_bytes_total", "Bytes sent to (out) and read from (in) S3.", ["direction"]
+)
+EVENT_LOOP_LAG = Gauge(
+    "event_loop_lag_seconds", "How late the last event loop lag probe woke up."
+)
+
+
+class RequestSQL:
+    __slots__ = ("count", "seconds")
+
+    def __init__(self):
+        self.count = 0
+        self.seconds = 0.0
+
+
+# Set by MetricsMiddleware for the duration of a request; SQLAlchemy
+# propagates it into the greenlets that run the statements
+_request_sql: ContextVar = ContextVar("request_sql", default=None)
+
+
+def _before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    if context is not None:
+        context._metrics_started = time.perf_counter()
+
+
+def _after_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    sql = _request_sql.get()
+    if sql is None or context is None:
+        return
+    sql.count += 1
+    started = getattr(context, "_metrics_started", None)
+    if started is not None:
+        sql.seconds += time.perf_counter() - started
+
+
+def instrument_engine(async_engine):
+    """Attribute the engine's statements to the request that runs them."""
+    sync_engine = async_engine.sync_engine
+    event.listen(sync_engine, "before_cursor_execute", _before_cursor_execute)
+    event.listen(sync_engine, "after_cursor_execute", _after_cursor_execute)
+
+
+def route_template(scope) -> Optional[str]:
+    """Full path template of the route a request matched, or None.
+
+    FastAPI leaves ``scope["route"]`` as declared on its router, without the
+    include_router prefix, so the effective route FastAPI resolved is
+    preferred; routes and static files under a Mount get the mount prefix
+    from ``root_path``.
+    """
+    root_path = scope.get("root_path", "")
+    mount_prefix = root_path[len(scope.get("app_root_path", root_path)):]
+    context = scope.get("fastapi", {}).get("effective_route_context")
+    route = context or scope.get("route")
+    path = getattr(route, "path_format", None)
+    if path is not None:
+        return mount_prefix + path
+    if mount_prefix:
+        return mount_prefix + "/{path}"
+    return None
+
+
+class MetricsMiddleware:
+    """Pure ASGI middleware timing each request and counting its SQL.
+
+    Routes are labelled by their template (``/api/v1/careers/{id}``), and
+    unmatched paths share one label, so label cardinality stays bounded.
+    """
+
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        status = 500
+
+        async def send_with_status(message):
+            nonlocal status
+            if message["type"] == "http.response.start":
+                status = message["status"]
+            await send(message)
+
+        sql = RequestSQL()
+        token = _request_sql.set(sql)
+        started = time.perf_counter()
+        try:
+            await self.app(scope, receive, send_with_status)
+        finally:
+            elapsed = time.perf_counter() - started
+            _request_sql.reset(token)
+            route = route_template(scope) or "unmatched"
+            REQUEST_SECONDS.labels(scope["method"], route, str(status)).observe(elapsed)
+            REQUEST_SQL_STATEMENTS.labels(route).observe(sql.count)
+            REQUEST_SQL_SECONDS.labels(route).observe(sql.seconds)
+
+
+def observe_s3_call(operation: str, func, *args, **kwargs):
+    """Run a blocking boto3 call (inside the S3 executor) and time it."""
+    started = time.perf_counter()
+    try:
+        return func(*args, **kwargs)
+    finally:
+        S3_REQUEST_SECONDS.labels(operation).observe(time.perf_counter() - started)
+
+
+class PoolCollector:
+    """Connection pool gauges, read from pool_stats() at scrape time."""
+
+    def __init__(self, stats):
+        self._stats = stats
+
+    def collect(self):
+        for name, value in self._stats().items():
+            yield GaugeMetricFamily(f"db_pool_{name}", f"Connection pool {name}.", value=value)
+
+
+async def monitor_event_loop_lag(interval: float):
+    loop = asyncio.get_running_loop()
+    while True:
+        expected = loop.time() + interval
+        await asyncio.sleep(interval)
+        EVENT_LOOP_LAG.set(max(0.0, loop.time() - expected))
+
+
+_lag_task = None
+
+
+def start_event_loop_monitor(interval: float):
+    global _lag_task
+    if _lag_task is None:
+        _lag_task = asyncio.create_task(monitor_event_loop_lag(interval))
+        logging.info(f"Event loop lag probe running every {interval}s.")
+
+
+def stop_event_loop_monitor():
+    global _lag_task
+    if _lag_task is not None:
+        _lag_task.cancel()
+        _lag_task = None
+
+
+def render_metrics():
+    return generate_latest(REGISTRY), CONTENT_TYPE_LATEST
@@ -0,0 +1,199 @@
+import hmac
+import json
+import random
+import time
+import uuid
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Optional
+from fastapi import APIRouter, Depends, Header, HTTPException
+from fastapi.concurrency import run_in_threadpool
+from fastapi.responses import FileResponse
+from app.core.config import settings
+from app.core.logging import logging
+from app.core.metrics import route_template
+
+PROFILES_PATH = "/debug/profiles"
+PROFILE_HEADER = "x-profile-token"
+PROFILE_SUFFIX = ".speedscope.json"
+META_SUFFIX = ".meta.json"
+
+
+def load_profiler():
+    """pyinstrument's Profiler and SpeedscopeRenderer.
+
+    Called when the app is built, so a missing optional package stops
+    startup instead of failing every request once the middleware is built.
+    """
+    try:
+        from pyinstrument import Profiler
+        from pyinstrument.renderers import SpeedscopeRenderer
+    except ImportError as err:
+        raise RuntimeError(
+            "PROFILING_ENABLED is set but pyinstrument is not installed "
+            "(pip install -r requirements-profiling.txt)"
+        ) from err
+    return Profiler, SpeedscopeRenderer
+
+
+def _mtime(path: Path) -> float:
+    # Another worker may prune a file between the glob and the stat
+    try:
+        return path.stat().st_mtime
+    except FileNotFoundError:
+        return 0.0
+
+
+def token_matches(token: Optional[str]) -> bool:
+    return bool(settings.PROFILING_TOKEN and token) and hmac.compare_digest(
+        token, settings.PROFILING_TOKEN
+    )
+
+
+class ProfileStore:
+    """Bounded on-disk ring of speedscope profiles plus their metadata."""
+
+    def __init__(self, directory: str, max_profiles: int):
+        self.directory = Path(directory)
+        self.max_profiles = max_profiles
+        self.directory.mkdir(parents=True, exist_ok=True)
+
+    def save(self, profile_id: str, speedscope: str, meta: dict):
+        (self.directory / f"{profile_id}{PROFILE_SUFFIX}").write_text(speedscope)
+        (self.directory / f"{profile_id}{META_SUFFIX}").write_text(json.dumps(meta))
+        self._prune()
+
+    def _prune(self):
+        metas = sorted(self.directory.glob(f"*{META_SUFFIX}"), key=_mtime)
+        for meta_path in metas[: max(0, len(metas) - self.max_profiles)]:
+            profile_id = meta_path.name[: -len(META_SUFFIX)]
+            meta_path.unlink(missing_ok=True)
+            (self.directory / f"{profile_id}{PROFILE_SUFFIX}").unlink(missing_ok=True)
+
+    def list(self) -> list:
+        metas = sorted(self.directory.glob(f"*{META_SUFFIX}"), key=_mtime, reverse=True)
+        profiles = []
+        for meta_path in metas:
+            try:
+                profiles.append(json.loads(meta_path.read_text()))
+            except (OSError, ValueError):
+                continue
+        return profiles
+
+    def path(self, profile_id: str) -> Optional[Path]:
+        if not profile_id.isalnum():
+            return None
+        path = self.directory / f"{profile_id}{PROFILE_SUFFIX}"
+        return path if path.is_file() else None
+
+
+class ProfilingMiddleware:
+    """Pure ASGI middleware sampling selected requests with pyinstrument.
+
+    A request is profiled when it carries a valid ``X-Profile-Token`` header
+    or is drawn at PROFILING_SAMPLE_RATE, and no other profile is running
+    in this worker. pyinstrument's async mode attributes awaited time to
+    the request's own task, so the profile shows wall time of this request
+    only; CPU time of the event loop thread is recorded alongside it. Only
+    registered when PROFILING_ENABLED is set, with the classes returned by
+    load_profiler().
+    """
+
+    def __init__(self, app, store: ProfileStore, profiler_class, renderer_class):
+        self.app = app
+        self.store = store
+        self._profiler_class = profiler_class
+        self._renderer_class = renderer_class
+        self._active = False
+
+    def _selected(self, scope) -> bool:
+        # Fetching profiles carries the token too; those are not profiled
+        if self._active or scope["path"].startswith(PROFILES_PATH):
+            return False
+        for name, value in scope.get("headers", []):
+            if name == PROFILE_HEADER.encode():
+                return token_matches(value.decode("latin-1"))
+        return random.random() < settings.PROFILING_SAMPLE_RATE
+
+    def _save(self, profiler, profile_id: str, meta: dict):
+        speedscope = profiler.output(renderer=self._renderer_class())
+        self.store.save(profile_id, speedscope, meta)
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http" or not self._selected(scope):
+            await self.app(scope, receive, send)
+            return
+
+        self._active = True
+        profile_id = uuid.uuid4().hex
+        status = 500
+
+        async def send_with_profile_id(message):
+            nonlocal status
+            if message["type"] == "http.response.start":
+                status = message["status"]
+                message["headers"] = list(message.get("headers", [])) + [
+                    (b"x-profile-id", profile_id.encode())
+                ]
+            await send(message)
+
+        profiler = self._profiler_class(
+            interval=settings.PROFILING_INTERVAL_SECONDS, async_mode="enabled"
+        )
+        started_at = datetime.now(timezone.utc)
+        wall_started, cpu_started = time.perf_counter(), time.thread_time()
+        profiler.start()
+        try:
+            await self.app(scope, receive, send_with_profile_id)
+        finally:
+            profiler.stop()
+            meta = {
+                "id": profile_id,
+                "method": scope["method"],
+                "path": scope["path"],
+                "route": route_template(scope),
+                "status": status,
+                "started_at": started_at.isoformat(),
+                "wall_seconds": round(time.perf_counter() - wall_started, 6),
+                "loop_cpu_seconds": round(time.thread_time() - cpu_started, 6),
+                "interval_seconds": settings.PROFILING_INTERVAL_SECONDS,
+            }
+            self._active = False
+            try:
+                await run_in_threadpool(self._save, profiler, profile_id, meta)
+                logging.info(
+                    f"Profiled {meta['method']} {meta['path']} as {profile_id} "
+                    f"({meta['wall_seconds']}s wall, {meta['loop_cpu_seconds']}s CPU)."
+                )
+            except Exception as e:
+                logging.error(f"Failed to save profile {profile_id}: {e}")
+
+
+def build_profile_store() -> ProfileStore:
+    return ProfileStore(settings.PROFILING_DIR, settings.PROFILING_MAX_PROFILES)
+
+
+def build_profiles_router(store: ProfileStore) -> APIRouter:
+    """Read access to the ring, for holders of PROFILING_TOKEN only."""
+
+    async def require_token(x_profile_token: Optional[str] = Header(None)):
+        if not token_matches(x_profile_token):
+            raise HTTPException(status_code=403, detail="Not allowed")
+
+    router = APIRouter(dependencies=[Depends(require_token)])
+
+    @router.get("/", summary="List captured profiles, newest first")
+    async def list_profiles():
+        return await run_in_threadpool(store.list)
+
+    @router.get("/{profile_id}", summary="Download a profile (speedscope format)")
+    async def get_profile(profile_id: str):
+        path = await run_in_threadpool(store.path, profile_id)
+        if path is None:
+            raise HTTPException(status_code=404, detail="Profile not found")
+        # Open at https://www.speedscope.app or with the speedscope CLI
+        return FileResponse(
+            path, media_type="application/json", filename=f"{profile_id}{PROFILE_SUFFIX}"
+        )
+
+    return router
@@ -0,0 +1,182 @@
+import asyncio
+import itertools
+import time
+from typing import List, Optional
+from fastapi import Request
+from sqlalchemy import text
+from sqlalchemy.exc import SQLAlchemyError
+from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
+from sqlalchemy.orm import sessionmaker
+from app.core.config import settings
+from app.core.database import async_session, engine_options
+from app.core.logging import logging
+
+# Set on responses to a client's writes; while it is in the future that
+# client's reads go to the primary, so it always sees its own changes
+PRIMARY_COOKIE = "db_primary_until"
+SAFE_METHODS = {"GET", "HEAD", "OPTIONS"}
+
+# Seconds of replay lag on a replica. A replica that has replayed all WAL
+# it received is caught up however long ago the primary last committed;
+# NULL (no WAL replayed yet) counts as 0
+LAG_QUERY = text(
+    "SELECT CASE WHEN pg_last_wal_receive_lsn() = pg_last_wal_replay_lsn() THEN 0 "
+    "ELSE COALESCE(EXTRACT(EPOCH FROM now() - pg_last_xact_replay_timestamp()), 0) END"
+)
+
+
+class Replica:
+    def __init__(self, name: str, url: str):
+        self.name = name
+        self.engine = create_async_engine(url, **engine_options(url))
+        self.session = sessionmaker(
+            bind=self.engine, class_=AsyncSession, expire_on_commit=False
+        )
+        self.healthy = True
+        self.lag_seconds = None
+        self.last_error = None
+
+
+class ReplicaRouter:
+    """Round-robin over healthy read replicas, falling back to the primary.
+
+    A background probe checks every replica each REPLICA_HEALTH_CHECK_SECONDS
+    and takes it out of rotation when it is unreachable or lags more than
+    REPLICA_MAX_LAG_SECONDS; a failed connect during a request does the same
+    immediately. Probes bring replicas back once they recover.
+    """
+
+    def __init__(self, urls: List[str]):
+        self.replicas = [
+            Replica(f"replica{number}", url) for number, url in enumerate(urls, start=1)
+        ]
+        self._counter = itertools.count()
+        self._monitor = None
+
+    def pick(self) -> Optional[Replica]:
+        healthy = [replica for replica in self.replicas if replica.healthy]
+        if not healthy:
+            return None
+        return healthy[next(self._counter) % len(healthy)]
+
+    def mark_unhealthy(self, replica: Replica, reason: str):
+        if replica.healthy:
+            logging.warning(f"Read replica {replica.name} taken out of rotation: {reason}")
+        replica.healthy = False
+        replica.last_error = reason
+
+    async def probe(self, replica: Replica):
+        try:
+            async with replica.engine.connect() as conn:
+                lag = await asyncio.wait_for(
+                    conn.scalar(LAG_QUERY), settings.REPLICA_HEALTH_CHECK_SECONDS
+                )
+        except (SQLAlchemyError, OSError, asyncio.TimeoutError) as err:
+            self.mark_unhealthy(replica, f"probe failed: {err}")
+            return
+        replica.lag_seconds = float(lag)
+        if replica.lag_seconds > settings.REPLICA_MAX_LAG_SECONDS:
+            self.mark_unhealthy(replica, f"lagging {replica.lag_seconds:.1f}s")
+        elif not replica.healthy:
+            replica.healthy = True
+            replica.last_error = None
+            logging.info(f"Read replica {replica.name} back in rotation.")
+
+    async def _monitor_loop(self):
+        while True:
+            await asyncio.gather(*(self.probe(replica) for replica in self.replicas))
+            await asyncio.sleep(settings.REPLICA_HEALTH_CHECK_SECONDS)
+
+    def start(self):
+        if self.replicas and self._monitor is None:
+            self._monitor = asyncio.create_task(self._monitor_loop())
+
+    async def stop(self):
+        if self._monitor is not None:
+            self._monitor.cancel()
+            self._monitor = None
+        for replica in self.replicas:
+            await replica.engine.dispose()
+
+    def stats(self) -> list:
+        return [
+            {
+                "name": replica.name,
+                "healthy": replica.healthy,
+                "lag_seconds": replica.lag_seconds,
+                "last_error": replica.last_error,
+            }
+            for replica in self.replicas
+        ]
+
+
+replica_router = ReplicaRouter(settings.DATABASE_REPLICA_URLS)
+
+
+def wrote_recently(request: Request) -> bool:
+    value = request.cookies.get(PRIMARY_COOKIE, "")
+    return value.isdigit() and int(value) > time.time()
+
+
+async def open_read_session(request: Request) -> AsyncSession:
+    """A session on a healthy replica, or on the primary when there is none,
+    the client wrote recently, or every replica fails to connect."""
+    if replica_router.replicas and not wrote_recently(request):
+        for _ in replica_router.replicas:
+            replica = replica_router.pick()
+            if replica is None:
+                break
+            session = replica.session()
+            try:
+                # Connect up front so a dead replica falls back here rather
+                # than failing the request midway
+                await session.connection()
+            except (SQLAlchemyError, OSError) as err:
+                await session.close()
+                replica_router.mark_unhealthy(replica, f"connect failed: {err}")
+                continue
+            session.info["replica"] = replica.name
+            return session
+    return async_session()
+
+
+async def get_read_db(request: Request) -> AsyncSession:
+    """Dependency for read-only routes; see open_read_session."""
+    session = await open_read_session(request)
+    try:
+        async with session:
+            yield session
+    except SQLAlchemyError as e:
+        logging.error(f"Database error: {str(e)}", exc_info=True)
+        raise
+    except Exception as e:
+        logging.error(f"Unexpected error: {str(e)}", exc_info=True)
+        raise
+    finally:
+        await session.close()
+
+
+class ReadYourWritesMiddleware:
+    """Pure ASGI middleware pinning a client to the primary after it writes."""
+
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http" or scope["method"] in SAFE_METHODS:
+            await self.app(scope, receive, send)
+            return
+
+        async def send_with_cookie(message):
+            if message["type"] == "http.response.start" and message["status"] < 400:
+                window = settings.REPLICA_READ_YOUR_WRITES_SECONDS
+                cookie = (
+                    f"{PRIMARY_COOKIE}={int(time.time()) + window}; "
+                    f"Max-Age={window}; Path=/; HttpOnly; SameSite=Lax"
+                )
+                message["headers"] = list(message.get("headers", [])) + [
+                    (b"set-cookie", cookie.encode("latin-1"))
+                ]
+            await send(message)
+
+        await self.app(scope, receive, send_with_cookie)
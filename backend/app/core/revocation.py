@@ -0,0 +1,230 @@
+import asyncio
+import hashlib
+import math
+import time
+from abc import ABC, abstractmethod
+from datetime import datetime, timedelta, timezone
+from typing import Optional
+from sqlalchemy import delete, select
+from sqlalchemy.dialects.postgresql import insert
+from app.core.config import settings
+from app.core.database import async_session
+from app.core.logging import logging
+from app.models.revokedTokenModel import RevokedToken
+
+
+class BloomFilter:
+    """Fixed-size Bloom filter over strings (no false negatives)."""
+
+    def __init__(self, capacity: int, error_rate: float):
+        capacity = max(capacity, 1)
+        self.size = max(8, int(-capacity * math.log(error_rate) / math.log(2) ** 2))
+        self.hash_count = max(1, round(self.size / capacity * math.log(2)))
+        self.capacity = capacity
+        self.count = 0
+        self._bits = bytearray((self.size + 7) // 8)
+
+    def _positions(self, item: str):
+        digest = hashlib.blake2b(item.encode(), digest_size=16).digest()
+        first = int.from_bytes(digest[:8], "little")
+        second = int.from_bytes(digest[8:], "little") | 1
+        return ((first + i * second) % self.size for i in range(self.hash_count))
+
+    def add(self, item: str):
+        for position in self._positions(item):
+            self._bits[position >> 3] |= 1 << (position & 7)
+        self.count += 1
+
+    def __contains__(self, item: str) -> bool:
+        return all(
+            self._bits[position >> 3] & (1 << (position & 7))
+            for position in self._positions(item)
+        )
+
+
+class RevocationStore(ABC):
+    """Revoked token ids (jti) that stay revoked until the token's exp.
+
+    A Bloom filter of revoked ids sits in front of the backend: a lookup for
+    a token that was never revoked (nearly all of them) is answered from
+    memory, and only filter hits are confirmed against the backend.
+    """
+
+    def __init__(self):
+        self._filter = self._new_filter(0)
+        self._loaded = False
+        self._next_rebuild = 0.0
+        self._lock = asyncio.Lock()
+
+    @staticmethod
+    def _new_filter(entries: int) -> BloomFilter:
+        return BloomFilter(
+            max(settings.REVOCATION_BLOOM_CAPACITY, entries * 2),
+            settings.REVOCATION_BLOOM_ERROR_RATE,
+        )
+
+    async def revoke(self, jti: str, expires_at: datetime):
+        await self._ensure_loaded()
+        await self._store(jti, expires_at)
+        # A rebuild or sync running meanwhile would swap in a filter
+        # without this jti
+        async with self._lock:
+            self._filter.add(jti)
+            if self._filter.count > self._filter.capacity:
+                await self._rebuild()
+
+    async def is_revoked(self, jti: Optional[str]) -> bool:
+        if not jti:
+            return False
+        await self._ensure_loaded()
+        await self._refresh()
+        if jti not in self._filter:
+            return False
+        return await self._lookup(jti)
+
+    async def _ensure_loaded(self):
+        if self._loaded:
+            return
+        async with self._lock:
+            if not self._loaded:
+                await self._rebuild()
+                self._loaded = True
+
+    async def _rebuild(self):
+        """Drop expired entries and rebuild the filter from what is left."""
+        await self._purge_expired()
+        live = await self._live_ids()
+        rebuilt = self._new_filter(len(live))
+        for jti in live:
+            rebuilt.add(jti)
+        self._filter = rebuilt
+        self._next_rebuild = time.monotonic() + settings.REVOCATION_REBUILD_SECONDS
+        logging.info(f"Revocation filter rebuilt with {len(live)} entries.")
+
+    async def _refresh(self):
+        """Periodically purge expired entries; shared backends also pull
+        revocations made by other processes here."""
+        if time.monotonic() < self._next_rebuild:
+            return
+        async with self._lock:
+            if time.monotonic() >= self._next_rebuild:
+                await self._rebuild()
+
+    @abstractmethod
+    async def _store(self, jti: str, expires_at: datetime): ...
+
+    @abstractmethod
+    async def _lookup(self, jti: str) -> bool: ...
+
+    @abstractmethod
+    async def _live_ids(self) -> list: ...
+
+    @abstractmethod
+    async def _purge_expired(self): ...
+
+
+class InMemoryRevocationStore(RevocationStore):
+    """Per-process store; revocations are lost on restart."""
+
+    def __init__(self):
+        super().__init__()
+        self._entries = {}
+
+    async def _store(self, jti: str, expires_at: datetime):
+        self._entries[jti] = expires_at
+
+    async def _lookup(self, jti: str) -> bool:
+        expires_at = self._entries.get(jti)
+        return expires_at is not None and expires_at > datetime.now(timezone.utc)
+
+    async def _live_ids(self) -> list:
+        return list(self._entries)
+
+    async def _purge_expired(self):
+        now = datetime.now(timezone.utc)
+        self._entries = {
+            jti: expires_at for jti, expires_at in self._entries.items() if expires_at > now
+        }
+
+
+class PostgresRevocationStore(RevocationStore):
+    """Store in the revoked_tokens table, shared by every worker and node.
+
+    Each process keeps its own filter and pulls ids revoked by other
+    processes every REVOCATION_SYNC_SECONDS, so a revocation made on
+    another worker takes effect there within that window.
+    """
+
+    # Overlap between sync windows so rows committed late are not missed
+    SYNC_OVERLAP = timedelta(seconds=5)
+
+    def __init__(self):
+        super().__init__()
+        self._synced_until = None
+        self._next_sync = 0.0
+
+    async def _store(self, jti: str, expires_at: datetime):
+        async with async_session() as db:
+            await db.execute(
+                insert(RevokedToken)
+                .values(jti=jti, expires_at=expires_at)
+                .on_conflict_do_nothing()
+            )
+            await db.commit()
+
+    async def _lookup(self, jti: str) -> bool:
+        async with async_session() as db:
+            result = await db.execute(
+                select(RevokedToken.jti).where(
+                    RevokedToken.jti == jti,
+                    RevokedToken.expires_at > datetime.now(timezone.utc),
+                )
+            )
+            return result.scalar_one_or_none() is not None
+
+    async def _live_ids(self) -> list:
+        async with async_session() as db:
+            result = await db.execute(
+                select(RevokedToken.jti, RevokedToken.revoked_on).where(
+                    RevokedToken.expires_at > datetime.now(timezone.utc)
+                )
+            )
+            rows = result.all()
+        self._synced_until = max((row.revoked_on for row in rows), default=None)
+        self._next_sync = time.monotonic() + settings.REVOCATION_SYNC_SECONDS
+        return [row.jti for row in rows]
+
+    async def _purge_expired(self):
+        async with async_session() as db:
+            await db.execute(
+                delete(RevokedToken).where(RevokedToken.expires_at <= datetime.now(timezone.utc))
+            )
+            await db.commit()
+
+    async def _refresh(self):
+        await super()._refresh()
+        if time.monotonic() < self._next_sync:
+            return
+        async with self._lock:
+            if time.monotonic() < self._next_sync:
+                return
+            query = select(RevokedToken.jti, RevokedToken.revoked_on)
+            if self._synced_until is not None:
+                query = query.where(
+                    RevokedToken.revoked_on >= self._synced_until - self.SYNC_OVERLAP
+                )
+            async with async_session() as db:
+                rows = (await db.execute(query)).all()
+            for row in rows:
+                if row.jti not in self._filter:
+                    self._filter.add(row.jti)
+                if self._synced_until is None or row.revoked_on > self._synced_until:
+                    self._synced_until = row.revoked_on
+            self._next_sync = time.monotonic() + settings.REVOCATION_SYNC_SECONDS
+
+
+def build_revocation_store() -> RevocationStore:
+    """Store configured from REVOCATION_BACKEND: ``postgres`` or ``memory``."""
+    if settings.REVOCATION_BACKEND.lower() == "postgres":
+        return PostgresRevocationStore()
+    return InMemoryRevocationStore()
@@ -1,5 +1,6 @@
 from passlib.context import CryptContext
-from datetime import datetime, timedelta
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timedelta, timezone
 from jose import JWTError, jwt
 from app.core.config import settings
 from app.core.logging import logging
@@ -7,23 +8,42 @@ from fastapi import Depends, HTTPException
 from fastapi.security import OAuth2PasswordBearer
 from sqlalchemy.ext.asyncio import AsyncSession
 from app.core.database import get_db
-from app.models.user import User
+from app.core.cache import LRUCache
+from app.core.executors import BoundedExecutor
+from app.core.revocation import build_revocation_store
+from app.models.userModel import User
 from sqlalchemy.future import select
-from jwt import InvalidTokenError, ExpiredSignatureError, PyJWTError
 import re
+import time
+import uuid
 
-oauth2_scheme = OAuth2PasswordBearer(tokenUrl="token")
-blacklist = set()
+oauth2_scheme = OAuth2PasswordBearer(tokenUrl="/api/v1/auth/token")
+# Revoked tokens by jti, kept until each token's own exp
+revocation_store = build_revocation_store()
 
 # Password hashing context
 pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
 
+# bcrypt costs 100-300 ms of CPU per call and releases the GIL while it
+# works, so a small thread pool keeps it off the event loop
+password_executor = BoundedExecutor(
+    ThreadPoolExecutor(
+        max_workers=settings.PASSWORD_HASH_CONCURRENCY, thread_name_prefix="bcrypt"
+    ),
+    max_concurrency=settings.PASSWORD_HASH_CONCURRENCY,
+)
+
 # Secret key to encode and decode JWT tokens
 SECRET_KEY = settings.SECRET_KEY
 ALGORITHM = "HS256"
 ACCESS_TOKEN_EXPIRE_MINUTES = 1440  # 1 day
 REFRESH_TOKEN_EXPIRE_DAYS = 7
 
+# Payloads of tokens whose signature was already verified, keyed by token
+token_cache = LRUCache(settings.AUTH_CACHE_MAX_ENTRIES)
+# Active users keyed by the token's sub; entries are detached instances
+principal_cache = LRUCache(settings.AUTH_CACHE_MAX_ENTRIES)
+
 
 def hash_password(password: str) -> str:
     try:
@@ -48,18 +68,28 @@ def verify_password(plain_password: str, hashed_password: str) -> bool:
         raise Exception("Failed to verify password")
 
 
+async def hash_password_async(password: str) -> str:
+    """hash_password for async code paths; never blocks the event loop."""
+    return await password_executor.run(hash_password, password)
+
+
+async def verify_password_async(plain_password: str, hashed_password: str) -> bool:
+    """verify_password for async code paths; never blocks the event loop."""
+    return await password_executor.run(verify_password, plain_password, hashed_password)
+
+
 def create_access_token(data: dict, expires_delta: timedelta = None) -> str:
     try:
         to_encode = data.copy()
-        expire = datetime.utcnow() + \
+        expire = datetime.now(timezone.utc) + \
             (expires_delta if expires_delta else timedelta(
                 minutes=ACCESS_TOKEN_EXPIRE_MINUTES))
-        to_encode.update({"exp": expire})
+        to_encode.update({"exp": expire, "jti": uuid.uuid4().hex})
 
         # Encoding JWT
         encoded_jwt = jwt.encode(to_encode, SECRET_KEY, algorithm=ALGORITHM)
-        logging.info(f"Access token created successfully for user: {
-                     data.get('sub')}")
+        logging.info(
+            f"Access token created successfully for user: {data.get('sub')}")
         return encoded_jwt
     except JWTError as jwt_ex:
         logging.error(f"JWT Error during access token creation: {str(jwt_ex)}")
@@ -75,12 +105,12 @@ def create_access_token(data: dict, expires_delta: timedelta = None) -> str:
 def create_refresh_token(data: dict) -> str:
     try:
         to_encode = data.copy()
-        expire = datetime.utcnow() + timedelta(days=REFRESH_TOKEN_EXPIRE_DAYS)
-        to_encode.update({"exp": expire})
+        expire = datetime.now(timezone.utc) + timedelta(days=REFRESH_TOKEN_EXPIRE_DAYS)
+        to_encode.update({"exp": expire, "jti": uuid.uuid4().hex})
         # Encoding JWT
         encoded_jwt = jwt.encode(to_encode, SECRET_KEY, algorithm=ALGORITHM)
-        logging.info(f"Refresh token created successfully for user: {
-                     data.get('sub')}")
+        logging.info(
+            f"Refresh token created successfully for user: {data.get('sub')}")
         return encoded_jwt
     except JWTError as jwt_ex:
         logging.error(
@@ -92,6 +122,47 @@ def create_refresh_token(data: dict) -> str:
         raise Exception("Failed to create refresh token")
 
 
+async def decode_token_cached(token: str) -> dict:
+    """jwt.decode with a cache of already-verified tokens.
+
+    Entries never outlive the token's own exp, so an expired token always
+    goes back through jwt.decode and fails there.
+    """
+    payload = await token_cache.get(token)
+    if payload is not None:
+        return payload
+
+    payload = jwt.decode(token, SECRET_KEY, algorithms=[ALGORITHM])
+    ttl = settings.TOKEN_CACHE_TTL_SECONDS
+    if payload.get("exp") is not None:
+        ttl = min(ttl, int(payload["exp"] - time.time()))
+    if ttl > 0:
+        await token_cache.set(token, payload, ttl)
+    return payload
+
+
+async def revoke_token(token: str):
+    """Revoke a token (e.g. on logout) until it would have expired anyway."""
+    try:
+        payload = await decode_token_cached(token)
+    except jwt.ExpiredSignatureError:
+        return
+    except jwt.JWTError:
+        raise HTTPException(status_code=401, detail="Invalid token")
+
+    jti = payload.get("jti")
+    if not jti:
+        logging.warning("Token without jti cannot be revoked.")
+        raise HTTPException(status_code=400, detail="Token cannot be revoked")
+    await revocation_store.revoke(jti, datetime.fromtimestamp(payload["exp"], timezone.utc))
+    logging.info(f"Token {jti} revoked for user: {payload.get('sub')}")
+
+
+async def invalidate_principal(user_id: str):
+    """Drop a cached principal, e.g. right after the user is deactivated."""
+    await principal_cache.delete(str(user_id))
+
+
 async def get_current_user(token: str = Depends(oauth2_scheme), db: AsyncSession = Depends(get_db)) -> User:
     # Exception to be raised if credentials are invalid
     credentials_exception = HTTPException(
@@ -102,15 +173,24 @@ async def get_current_user(token: str = Depends(oauth2_scheme), db: AsyncSession
 
     try:
         # Decode the token to retrieve the user ID
-        payload = jwt.decode(token, SECRET_KEY, algorithms=[ALGORITHM])
+        payload = await decode_token_cached(token)
         user_id = payload.get("sub")
 
+        if await revocation_store.is_revoked(payload.get("jti")):
+            logging.warning("Revoked token presented.")
+            raise HTTPException(status_code=401, detail="Token has been revoked")
+
         # Validate that user_id exists in the token payload
         if user_id is None:
             logging.warning("User ID is missing in token payload.")
             raise HTTPException(
                 status_code=401, detail="User ID is missing in token payload")
 
+        # Recently seen active users skip the database round trip
+        user = await principal_cache.get(str(user_id))
+        if user is not None:
+            return user
+
         # Fetch user from the database
         # Ensure you're querying by user_id
         result = await db.execute(select(User).filter(User.user_id == user_id))
@@ -128,9 +208,15 @@ async def get_current_user(token: str = Depends(oauth2_scheme), db: AsyncSession
             raise HTTPException(
                 status_code=403, detail="User is inactive. Please contact support.")
 
+        await principal_cache.set(
+            str(user_id), user, settings.PRINCIPAL_CACHE_TTL_SECONDS
+        )
         logging.info(f"User {user_id} successfully authenticated.")
         return user
 
+    except HTTPException:
+        raise
+
     except jwt.ExpiredSignatureError:
         logging.warning("Token has expired.")
         raise HTTPException(
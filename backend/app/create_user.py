@@ -0,0 +1,35 @@
+import argparse
+import asyncio
+import getpass
+from fastapi import HTTPException
+from app.core.database import async_session, engine
+from app.core.logging import stop_logging
+from app.services.authServices import create_user
+
+
+async def create(email: str, password: str):
+    try:
+        async with async_session() as db:
+            user = await create_user(db, email, password)
+        print(f"Created user {user.user_id} ({user.email})")
+    finally:
+        await engine.dispose()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Create a user that can log in to the API.")
+    parser.add_argument("email")
+    args = parser.parse_args()
+    password = getpass.getpass("Password: ")
+    if password != getpass.getpass("Repeat password: "):
+        parser.error("passwords do not match")
+    try:
+        asyncio.run(create(args.email, password))
+    except HTTPException as exc:
+        parser.exit(1, f"{exc.detail}\n")
+    finally:
+        stop_logging()
+
+
+if __name__ == "__main__":
+    main()
@@ -1,9 +1,25 @@
-from fastapi import FastAPI
-from app.core.logging import logging
+from fastapi import FastAPI, Response
+from app.core.logging import logging, stop_logging
 from fastapi.middleware.cors import CORSMiddleware
 from app.core.config import settings
+from app.core.database import engine, pool_stats
+from app.core.metrics import (
+    REGISTRY,
+    MetricsMiddleware,
+    PoolCollector,
+    instrument_engine,
+    render_metrics,
+    start_event_loop_monitor,
+    stop_event_loop_monitor,
+)
+from app.core.replicas import ReadYourWritesMiddleware, replica_router
 import uvicorn
+from app.routes.authRoutes import router as auth_router
 from app.routes.careersRoutes import router as careers_router
+from app.services.careersServices import profile_cache
+from app.services.resume_text import shutdown_extraction_executor
+from app.services.s3_upload import shutdown_s3_executor
+from app.services.storage import storage
 
 # Initialize FastAPI app
 app = FastAPI(
@@ -14,6 +30,9 @@ app = FastAPI(
 
 # Include router for careers API
 app.include_router(careers_router, prefix="/api/v1/careers", tags=["Careers"])
+app.include_router(auth_router, prefix="/api/v1/auth", tags=["Auth"])
+# Local storage serves its resume URLs itself
+storage.mount(app)
 
 
 # Root endpoint
@@ -28,12 +47,20 @@ async def root():
 @app.on_event("startup")
 async def startup_event():
     logging.info("Application startup application...")
+    if settings.METRICS_ENABLED:
+        start_event_loop_monitor(settings.EVENT_LOOP_LAG_INTERVAL_SECONDS)
+    replica_router.start()
 
 
 # Shutdown event
 @app.on_event("shutdown")
 async def shutdown_event():
     logging.info("Shutting down application...")
+    stop_event_loop_monitor()
+    await replica_router.stop()
+    shutdown_extraction_executor()
+    shutdown_s3_executor()
+    stop_logging()
 
 
 # CORS middleware setup
@@ -46,12 +73,79 @@ app.add_middleware(
 )
 
 
+# Read replicas: pin clients to the primary for a while after they write
+if replica_router.replicas:
+    app.add_middleware(ReadYourWritesMiddleware)
+    logging.info(f"Routing reads to {len(replica_router.replicas)} read replica(s).")
+
+
+# Request latency and per-request SQL metrics; nothing is installed when
+# metrics are disabled
+if settings.METRICS_ENABLED:
+    instrument_engine(engine)
+    for replica in replica_router.replicas:
+        instrument_engine(replica.engine)
+    REGISTRY.register(PoolCollector(pool_stats))
+    app.add_middleware(MetricsMiddleware)
+
+    @app.get("/metrics", include_in_schema=False)
+    async def metrics():
+        content, media_type = render_metrics()
+        return Response(content=content, media_type=media_type)
+
+
+# Profiling is imported and installed only when enabled, so a disabled
+# profiler adds no code to the request path
+if settings.PROFILING_ENABLED:
+    from app.core.profiling import (
+        PROFILES_PATH,
+        ProfilingMiddleware,
+        build_profile_store,
+        build_profiles_router,
+        load_profiler,
+    )
+
+    profiler_class, renderer_class = load_profiler()
+    profile_store = build_profile_store()
+    app.add_middleware(
+        ProfilingMiddleware,
+        store=profile_store,
+        profiler_class=profiler_class,
+        renderer_class=renderer_class,
+    )
+    app.include_router(
+        build_profiles_router(profile_store),
+        prefix=PROFILES_PATH,
+        tags=["Profiling"],
+    )
+    logging.info("Request profiling enabled.")
+
+
 # Health check endpoint
 @app.get("/health")
 async def health_check():
     return {"status": "ok"}
 
 
+# Connection pool usage and checkout wait times (per worker process)
+@app.get("/health/db-pool")
+async def db_pool_stats():
+    return pool_stats()
+
+
+# Health, replication lag and rotation state of read replicas (per worker
+# process; lag is refreshed by the background probe)
+@app.get("/health/replicas")
+async def replica_stats():
+    return replica_router.stats()
+
+
+# Hit/miss counters of the profile cache (per worker process)
+@app.get("/health/cache")
+async def cache_stats():
+    return profile_cache.stats()
+
+
 # Logging setup and uvicorn run (only one block needed)
 if __name__ == "__main__":
     logging.basicConfig(
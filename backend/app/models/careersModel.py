@@ -1,12 +1,53 @@
-from sqlalchemy import Column, Integer, String, Boolean, DateTime, func
+from sqlalchemy import (
+    Column,
+    Integer,
+    String,
+    Boolean,
+    DateTime,
+    Index,
+    Sequence,
+    func,
+    text,
+)
 from app.core.database import Base
 
+# Source of the numeric part of CareersUsers.user_id ("user_<n>")
+user_id_seq = Sequence("careersusers_user_id_seq", metadata=Base.metadata)
+
 
 class CareersUsers(Base):
     __tablename__ = "careersusers"
+    __table_args__ = (
+        # Keyset pagination over active users walks this index backwards
+        Index("ix_careersusers_active_id", "id", postgresql_where=text("is_active")),
+        # Trigram indexes behind GET /careers/search (prefix and fuzzy match)
+        Index(
+            "ix_careersusers_name_trgm",
+            "name",
+            postgresql_using="gin",
+            postgresql_ops={"name": "gin_trgm_ops"},
+        ),
+        Index(
+            "ix_careersusers_email_trgm",
+            "email",
+            postgresql_using="gin",
+            postgresql_ops={"email": "gin_trgm_ops"},
+        ),
+        Index(
+            "ix_careersusers_mobile_trgm",
+            "mobile",
+            postgresql_using="gin",
+            postgresql_ops={"mobile": "gin_trgm_ops"},
+        ),
+    )
 
     id = Column(Integer, primary_key=True, autoincrement=True)
-    user_id = Column(String(50), nullable=False, unique=True)
+    user_id = Column(
+        String(50),
+        nullable=False,
+        unique=True,
+        server_default=text("'user_' || nextval('careersusers_user_id_seq')"),
+    )
     name = Column(String(150))
     email = Column(String(150), unique=True, index=True)
     mobile = Column(String(150), unique=True, index=True)
@@ -0,0 +1,39 @@
+from sqlalchemy import BigInteger, Column, DateTime, Integer, String, Text, func
+from sqlalchemy.dialects.postgresql import JSONB
+from app.core.database import Base
+
+
+class Job(Base):
+    """Pending background work, claimed by workers with FOR UPDATE SKIP LOCKED."""
+
+    __tablename__ = "jobs"
+
+    id = Column(BigInteger, primary_key=True, autoincrement=True)
+    kind = Column(String(100), nullable=False)
+    payload = Column(JSONB, nullable=False, default=dict)
+    attempts = Column(Integer, nullable=False, default=0)
+    max_attempts = Column(Integer, nullable=False)
+    run_after = Column(DateTime, nullable=False, default=func.now(), index=True)
+    locked_at = Column(DateTime)
+    last_error = Column(Text)
+    created_on = Column(DateTime, default=func.now(), nullable=False)
+
+    def __repr__(self):
+        return f"<Job {self.id} {self.kind} attempt {self.attempts}/{self.max_attempts}>"
+
+
+class DeadJob(Base):
+    """Jobs that exhausted their retries, kept for inspection and replay."""
+
+    __tablename__ = "dead_jobs"
+
+    id = Column(BigInteger, primary_key=True)
+    kind = Column(String(100), nullable=False)
+    payload = Column(JSONB, nullable=False)
+    attempts = Column(Integer, nullable=False)
+    last_error = Column(Text)
+    created_on = Column(DateTime, nullable=False)
+    failed_on = Column(DateTime, default=func.now(), nullable=False)
+
+    def __repr__(self):
+        return f"<DeadJob {self.id} {self.kind}>"
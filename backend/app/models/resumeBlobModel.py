@@ -0,0 +1,44 @@
+from sqlalchemy import (
+    BigInteger,
+    Column,
+    DateTime,
+    ForeignKey,
+    Integer,
+    String,
+    func,
+)
+from app.core.database import Base
+
+
+class ResumeBlob(Base):
+    """One stored resume object, identified by the SHA-256 of its bytes."""
+
+    __tablename__ = "resume_blobs"
+
+    sha256 = Column(String(64), primary_key=True)
+    key = Column(String(500), nullable=False, unique=True)
+    size = Column(BigInteger, nullable=False)
+    content_type = Column(String(150))
+    created_on = Column(DateTime, server_default=func.now(), nullable=False)
+    # Last registered or deduplicated against; unreferenced blobs are purged
+    # RESUME_BLOB_RETENTION_SECONDS after this
+    last_seen_on = Column(DateTime, server_default=func.now(), nullable=False, index=True)
+
+    def __repr__(self):
+        return f"<ResumeBlob {self.sha256} at {self.key}>"
+
+
+class CareersUserResume(Base):
+    """The blob holding a user's current resume, under its original name."""
+
+    __tablename__ = "careers_user_resumes"
+
+    careersuser_id = Column(
+        Integer, ForeignKey("careersusers.id", ondelete="CASCADE"), primary_key=True
+    )
+    sha256 = Column(String(64), ForeignKey("resume_blobs.sha256"), nullable=False, index=True)
+    filename = Column(String(255), nullable=False)
+    uploaded_on = Column(DateTime, server_default=func.now(), nullable=False)
+
+    def __repr__(self):
+        return f"<CareersUserResume user={self.careersuser_id} blob={self.sha256}>"
@@ -0,0 +1,36 @@
+from sqlalchemy import (
+    Column,
+    Computed,
+    DateTime,
+    ForeignKey,
+    Index,
+    Integer,
+    String,
+    Text,
+    func,
+)
+from sqlalchemy.dialects.postgresql import TSVECTOR
+from app.core.database import Base
+
+
+class CareersResumeText(Base):
+    """Plain text extracted from a user's current resume, full-text indexed."""
+
+    __tablename__ = "careers_resume_texts"
+    __table_args__ = (
+        Index("ix_careers_resume_texts_search", "search_vector", postgresql_using="gin"),
+    )
+
+    id = Column(Integer, primary_key=True, autoincrement=True)
+    careersuser_id = Column(
+        Integer, ForeignKey("careersusers.id", ondelete="CASCADE"), nullable=False, unique=True
+    )
+    resume_key = Column(String(500), nullable=False)
+    content = Column(Text, nullable=False)
+    search_vector = Column(
+        TSVECTOR, Computed("to_tsvector('english', content)", persisted=True)
+    )
+    extracted_on = Column(DateTime, default=func.now(), nullable=False)
+
+    def __repr__(self):
+        return f"<ResumeText user={self.careersuser_id} key={self.resume_key}>"
@@ -0,0 +1,15 @@
+from sqlalchemy import Column, String, DateTime, func
+from app.core.database import Base
+
+
+class RevokedToken(Base):
+    __tablename__ = "revoked_tokens"
+
+    jti = Column(String(64), primary_key=True)
+    expires_at = Column(DateTime(timezone=True), nullable=False, index=True)
+    revoked_on = Column(
+        DateTime(timezone=True), server_default=func.now(), nullable=False, index=True
+    )
+
+    def __repr__(self):
+        return f"<RevokedToken {self.jti} until {self.expires_at}>"
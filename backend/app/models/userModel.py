@@ -0,0 +1,21 @@
+import uuid
+from sqlalchemy import Column, Integer, String, Boolean, DateTime, func
+from app.core.database import Base
+
+
+class User(Base):
+    """Staff account that signs in to the API (careers users are candidates)."""
+
+    __tablename__ = "users"
+
+    id = Column(Integer, primary_key=True, autoincrement=True)
+    # Subject of the user's tokens
+    user_id = Column(String(50), nullable=False, unique=True, default=lambda: uuid.uuid4().hex)
+    email = Column(String(150), nullable=False, unique=True, index=True)
+    hashed_password = Column(String(255), nullable=False)
+    is_active = Column(Boolean, nullable=False, default=True)
+    created_on = Column(DateTime, default=func.now(), nullable=False)
+    updated_on = Column(DateTime, onupdate=func.now())
+
+    def __repr__(self):
+        return f"<User {self.email} (ID: {self.user_id})>"
@@ -0,0 +1,53 @@
+from fastapi import APIRouter, Depends, HTTPException
+from fastapi.security import OAuth2PasswordRequestForm
+from sqlalchemy.ext.asyncio import AsyncSession
+from app.core.database import get_db
+from app.core.security import get_current_user, oauth2_scheme, revoke_token
+from app.models.userModel import User
+from app.services.authServices import deactivate_user, login
+from app.schemas.authSchemas import TokenResponse, UserResponse
+from app.core.logging import logging
+
+router = APIRouter()
+
+
+@router.post("/token", response_model=TokenResponse, summary="Log in with email and password")
+async def login_for_tokens(
+    form: OAuth2PasswordRequestForm = Depends(), db: AsyncSession = Depends(get_db)
+):
+    try:
+        return await login(db, form.username, form.password)
+    except HTTPException as http_exc:
+        logging.warning(f"Login failed for {form.username}: {http_exc.detail}")
+        raise http_exc
+    except Exception as exc:
+        logging.error(f"Unexpected error during login: {str(exc)}")
+        raise HTTPException(status_code=500, detail="An unexpected error occurred during login.")
+
+
+@router.post("/logout", summary="Revoke the presented access token")
+async def logout(token: str = Depends(oauth2_scheme)):
+    await revoke_token(token)
+    return {"status_code": 200, "message": "Logged out successfully."}
+
+
+@router.get("/me", response_model=UserResponse, summary="The logged-in user")
+async def read_current_user(user: User = Depends(get_current_user)):
+    return user
+
+
+@router.delete("/me", summary="Deactivate the logged-in user")
+async def deactivate_current_user(
+    user: User = Depends(get_current_user), db: AsyncSession = Depends(get_db)
+):
+    try:
+        await deactivate_user(db, user.user_id)
+        return {"status_code": 200, "message": "User deactivated successfully."}
+    except HTTPException as http_exc:
+        logging.error(f"HTTPException during deactivation: {http_exc.detail}")
+        raise http_exc
+    except Exception as exc:
+        logging.error(f"Unexpected error during deactivation: {str(exc)}")
+        raise HTTPException(
+            status_code=500, detail="An unexpected error occurred during deactivation."
+        )
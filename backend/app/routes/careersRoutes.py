@@ -1,25 +1,83 @@
-from fastapi import APIRouter, Depends, HTTPException, UploadFile, File, Form, Query
+from fastapi import (
+    APIRouter,
+    Depends,
+    HTTPException,
+    UploadFile,
+    File,
+    Form,
+    Query,
+    Request,
+)
 from sqlalchemy.ext.asyncio import AsyncSession
 from app.core.database import get_db
-from app.services.s3_upload import upload_file_to_s3
+from app.core.replicas import get_read_db
+from app.services.bulk_import import import_careerusers
+from app.services.conditional import (
+    REVALIDATE,
+    etag_matches,
+    listing_etag,
+    not_modified,
+    user_etag,
+)
+from app.services.resume_text import search_resumes
+from app.services.storage import storage
+from app.services.user_count import CountMode
+from app.services.serialization import (
+    career_user_envelope_adapter,
+    json_response,
+    paginated_users_adapter,
+    search_results_adapter,
+)
 from app.services.careersServices import (
     create_careeruser,
+    create_careeruser_streaming,
+    confirm_resume_upload,
+    presign_resume_upload,
     get_all_users,
+    get_users_by_cursor,
     get_careeruser_by_id,
+    get_careeruser_etag,
+    get_resume_download,
+    search_users,
     update_careeruser,
+    update_careeruser_streaming,
     soft_delete_careeruser,
 )
 from app.schemas.careersSchemas import (
     CareerUserCreate,
-    CareerUserResponse,
+    CareerUserSearchResponse,
     PaginatedCareerUsersResponse,
     CareerUserUpdate,
+    ResumeConfirmRequest,
+    ResumePresignRequest,
+    ResumePresignResponse,
 )
 from app.core.logging import logging
+from typing import List, Optional
 
 router = APIRouter()
 
 
+def user_data(user) -> dict:
+    return {
+        "id": user.id,
+        "user_id": user.user_id,
+        "name": user.name,
+        "email": user.email,
+        "mobile": user.mobile,
+        "resume_filename": user.resume_filename,
+        "is_active": user.is_active,
+        "created_on": user.created_on,
+        "updated_on": user.updated_on,
+    }
+
+
+def streamed_resume_data(streamed):
+    if streamed is None:
+        return None
+    return {"size": streamed.size, "sha256": streamed.sha256}
+
+
 @router.post("/", summary="Create new User Registration")
 async def register_careeruser(
     name: str = Form(..., description="User's full name"),
@@ -40,17 +98,7 @@ async def register_careeruser(
         return {
             "status_code": 200,
             "message": "User registered successfully.",
-            "user_data": {
-                "id": new_user.id,
-                "user_id": new_user.user_id,
-                "name": new_user.name,
-                "email": new_user.email,
-                "mobile": new_user.mobile,
-                "resume_filename": new_user.resume_filename,
-                "is_active": new_user.is_active,
-                "created_on": new_user.created_on,
-                "updated_on": new_user.updated_on,
-            },
+            "user_data": user_data(new_user),
         }
     except HTTPException as http_exc:
         logging.error(f"HTTPException during user registration: {http_exc.detail}")
@@ -66,25 +114,107 @@ async def register_careeruser(
         )
 
 
+@router.post("/stream", summary="Create new User Registration (streamed resume)")
+async def register_careeruser_streaming(
+    request: Request, db: AsyncSession = Depends(get_db)
+):
+    """Same form fields as ``POST /``, but the resume is piped to S3 while the
+    body is still arriving instead of being spooled to disk first."""
+    logging.info("Received streaming registration request")
+    try:
+        new_user, streamed = await create_careeruser_streaming(db, request)
+        logging.info(f"User registered successfully: {new_user.user_id}")
+        return {
+            "status_code": 200,
+            "message": "User registered successfully.",
+            "user_data": user_data(new_user),
+            "resume": streamed_resume_data(streamed),
+        }
+    except HTTPException as http_exc:
+        logging.error(f"HTTPException during user registration: {http_exc.detail}")
+        raise http_exc
+    except Exception as exc:
+        logging.error(f"Unexpected error during user registration: {str(exc)}")
+        raise HTTPException(
+            status_code=500,
+            detail="An unexpected error occurred during user registration. Please try again later.",
+        )
+
+
+@router.post("/bulk", summary="Bulk import User Registrations")
+async def bulk_register_careerusers(
+    manifest: UploadFile = File(
+        ...,
+        description="CSV (name,email,mobile,resume columns) or .jsonl manifest",
+    ),
+    resumes_zip: UploadFile = File(
+        None, description="Zip archive holding the resumes named in the manifest"
+    ),
+    resume_files: List[UploadFile] = File(
+        None, description="Resumes uploaded as individual files instead of a zip"
+    ),
+    db: AsyncSession = Depends(get_db),
+):
+    logging.info(f"Received bulk import request: {manifest.filename}")
+    if resumes_zip is None and not resume_files:
+        raise HTTPException(
+            status_code=400, detail="Provide resumes_zip or resume_files with the manifest"
+        )
+    try:
+        report = await import_careerusers(db, manifest, resumes_zip, resume_files or [])
+        return {
+            "status_code": 200,
+            "message": "Bulk import processed.",
+            **report,
+        }
+    except HTTPException as http_exc:
+        logging.error(f"HTTPException during bulk import: {http_exc.detail}")
+        raise http_exc
+    except Exception as exc:
+        logging.error(f"Unexpected error during bulk import: {str(exc)}")
+        raise HTTPException(
+            status_code=500,
+            detail="An unexpected error occurred during bulk import. Please try again later.",
+        )
+
+
 @router.get(
     "/",
     response_model=PaginatedCareerUsersResponse,
     summary="Get all active User Detail",
 )
 async def get_all_active_users(
+    request: Request,
     skip: int = Query(0, ge=0),
-    limit: int = Query(10, le=100),
-    db: AsyncSession = Depends(get_db),
+    limit: int = Query(10, ge=1, le=100),
+    cursor: bool = Query(
+        False, description="Use keyset pagination; follow next_cursor via `after`"
+    ),
+    after: Optional[str] = Query(None, description="next_cursor of the previous page"),
+    count: CountMode = Query(
+        "cached",
+        description="How total_users is computed; `none` omits it",
+    ),
+    db: AsyncSession = Depends(get_read_db),
 ):
     logging.info(f"Request to fetch all active users with skip={skip}, limit={limit}")
     try:
-        users, total_count = await get_all_users(db, skip, limit)
-        return {
-            "status_code": 200,
-            "message": "Users retrieved successfully",
-            "total_users": total_count,
-            "users": [CareerUserResponse.from_orm(user) for user in users],
-        }
+        next_cursor = None
+        if cursor or after:
+            users, total_count, next_cursor = await get_users_by_cursor(
+                db, after, limit, count
+            )
+        else:
+            users, total_count = await get_all_users(db, skip, limit, count)
+
+        etag = listing_etag(count, total_count, users, next_cursor)
+        if etag_matches(request, etag):
+            return not_modified(etag)
+        return json_response(
+            paginated_users_adapter,
+            {"total_users": total_count, "users": users, "next_cursor": next_cursor},
+            headers={"ETag": etag, "Cache-Control": REVALIDATE},
+        )
     except HTTPException as ex:
         logging.error(f"Failed to fetch users: {str(ex.detail)}", exc_info=True)
         raise ex
@@ -93,32 +223,103 @@ async def get_all_active_users(
         raise HTTPException(status_code=500, detail="Internal server error")
 
 
+# Declared before /{id} so "search" is not parsed as an id
+@router.get(
+    "/search",
+    response_model=CareerUserSearchResponse,
+    summary="Search active users by name, email or mobile",
+)
+async def search_active_users(
+    q: str = Query(..., min_length=2, max_length=150, description="Search text"),
+    limit: int = Query(10, ge=1, le=100),
+    after: Optional[str] = Query(None, description="next_cursor of the previous page"),
+    db: AsyncSession = Depends(get_db),
+):
+    logging.info(f"Request to search users with q={q!r}, limit={limit}")
+    try:
+        users, next_cursor = await search_users(db, q.strip(), limit, after)
+        return json_response(
+            search_results_adapter, {"users": users, "next_cursor": next_cursor}
+        )
+    except HTTPException as ex:
+        logging.error(f"Failed to search users: {str(ex.detail)}", exc_info=True)
+        raise ex
+    except Exception as e:
+        logging.error(f"Unexpected error searching users: {str(e)}", exc_info=True)
+        raise HTTPException(status_code=500, detail="Internal server error")
+
+
+@router.get(
+    "/search/resumes",
+    response_model=CareerUserSearchResponse,
+    summary="Search active users by resume content",
+)
+async def search_resume_content(
+    q: str = Query(
+        ..., min_length=2, max_length=200, description='Web-style query, e.g. python "aws lambda"'
+    ),
+    limit: int = Query(10, ge=1, le=100),
+    after: Optional[str] = Query(None, description="next_cursor of the previous page"),
+    db: AsyncSession = Depends(get_db),
+):
+    logging.info(f"Request to search resumes with q={q!r}, limit={limit}")
+    try:
+        users, next_cursor = await search_resumes(db, q.strip(), limit, after)
+        return json_response(
+            search_results_adapter, {"users": users, "next_cursor": next_cursor}
+        )
+    except HTTPException as ex:
+        logging.error(f"Failed to search resumes: {str(ex.detail)}", exc_info=True)
+        raise ex
+    except Exception as e:
+        logging.error(f"Unexpected error searching resumes: {str(e)}", exc_info=True)
+        raise HTTPException(status_code=500, detail="Internal server error")
+
+
 @router.get("/{id}", response_model=dict, summary="Get user by ID")
-async def get_user_by_id_route(id: int, db: AsyncSession = Depends(get_db)):
+async def get_user_by_id_route(
+    id: int, request: Request, db: AsyncSession = Depends(get_read_db)
+):
     try:
         # Log the request to fetch user by ID
         logging.info(f"Request to fetch user with ID: {id}")
 
+        # Revalidation answers 304 from the cache or two columns, no full row
+        if request.headers.get("if-none-match"):
+            etag = await get_careeruser_etag(db, id)
+            if etag and etag_matches(request, etag):
+                logging.info(f"User {id} not modified")
+                return not_modified(etag)
+
         # Fetch the user from the database
         user = await get_careeruser_by_id(db, id)
 
         # If user not found, return 404 response
         if not user:
             logging.warning(f"User with ID {id} not found")
-            return {"msg": "User not found", "status_code": 404, "data": None}
+            return json_response(
+                career_user_envelope_adapter,
+                {"msg": "User not found", "status_code": 404, "data": None},
+            )
 
         # Check if the user is inactive
         if not user.is_active:
             logging.warning(f"User with ID {id} is inactive.")
-            return {"msg": "User inactive", "status_code": 403, "data": None}
+            return json_response(
+                career_user_envelope_adapter,
+                {"msg": "User inactive", "status_code": 403, "data": None},
+            )
 
         # If the user is active, return the user data
         logging.info(f"User retrieved successfully: {user.id}")
-        return {
-            "msg": "User retrieved successfully",
-            "status_code": 200,
-            "data": CareerUserResponse.from_orm(user),
-        }
+        return json_response(
+            career_user_envelope_adapter,
+            {"msg": "User retrieved successfully", "status_code": 200, "data": user},
+            headers={
+                "ETag": user_etag(user.id, user.created_on, user.updated_on),
+                "Cache-Control": REVALIDATE,
+            },
+        )
 
     except HTTPException as he:
         logging.error(f"HTTP error: {he.detail}", exc_info=True)
@@ -129,6 +330,22 @@ async def get_user_by_id_route(id: int, db: AsyncSession = Depends(get_db)):
         return {"msg": "Internal server error", "status_code": 500, "data": None}
 
 
+@router.get("/{id}/resume", summary="Download a user's resume")
+async def download_resume(id: int, db: AsyncSession = Depends(get_db)):
+    """Local storage streams the file (Range requests, sendfile where the
+    server supports it); S3 redirects to a short-lived presigned URL."""
+    try:
+        logging.info(f"Request to download resume of user ID: {id}")
+        key, filename, content_type = await get_resume_download(db, id)
+        return await storage.download_response(key, filename, content_type)
+    except HTTPException as http_exc:
+        logging.error(f"Resume download failed for user ID: {id}: {http_exc.detail}")
+        raise http_exc
+    except Exception as e:
+        logging.exception(f"Unexpected error downloading resume for user ID: {id}: {e}")
+        raise HTTPException(status_code=500, detail="Internal server error")
+
+
 @router.put("/{id}/", summary="Update Career User")
 async def update_user(
     id: int,
@@ -159,17 +376,7 @@ async def update_user(
         return {
             "status_code": 200,
             "message": "User updated successfully.",
-            "user_data": {
-                "id": user.id,
-                "user_id": user.user_id,
-                "name": user.name,
-                "email": user.email,
-                "mobile": user.mobile,
-                "resume_filename": user.resume_filename,
-                "is_active": user.is_active,
-                "created_on": user.created_on,
-                "updated_on": user.updated_on,
-            },
+            "user_data": user_data(user),
         }
 
     except HTTPException as http_exc:
@@ -182,6 +389,63 @@ async def update_user(
         )
 
 
+@router.put("/{id}/stream", summary="Update Career User (streamed resume)")
+async def update_user_streaming(
+    id: int, request: Request, db: AsyncSession = Depends(get_db)
+):
+    """Same form fields as ``PUT /{id}/``, with the resume streamed to S3."""
+    try:
+        logging.info(f"Starting streaming update process for user ID: {id}")
+        user, streamed = await update_careeruser_streaming(db, id, request)
+        logging.info(f"Update process completed successfully for user ID: {id}")
+        return {
+            "status_code": 200,
+            "message": "User updated successfully.",
+            "user_data": user_data(user),
+            "resume": streamed_resume_data(streamed),
+        }
+    except HTTPException as http_exc:
+        logging.error(f"Error in update route for user ID: {id}: {http_exc.detail}")
+        raise http_exc
+    except Exception as e:
+        logging.exception(f"Unexpected error in update route for user ID: {id}: {e}")
+        raise HTTPException(
+            status_code=500, detail="Unexpected error occurred in update route"
+        )
+
+
+@router.post(
+    "/{id}/resume/presign",
+    response_model=ResumePresignResponse,
+    summary="Presigned direct-to-S3 resume upload",
+)
+async def presign_resume(
+    id: int, body: ResumePresignRequest, db: AsyncSession = Depends(get_db)
+):
+    """Returns a URL and form fields to POST the resume to S3 directly,
+    followed by ``POST /{id}/resume/confirm`` with the returned key."""
+    return await presign_resume_upload(db, id, body.filename, body.content_type)
+
+
+@router.post("/{id}/resume/confirm", summary="Confirm a presigned resume upload")
+async def confirm_resume(
+    id: int, body: ResumeConfirmRequest, db: AsyncSession = Depends(get_db)
+):
+    try:
+        user = await confirm_resume_upload(db, id, body.key)
+        return {
+            "status_code": 200,
+            "message": "Resume updated successfully.",
+            "user_data": user_data(user),
+        }
+    except HTTPException as http_exc:
+        logging.error(f"Error confirming resume for user ID: {id}: {http_exc.detail}")
+        raise http_exc
+    except Exception as e:
+        logging.exception(f"Unexpected error confirming resume for user ID: {id}: {e}")
+        raise HTTPException(status_code=500, detail="Internal server error")
+
+
 @router.delete("/{id}", summary="Soft Delete a User")
 async def delete_user(id: int, db: AsyncSession = Depends(get_db)):
     try:
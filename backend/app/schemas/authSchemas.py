@@ -0,0 +1,20 @@
+from pydantic import BaseModel
+from typing import Optional
+from datetime import datetime
+
+
+class TokenResponse(BaseModel):
+    access_token: str
+    refresh_token: str
+    token_type: str = "bearer"
+
+
+class UserResponse(BaseModel):
+    user_id: str
+    email: str
+    is_active: bool
+    created_on: datetime
+    updated_on: Optional[datetime] = None
+
+    class Config:
+        from_attributes = True
@@ -42,8 +42,33 @@ class CareerUserResponse(BaseModel):
 
 
 class PaginatedCareerUsersResponse(BaseModel):
-    total_users: int
+    total_users: Optional[int] = None
     users: List[CareerUserResponse]
+    next_cursor: Optional[str] = None
 
     class Config:
         from_attributes = True
+
+
+class CareerUserSearchResponse(BaseModel):
+    users: List[CareerUserResponse]
+    next_cursor: Optional[str] = None
+
+    class Config:
+        from_attributes = True
+
+
+class ResumePresignRequest(BaseModel):
+    filename: str = Field(..., min_length=1, max_length=255)
+    content_type: str
+
+
+class ResumePresignResponse(BaseModel):
+    key: str
+    url: str
+    fields: dict
+    expires_in: int
+
+
+class ResumeConfirmRequest(BaseModel):
+    key: str
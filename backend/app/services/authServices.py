@@ -0,0 +1,76 @@
+from typing import Optional
+from fastapi import HTTPException
+from sqlalchemy import select, update
+from sqlalchemy.ext.asyncio import AsyncSession
+from app.core.logging import logging
+from app.core.security import (
+    create_access_token,
+    create_refresh_token,
+    hash_password_async,
+    invalidate_principal,
+    verify_password_async,
+)
+from app.models.userModel import User
+
+# bcrypt hash of a throwaway password, verified against when the email is
+# unknown so a login takes as long whether or not the account exists
+_DUMMY_HASH = "$2b$12$ataWjJXzPgzwpDJ0gAl5WeidFhvVnVOwqTURfYWxBjHJtPYxlmrD."
+
+
+async def create_user(db: AsyncSession, email: str, password: str) -> User:
+    result = await db.execute(select(User.id).where(User.email == email))
+    if result.scalar_one_or_none() is not None:
+        raise HTTPException(status_code=409, detail="Email already registered")
+    user = User(email=email, hashed_password=await hash_password_async(password))
+    db.add(user)
+    await db.commit()
+    logging.info(f"User {user.user_id} created for {email}.")
+    return user
+
+
+async def authenticate_user(db: AsyncSession, email: str, password: str) -> Optional[User]:
+    """The active user with these credentials, or None."""
+    result = await db.execute(select(User).where(User.email == email))
+    user = result.scalar_one_or_none()
+    if user is None:
+        await verify_password_async(password, _DUMMY_HASH)
+        return None
+    if not await verify_password_async(password, user.hashed_password):
+        return None
+    if not user.is_active:
+        logging.warning(f"Login attempt for inactive user {user.user_id}.")
+        return None
+    return user
+
+
+async def login(db: AsyncSession, email: str, password: str) -> dict:
+    user = await authenticate_user(db, email, password)
+    if user is None:
+        raise HTTPException(
+            status_code=401,
+            detail="Incorrect email or password",
+            headers={"WWW-Authenticate": "Bearer"},
+        )
+    claims = {"sub": user.user_id}
+    logging.info(f"User {user.user_id} logged in.")
+    return {
+        "access_token": create_access_token(claims),
+        "refresh_token": create_refresh_token(claims),
+        "token_type": "bearer",
+    }
+
+
+async def deactivate_user(db: AsyncSession, user_id: str):
+    """Deactivate an account.
+
+    Its live tokens stop working at once in this process. Other worker
+    processes keep their cached principal, so there the tokens work for up
+    to PRINCIPAL_CACHE_TTL_SECONDS more.
+    """
+    await db.execute(
+        update(User).where(User.user_id == user_id).values(is_active=False)
+    )
+    await db.commit()
+    # Otherwise the cached principal keeps authenticating for its TTL
+    await invalidate_principal(user_id)
+    logging.info(f"User {user_id} deactivated.")
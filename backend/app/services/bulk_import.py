@@ -0,0 +1,382 @@
+import asyncio
+import csv
+import io
+import json
+import os
+import threading
+import zipfile
+from typing import List, Optional
+from fastapi import HTTPException, UploadFile
+from fastapi.concurrency import run_in_threadpool
+from sqlalchemy import func, select
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.ext.asyncio import AsyncSession
+from app.core.config import settings
+from app.core.logging import logging
+from app.models.careersModel import CareersUsers, user_id_seq
+from app.models.resumeBlobModel import CareersUserResume
+from app.services.resume_store import blob_key, find_blobs, hash_fileobj, record_blobs
+from app.services.storage import storage
+from app.services.resume_text import schedule_resume_extraction
+from app.services.user_count import active_user_counter
+
+MANIFEST_FIELDS = ("name", "email", "mobile", "resume")
+
+
+def _text(data: dict, field: str) -> str:
+    # JSON manifests may carry numbers (a mobile number, say) or nested values
+    value = data.get(field)
+    return "" if value is None else str(value).strip()
+
+
+class ImportRow:
+    def __init__(self, row: int, data):
+        self.row = row
+        self.error = None
+        if not isinstance(data, dict):
+            self.error = "Manifest row must be a JSON object"
+            data = {}
+        self.name = _text(data, "name")
+        self.email = _text(data, "email")
+        self.mobile = _text(data, "mobile")
+        self.resume = os.path.basename(_text(data, "resume"))
+        self.user_id = None
+        self.key = None
+        self.sha256 = None
+        self.size = None
+        self.resume_url = None
+        self.id = None
+
+    def result(self) -> dict:
+        if self.error:
+            return {"row": self.row, "status": "failed", "error": self.error}
+        return {"row": self.row, "status": "created", "id": self.id, "user_id": self.user_id}
+
+
+def parse_manifest(content: bytes, filename: str) -> List[dict]:
+    """Rows of a CSV (with a header line) or JSON Lines manifest."""
+    text = content.decode("utf-8-sig")
+    if filename.lower().endswith((".jsonl", ".ndjson")):
+        rows = []
+        for number, line in enumerate(text.splitlines(), start=1):
+            if not line.strip():
+                continue
+            try:
+                rows.append(json.loads(line))
+            except json.JSONDecodeError:
+                raise HTTPException(
+                    status_code=400, detail=f"Invalid JSON on manifest line {number}"
+                )
+        return rows
+
+    reader = csv.DictReader(io.StringIO(text))
+    missing = [f for f in MANIFEST_FIELDS if f not in (reader.fieldnames or [])]
+    if missing:
+        raise HTTPException(
+            status_code=400, detail=f"Manifest is missing columns: {', '.join(missing)}"
+        )
+    return list(reader)
+
+
+class SharedUpload(io.RawIOBase):
+    """An independent read handle on an uploaded file.
+
+    Several manifest rows may name the same file; each gets its own handle
+    with its own position, reads are serialised on the shared file and
+    closing a handle leaves the upload open.
+    """
+
+    def __init__(self, fileobj, lock: threading.Lock):
+        self._file = fileobj
+        self._lock = lock
+        self._position = 0
+
+    def readable(self):
+        return True
+
+    def seekable(self):
+        return True
+
+    def readinto(self, buffer) -> int:
+        with self._lock:
+            self._file.seek(self._position)
+            data = self._file.read(len(buffer))
+        buffer[: len(data)] = data
+        self._position += len(data)
+        return len(data)
+
+    def seek(self, offset: int, whence: int = io.SEEK_SET) -> int:
+        if whence == io.SEEK_SET:
+            self._position = offset
+        elif whence == io.SEEK_CUR:
+            self._position += offset
+        else:
+            with self._lock:
+                self._position = self._file.seek(0, io.SEEK_END) + offset
+        return self._position
+
+    def tell(self) -> int:
+        return self._position
+
+
+class ResumeSource:
+    """Looks resumes up by file name in a zip archive and/or uploaded files.
+
+    Only base names are matched, so a name found more than once (in
+    different zip folders, or both zipped and uploaded) is ambiguous and
+    rejected rather than resolved to whichever came last.
+    """
+
+    def __init__(self, archive: Optional[UploadFile], files: List[UploadFile]):
+        self._archive = None
+        self._members = {}
+        self._files = {}
+        self._sizes = {}
+        self._ambiguous = set()
+        self._lock = threading.Lock()
+        if archive is not None:
+            try:
+                self._archive = zipfile.ZipFile(archive.file)
+            except zipfile.BadZipFile:
+                raise HTTPException(status_code=400, detail="resumes_zip is not a valid zip file")
+            for info in self._archive.infolist():
+                if not info.is_dir():
+                    self._add(self._members, os.path.basename(info.filename), info, info.file_size)
+        for upload in files:
+            if upload.filename:
+                size = upload.file.seek(0, io.SEEK_END)
+                self._add(self._files, os.path.basename(upload.filename), upload, size)
+
+    def _add(self, index: dict, name: str, entry, size: int):
+        if name in self._sizes:
+            self._ambiguous.add(name)
+        index[name] = entry
+        self._sizes[name] = size
+
+    def check(self, name: str) -> Optional[str]:
+        if name in self._ambiguous:
+            return f"Resume '{name}' matches more than one file in the upload"
+        if name not in self._sizes:
+            return f"Resume '{name}' not found in the upload"
+        if self._sizes[name] > settings.MAX_RESUME_SIZE_BYTES:
+            return f"Resume '{name}' exceeds {settings.MAX_RESUME_SIZE_BYTES} bytes"
+        return None
+
+    def open(self, name: str):
+        if name in self._files:
+            return SharedUpload(self._files[name].file, self._lock)
+        # ZipFile serialises reads of its underlying file, so members can be
+        # streamed from several upload threads at once
+        return self._archive.open(self._members[name])
+
+    def close(self):
+        if self._archive is not None:
+            self._archive.close()
+
+
+def validate_rows(rows: List[ImportRow], resumes: ResumeSource):
+    seen_emails, seen_mobiles = set(), set()
+    for row in rows:
+        if row.error:
+            continue
+        missing = [f for f in MANIFEST_FIELDS if not getattr(row, f)]
+        if missing:
+            row.error = f"Missing fields: {', '.join(missing)}"
+        elif row.email.lower() in seen_emails:
+            row.error = "Duplicate email in manifest"
+        elif row.mobile in seen_mobiles:
+            row.error = "Duplicate mobile in manifest"
+        else:
+            row.error = resumes.check(row.resume)
+        if not row.error:
+            seen_emails.add(row.email.lower())
+            seen_mobiles.add(row.mobile)
+
+
+async def hash_row(row: ImportRow, resumes: ResumeSource):
+    try:
+        fileobj = await run_in_threadpool(resumes.open, row.resume)
+        try:
+            row.sha256, row.size = await run_in_threadpool(hash_fileobj, fileobj)
+        finally:
+            await run_in_threadpool(fileobj.close)
+    except Exception as e:
+        logging.error(f"Bulk import: reading the resume failed for row {row.row}: {e}")
+        row.error = "Resume upload failed"
+        return
+    # Zip headers only claim a size; this is what was actually read
+    if row.size > settings.MAX_RESUME_SIZE_BYTES:
+        row.error = f"Resume '{row.resume}' exceeds {settings.MAX_RESUME_SIZE_BYTES} bytes"
+
+
+async def upload_blob(row: ImportRow, resumes: ResumeSource) -> dict:
+    key = blob_key(row.sha256, row.resume)
+    fileobj = await run_in_threadpool(resumes.open, row.resume)
+    try:
+        await storage.save(fileobj, key)
+    finally:
+        await run_in_threadpool(fileobj.close)
+    return {"sha256": row.sha256, "key": key, "size": row.size, "content_type": None}
+
+
+async def store_batch_resumes(db: AsyncSession, rows: List[ImportRow], resumes: ResumeSource):
+    """Store the resumes of a batch with one lookup and one registration.
+
+    Hashes already in resume_blobs are reused, each new hash is uploaded
+    once however many rows share it (bounded by the S3 executor), and the
+    new blobs are registered with one multi-row INSERT, committed before
+    the users go in. Every query runs on the import's own session.
+    """
+    await asyncio.gather(*(hash_row(row, resumes) for row in rows))
+    rows = [row for row in rows if not row.error]
+    keys = await find_blobs(db, {row.sha256 for row in rows})
+    # Release the connection while the uploads run
+    await db.commit()
+
+    new = {}
+    for row in rows:
+        if row.sha256 not in keys:
+            new.setdefault(row.sha256, row)
+    results = await asyncio.gather(
+        *(upload_blob(row, resumes) for row in new.values()), return_exceptions=True
+    )
+    blobs = []
+    for row, result in zip(new.values(), results):
+        if isinstance(result, Exception):
+            logging.error(f"Bulk import: upload failed for row {row.row}: {result}")
+        else:
+            blobs.append(result)
+
+    recorded = await record_blobs(db, blobs)
+    await db.commit()
+    for blob in blobs:
+        if recorded[blob["sha256"]] != blob["key"]:
+            await storage.delete(blob["key"])
+    keys.update(recorded)
+
+    for row in rows:
+        row.key = keys.get(row.sha256)
+        if row.key is None:
+            row.error = "Resume upload failed"
+        else:
+            row.resume_url = storage.url(row.key)
+
+
+async def insert_batch(db: AsyncSession, rows: List[ImportRow]):
+    """One multi-row INSERT ... ON CONFLICT DO NOTHING for a batch.
+
+    Rows that come back were created and are linked to their resume blobs
+    and queued for text extraction in the same transaction; the rest
+    collided with an existing email, mobile or user_id. Their blobs are
+    kept for reuse.
+    """
+    result = await db.execute(
+        insert(CareersUsers)
+        .values(
+            [
+                {
+                    "user_id": row.user_id,
+                    "name": row.name,
+                    "email": row.email,
+                    "mobile": row.mobile,
+                    "resume_filename": row.resume_url,
+                    "is_active": True,
+                }
+                for row in rows
+            ]
+        )
+        .on_conflict_do_nothing()
+        .returning(CareersUsers.id, CareersUsers.user_id)
+    )
+    created = {user_id: id for id, user_id in result.all()}
+    for row in rows:
+        row.id = created.get(row.user_id)
+        if row.id is None:
+            row.error = "Email or mobile number already registered"
+
+    linked = [row for row in rows if row.id is not None]
+    if linked:
+        await db.execute(
+            insert(CareersUserResume).values(
+                [
+                    {"careersuser_id": row.id, "sha256": row.sha256, "filename": row.resume[:255]}
+                    for row in linked
+                ]
+            )
+        )
+        for row in linked:
+            schedule_resume_extraction(db, row.id, row.key)
+    await db.commit()
+
+
+async def import_careerusers(
+    db: AsyncSession,
+    manifest: UploadFile,
+    resumes_zip: Optional[UploadFile],
+    resume_files: List[UploadFile],
+) -> dict:
+    """Register many candidates from a manifest plus their resumes.
+
+    Rows are processed in batches of BULK_IMPORT_BATCH_SIZE: user ids for
+    the batch come from one nextval() round trip, resumes are stored by
+    store_batch_resumes and the rows go in with a single multi-row INSERT.
+    Returns a per-row report; one bad row never fails the import.
+    """
+    try:
+        records = parse_manifest(await manifest.read(), manifest.filename or "")
+        if len(records) > settings.BULK_IMPORT_MAX_ROWS:
+            raise HTTPException(
+                status_code=413,
+                detail=f"Manifest has more than {settings.BULK_IMPORT_MAX_ROWS} rows",
+            )
+        logging.info(f"Bulk import: {len(records)} manifest rows received.")
+
+        rows = [ImportRow(number, record) for number, record in enumerate(records, start=1)]
+        resumes = await run_in_threadpool(ResumeSource, resumes_zip, resume_files)
+        try:
+            validate_rows(rows, resumes)
+            pending = [row for row in rows if not row.error]
+            batch_size = settings.BULK_IMPORT_BATCH_SIZE
+
+            for start in range(0, len(pending), batch_size):
+                batch = pending[start : start + batch_size]
+                result = await db.execute(
+                    select(user_id_seq.next_value()).select_from(
+                        func.generate_series(1, len(batch))
+                    )
+                )
+                for row, number in zip(batch, result.scalars().all()):
+                    row.user_id = f"user_{number}"
+
+                await store_batch_resumes(db, batch, resumes)
+
+                uploaded = [row for row in batch if not row.error]
+                if uploaded:
+                    await insert_batch(db, uploaded)
+                logging.info(
+                    f"Bulk import: batch of {len(batch)} rows done "
+                    f"({start + len(batch)}/{len(pending)})."
+                )
+        finally:
+            await run_in_threadpool(resumes.close)
+
+        active_user_counter.invalidate()
+        created = sum(1 for row in rows if not row.error)
+        logging.info(f"Bulk import finished: {created} created, {len(rows) - created} failed.")
+        return {
+            "total": len(rows),
+            "created": created,
+            "failed": len(rows) - created,
+            "results": [row.result() for row in rows],
+        }
+
+    except HTTPException as http_exc:
+        logging.error(f"HTTP Exception during bulk import: {http_exc.detail}")
+        raise http_exc
+
+    except UnicodeDecodeError:
+        raise HTTPException(status_code=400, detail="Manifest must be UTF-8 encoded")
+
+    except Exception as e:
+        logging.exception("Unexpected error during bulk import.")
+        raise HTTPException(status_code=500, detail="Error during bulk import")
@@ -1,27 +1,170 @@
-from fastapi import HTTPException, UploadFile
+from fastapi import HTTPException, Request, UploadFile
+from sqlalchemy.dialects.postgresql import insert
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.future import select
-from sqlalchemy.sql import func, and_
+from sqlalchemy.sql import case, func, or_, tuple_
 from app.models.careersModel import CareersUsers
-from app.services.s3_upload import upload_file_to_s3
+from app.models.resumeBlobModel import CareersUserResume, ResumeBlob
+from app.schemas.careersSchemas import CareerUserResponse
+from app.services.conditional import user_etag
+from app.services.job_handlers import discard_staged_resume, stage_resume
+from app.services.job_queue import enqueue_job
+from app.services.pagination import decode_cursor, encode_cursor
+from app.services.resume_store import (
+    adopt_streamed_resume,
+    incoming_key,
+    link_resume,
+    store_resume,
+    unlink_resume,
+)
+from app.services.resume_text import schedule_resume_extraction
+from app.services.serialization import CAREER_USER_COLUMNS
+from app.services.storage import storage
+from app.services.streaming_form import parse_streaming_form
+from app.services.user_count import CountMode, active_user_counter
+from app.core.cache import build_cache
+from app.core.config import settings
 from app.core.logging import logging
+import os
 from typing import Optional
 
+# Profile snapshots for GET /careers/{id}, keyed by the numeric id
+profile_cache = build_cache("careers_user")
 
-async def generate_user_id(db: AsyncSession) -> str:
-    """Generate a unique user ID."""
+
+def conflict_detail(rows, email: str, mobile: str) -> str:
+    if any(row.email == email for row in rows):
+        return "Email already registered"
+    if any(row.mobile == mobile for row in rows):
+        return "Mobile number already registered"
+    return "User already registered"
+
+
+async def registration_conflict(db: AsyncSession, email: str, mobile: str) -> HTTPException:
+    """Work out which unique column an insert collided with.
+
+    Only runs after ON CONFLICT skipped the insert, so the happy path never
+    pays for it.
+    """
+    result = await db.execute(
+        select(CareersUsers.email, CareersUsers.mobile).where(
+            or_(CareersUsers.email == email, CareersUsers.mobile == mobile)
+        )
+    )
+    detail = conflict_detail(result.all(), email, mobile)
+    logging.warning(f"Registration conflict: {detail}.")
+    return HTTPException(status_code=409, detail=detail)
+
+
+async def check_not_registered(
+    db: AsyncSession, email: Optional[str], mobile: Optional[str]
+):
+    """Reject a known email or mobile before any resume bytes are stored.
+
+    Only an early exit for streamed registrations: a concurrent insert can
+    still slip in afterwards, and ON CONFLICT remains the real guard.
+    """
+    taken = [
+        column == value
+        for column, value in ((CareersUsers.email, email), (CareersUsers.mobile, mobile))
+        if value
+    ]
+    if not taken:
+        return
+    result = await db.execute(
+        select(CareersUsers.email, CareersUsers.mobile).where(or_(*taken)).limit(2)
+    )
+    rows = result.all()
+    if rows:
+        detail = conflict_detail(rows, email, mobile)
+        logging.warning(f"Registration rejected before upload: {detail}.")
+        raise HTTPException(status_code=409, detail=detail)
+
+
+async def insert_careeruser(
+    db: AsyncSession,
+    name: str,
+    email: str,
+    mobile: str,
+    resume_url: Optional[str],
+    commit: bool = True,
+) -> CareersUsers:
+    """Insert a user in one INSERT ... ON CONFLICT DO NOTHING RETURNING.
+
+    user_id comes from the column's server default (the
+    careersusers_user_id_seq sequence) and is read back by RETURNING, so
+    registration needs no separate round trip to mint it. A unique
+    violation on email or mobile returns no row instead of raising, and is
+    reported as a 409. With ``commit=False`` the caller can
+    enqueue jobs for the new row in the same transaction before committing,
+    and must invalidate active_user_counter once its commit succeeds.
+    """
+    logging.info("Creating a new user record in the database.")
+    result = await db.execute(
+        insert(CareersUsers)
+        .values(
+            name=name,
+            email=email,
+            mobile=mobile,
+            resume_filename=resume_url,
+            is_active=True,
+        )
+        .on_conflict_do_nothing()
+        .returning(CareersUsers)
+    )
+    new_user = result.scalar_one_or_none()
+    if new_user is None:
+        conflict = await registration_conflict(db, email, mobile)
+        await db.rollback()
+        raise conflict
+
+    if commit:
+        await db.commit()
+        active_user_counter.invalidate()
+    logging.info("User created successfully.")
+    return new_user
+
+
+def enqueue_registration_email(db: AsyncSession, user: CareersUsers):
+    if settings.JOB_QUEUE_ENABLED:
+        enqueue_job(
+            db,
+            "send_registration_email",
+            {"user_id": user.user_id, "name": user.name, "email": user.email},
+        )
+
+
+async def create_careeruser_queued(
+    db: AsyncSession, name: str, email: str, mobile: str, resume_file: UploadFile
+) -> CareersUsers:
+    """Stage the resume locally, insert the user and hand the rest to workers.
+
+    The row (with no resume URL yet) and its upload/email jobs commit in one
+    transaction; the upload job fills in resume_filename and then queues
+    text extraction.
+    """
+    logging.info("Staging resume for background upload.")
+    staged_path = await stage_resume(resume_file)
     try:
-        result = await db.execute(
-            select(CareersUsers).order_by(CareersUsers.id.desc()).limit(1)
+        new_user = await insert_careeruser(db, name, email, mobile, None, commit=False)
+        enqueue_job(
+            db,
+            "upload_resume",
+            {
+                "careersuser_id": new_user.id,
+                "staged_path": staged_path,
+                "filename": resume_file.filename,
+                "content_type": resume_file.content_type,
+            },
         )
-        latest_user = result.scalar_one_or_none()
-        if latest_user:
-            last_id = int(latest_user.user_id.split("_")[-1])
-            return f"user_{last_id + 1}"
-        return "user_1"
-    except Exception as e:
-        logging.error(f"Error generating user ID: {e}")
-        raise HTTPException(status_code=500, detail="Error generating user ID")
+        enqueue_registration_email(db, new_user)
+        await db.commit()
+        active_user_counter.invalidate()
+    except BaseException:
+        discard_staged_resume(staged_path)
+        raise
+    logging.info("User created; resume upload queued.")
+    return new_user
 
 
 async def create_careeruser(
@@ -29,70 +172,155 @@ async def create_careeruser(
 ) -> CareersUsers:
     """Create a new career user record."""
     try:
-        logging.info("Checking if the email and mobile already exist in the database.")
-        existing_user = await db.execute(
-            select(CareersUsers).filter(
-                and_(CareersUsers.email == email, CareersUsers.mobile == mobile)
-            )
+        if settings.JOB_QUEUE_ENABLED:
+            return await create_careeruser_queued(db, name, email, mobile, resume_file)
+
+        logging.info("Storing resume.")
+        stored = await store_resume(
+            db, resume_file.file, resume_file.filename, resume_file.content_type
         )
-        user = existing_user.scalar_one_or_none()
 
-        if user:
-            logging.warning("Both email and mobile number already exist.")
-            raise HTTPException(
-                status_code=400, detail="Both email and mobile number already exist"
-            )
+        # On a 409 the blob stays: it is shared content, not this user's object
+        new_user = await insert_careeruser(
+            db, name, email, mobile, stored.url, commit=False
+        )
+        await link_resume(db, new_user.id, stored.sha256, resume_file.filename)
+        schedule_resume_extraction(db, new_user.id, stored.key)
+        await db.commit()
+        active_user_counter.invalidate()
+        return new_user
 
-        logging.info("Generating a new user ID.")
-        user_id = await generate_user_id(db)
+    except HTTPException as http_exc:
+        logging.error(f"HTTP Exception: {http_exc.detail}")
+        raise http_exc
 
-        logging.info("Uploading resume to S3.")
-        resume_filename = f"{user_id}_{resume_file.filename}"
-        resume_url = await upload_file_to_s3(resume_file, resume_filename)
+    except Exception as e:
+        logging.exception("Unexpected error during user creation.")
+        raise HTTPException(status_code=500, detail="Error during user creation")
 
-        logging.info("Creating a new user record in the database.")
-        new_user = CareersUsers(
-            user_id=user_id,
-            name=name,
-            email=email,
-            mobile=mobile,
-            resume_filename=resume_url,
-            is_active=True,
+
+async def create_careeruser_streaming(db: AsyncSession, request: Request):
+    """Create a career user from a raw multipart request, streaming the resume.
+
+    The resume is piped to storage while the body is still arriving, so the form
+    fields may come before or after the file. Fields sent first let a known
+    email or mobile be rejected before the upload starts. Returns the new
+    user and the uploaded file's size/hash.
+    """
+    try:
+        upload = {}
+
+        async def open_writer(filename: str, content_type: Optional[str], fields: dict):
+            await check_not_registered(db, fields.get("email"), fields.get("mobile"))
+            # End the read-only transaction so no connection is held while
+            # the resume uploads
+            await db.rollback()
+            upload["filename"], upload["content_type"] = filename, content_type
+            return storage.open_writer(incoming_key(), content_type)
+
+        fields, streamed = await parse_streaming_form(request, "resume_file", open_writer)
+
+        missing = [f for f in ("name", "email", "mobile") if not fields.get(f)]
+        if streamed is None:
+            missing.append("resume_file")
+        if missing:
+            if streamed is not None:
+                await storage.delete(streamed.key)
+            raise HTTPException(
+                status_code=400, detail=f"Missing required fields: {', '.join(missing)}"
+            )
+
+        stored = await adopt_streamed_resume(
+            db, streamed, upload["filename"], upload["content_type"]
         )
-        db.add(new_user)
+        new_user = await insert_careeruser(
+            db,
+            fields["name"],
+            fields["email"],
+            fields["mobile"],
+            stored.url,
+            commit=False,
+        )
+        await link_resume(db, new_user.id, stored.sha256, upload["filename"])
+        enqueue_registration_email(db, new_user)
+        schedule_resume_extraction(db, new_user.id, stored.key)
         await db.commit()
-        await db.refresh(new_user)
-        logging.info("User created successfully.")
-        return new_user
+        active_user_counter.invalidate()
+        return new_user, streamed
 
     except HTTPException as http_exc:
         logging.error(f"HTTP Exception: {http_exc.detail}")
         raise http_exc
 
     except Exception as e:
-        logging.exception("Unexpected error during user creation.")
+        logging.exception("Unexpected error during streaming user creation.")
         raise HTTPException(status_code=500, detail="Error during user creation")
 
 
-async def get_all_users(db: AsyncSession, skip: int = 0, limit: int = 10):
+async def get_users_by_cursor(
+    db: AsyncSession,
+    after: Optional[str] = None,
+    limit: int = 10,
+    count_mode: CountMode = "cached",
+):
+    """Keyset page of active users, newest first.
+
+    Seeks straight to ``id < cursor`` on ix_careersusers_active_id, so a deep
+    page costs the same as the first one. Returns the users, the total count
+    and the cursor for the next page (None on the last page). Users are
+    plain row mappings of CAREER_USER_COLUMNS, not ORM instances.
+    """
+    try:
+        logging.info(f"Fetching users with after={after}, limit={limit}")
+        query = (
+            select(*CAREER_USER_COLUMNS)
+            .where(CareersUsers.is_active)
+            .order_by(CareersUsers.id.desc())
+            .limit(limit + 1)
+        )
+        if after:
+            query = query.where(CareersUsers.id < decode_cursor(after, id=int)["id"])
+
+        result = await db.execute(query)
+        users = result.mappings().all()
+
+        next_cursor = None
+        if len(users) > limit:
+            users = users[:limit]
+            next_cursor = encode_cursor({"id": users[-1]["id"]})
+
+        total_count = await active_user_counter.get(db, count_mode)
+
+        logging.info(
+            f"Successfully retrieved {len(users)} users. Total count: {total_count}"
+        )
+        return users, total_count, next_cursor
+
+    except HTTPException:
+        raise
+
+    except Exception as e:
+        logging.error(f"Failed to fetch users: {str(e)}", exc_info=True)
+        raise HTTPException(status_code=500, detail="Failed to fetch users.")
+
+
+async def get_all_users(
+    db: AsyncSession, skip: int = 0, limit: int = 10, count_mode: CountMode = "cached"
+):
     try:
         logging.info(f"Fetching users with skip={skip}, limit={limit}")
 
-        # Fetch active users with pagination
+        # Fetch active users with pagination, as plain rows
         result = await db.execute(
-            select(CareersUsers)
+            select(*CAREER_USER_COLUMNS)
             .where(CareersUsers.is_active == True)
             .order_by(CareersUsers.id.desc())
             .offset(skip)
             .limit(limit)
         )
-        users = result.scalars().all()
+        users = result.mappings().all()
 
-        # Get the total count of active users
-        total_count_result = await db.execute(
-            select(func.count(CareersUsers.id)).where(CareersUsers.is_active == True)
-        )
-        total_count = total_count_result.scalar()
+        total_count = await active_user_counter.get(db, count_mode)
 
         logging.info(
             f"Successfully retrieved {len(users)} users. Total count: {total_count}"
@@ -104,24 +332,159 @@ async def get_all_users(db: AsyncSession, skip: int = 0, limit: int = 10):
         raise HTTPException(status_code=500, detail="Failed to fetch users.")
 
 
-async def get_careeruser_by_id(db: AsyncSession, id: int):
+def escape_like(value: str) -> str:
+    return value.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_")
+
+
+async def search_users(
+    db: AsyncSession, q: str, limit: int = 10, after: Optional[str] = None
+):
+    """Ranked prefix + fuzzy search over active users' name, email and mobile.
+
+    Prefix matches rank above fuzzy (trigram similarity) matches; both are
+    answered from the gin_trgm_ops indexes. Pages are keyset-paginated on
+    (score, id), so the cursor stays cheap however deep a recruiter goes.
+    """
+    try:
+        logging.info(f"Searching users with q={q!r}, limit={limit}, after={after}")
+        prefix = f"{escape_like(q)}%"
+        prefix_match = or_(
+            CareersUsers.name.ilike(prefix, escape="\\"),
+            CareersUsers.email.ilike(prefix, escape="\\"),
+            CareersUsers.mobile.like(prefix, escape="\\"),
+        )
+        score = (
+            case((prefix_match, 1.0), else_=0.0)
+            + func.greatest(
+                func.similarity(CareersUsers.name, q),
+                func.similarity(CareersUsers.email, q),
+                func.similarity(CareersUsers.mobile, q),
+            )
+        ).label("score")
+
+        query = (
+            select(*CAREER_USER_COLUMNS, score)
+            .where(
+                CareersUsers.is_active,
+                or_(
+                    prefix_match,
+                    CareersUsers.name.op("%")(q),
+                    CareersUsers.email.op("%")(q),
+                    CareersUsers.mobile.op("%")(q),
+                ),
+            )
+            .order_by(score.desc(), CareersUsers.id.desc())
+            .limit(limit + 1)
+        )
+        if after:
+            position = decode_cursor(after, score=float, id=int)
+            query = query.where(
+                tuple_(score, CareersUsers.id) < tuple_(position["score"], position["id"])
+            )
+
+        rows = (await db.execute(query)).mappings().all()
+        next_cursor = None
+        if len(rows) > limit:
+            rows = rows[:limit]
+            next_cursor = encode_cursor({"score": rows[-1]["score"], "id": rows[-1]["id"]})
+
+        logging.info(f"Search for {q!r} returned {len(rows)} users.")
+        return rows, next_cursor
+
+    except HTTPException:
+        raise
+
+    except Exception as e:
+        logging.error(f"Failed to search users: {str(e)}", exc_info=True)
+        raise HTTPException(status_code=500, detail="Failed to search users.")
+
+
+async def get_careeruser_by_id(db: AsyncSession, id: int) -> Optional[CareerUserResponse]:
+    """Read-through lookup of a user's profile snapshot.
+
+    Returns a CareerUserResponse rather than the ORM row so the value can be
+    served from profile_cache; writes go through update_careeruser and
+    soft_delete_careeruser, which invalidate it. Reads from a replica
+    session are served but not cached.
+    """
     try:
         logging.info(f"Fetching user with ID: {id}")
 
+        cached = await profile_cache.get(id)
+        if cached is not None:
+            return CareerUserResponse.model_validate(cached)
+        version = profile_cache.version()
+
         # Fetch user by ID
         user = await db.get(CareersUsers, id)
         if not user:
             logging.warning(f"User with ID {id} not found")
             return None
 
+        snapshot = CareerUserResponse.model_validate(user)
+        # A lagging replica could put back a row an update just invalidated
+        if not db.info.get("replica"):
+            await profile_cache.set(id, snapshot.model_dump(mode="json"), version=version)
         logging.info(f"Successfully retrieved user: {user.id}")
-        return user
+        return snapshot
 
     except Exception as e:
         logging.error(f"Error retrieving user by ID {id}: {str(e)}", exc_info=True)
         raise HTTPException(status_code=500, detail=f"Error retrieving user: {str(e)}")
 
 
+async def get_resume_download(db: AsyncSession, id: int):
+    """Storage key, original file name and content type of a user's resume.
+
+    Resumes stored before resume_blobs existed (or uploaded presigned) have
+    no blob link; their key is recovered from resume_filename.
+    """
+    result = await db.execute(
+        select(
+            CareersUsers.resume_filename,
+            ResumeBlob.key,
+            ResumeBlob.content_type,
+            CareersUserResume.filename,
+        )
+        .select_from(CareersUsers)
+        .outerjoin(CareersUserResume, CareersUserResume.careersuser_id == CareersUsers.id)
+        .outerjoin(ResumeBlob, ResumeBlob.sha256 == CareersUserResume.sha256)
+        .where(CareersUsers.id == id, CareersUsers.is_active == True)
+    )
+    row = result.one_or_none()
+    if row is None:
+        raise HTTPException(status_code=404, detail="User not found")
+    if row.key:
+        return row.key, row.filename, row.content_type
+
+    key = storage.key_from_url(row.resume_filename)
+    if key is None:
+        raise HTTPException(status_code=404, detail="Resume not found")
+    return key, os.path.basename(key), None
+
+
+async def get_careeruser_etag(db: AsyncSession, id: int) -> Optional[str]:
+    """ETag of a user's profile without loading the row.
+
+    Taken from the cached snapshot when there is one, otherwise from a
+    primary key lookup of the two timestamp columns.
+    """
+    cached = await profile_cache.get(id)
+    if cached is not None:
+        snapshot = CareerUserResponse.model_validate(cached)
+        return user_etag(snapshot.id, snapshot.created_on, snapshot.updated_on)
+
+    result = await db.execute(
+        select(CareersUsers.created_on, CareersUsers.updated_on).where(
+            CareersUsers.id == id
+        )
+    )
+    row = result.one_or_none()
+    if row is None:
+        return None
+    return user_etag(id, row.created_on, row.updated_on)
+
+
 async def update_careeruser(
     db: AsyncSession, id: int, update_data: dict, file: Optional[UploadFile] = None
 ) -> CareersUsers:
@@ -141,13 +504,16 @@ async def update_careeruser(
 
         logging.info(f"User found with ID: {id}. Proceeding with update.")
 
-        # Upload new resume file if provided
+        # Store the new resume file if provided
+        stored = None
         if file:
             try:
-                file_name = f"{user.user_id}_{file.filename}"
-                file_url = await upload_file_to_s3(file, file_name)
-                user.resume_filename = file_url
-                logging.info(f"File uploaded successfully: {file_url}")
+                stored = await store_resume(db, file.file, file.filename, file.content_type)
+                user.resume_filename = stored.url
+                await link_resume(db, user.id, stored.sha256, file.filename)
+                logging.info(f"File stored successfully: {stored.url}")
+            except HTTPException:
+                raise
             except Exception as e:
                 logging.error(f"Error uploading file: {e}")
                 raise HTTPException(status_code=500, detail="File upload failed")
@@ -159,11 +525,148 @@ async def update_careeruser(
             else:
                 logging.warning(f"Attempted to update invalid field: {key}")
 
+        if stored:
+            schedule_resume_extraction(db, user.id, stored.key)
+
         # Commit the changes to the database
         await db.commit()
         await db.refresh(user)
+        active_user_counter.invalidate()
+        await profile_cache.invalidate(id)
+
+        logging.info(f"User with ID: {id} updated successfully.")
+        return user
+
+    except HTTPException as e:
+        logging.error(f"HTTP Exception occurred: {e.detail}")
+        raise e
+
+    except Exception as e:
+        logging.error(f"Unexpected error occurred: {e}")
+        raise HTTPException(status_code=500, detail="An unexpected error occurred")
+
+
+async def update_careeruser_streaming(db: AsyncSession, id: int, request: Request):
+    """Update a career user from a raw multipart request, streaming any new resume."""
+    try:
+        result = await db.execute(
+            select(CareersUsers).filter(
+                CareersUsers.id == id, CareersUsers.is_active == True
+            )
+        )
+        user = result.scalar_one_or_none()
+
+        if not user:
+            raise HTTPException(status_code=404, detail="User not found")
+
+        upload = {}
+
+        async def open_writer(filename: str, content_type: Optional[str], fields: dict):
+            upload["filename"], upload["content_type"] = filename, content_type
+            return storage.open_writer(incoming_key(), content_type)
+
+        fields, streamed = await parse_streaming_form(request, "resume_file", open_writer)
+        stored = None
+        if streamed:
+            stored = await adopt_streamed_resume(
+                db, streamed, upload["filename"], upload["content_type"]
+            )
+
+        update_data = {
+            key: fields[key] for key in ("name", "email", "mobile") if fields.get(key)
+        }
+        if fields.get("is_active"):
+            update_data["is_active"] = fields["is_active"].lower() in ("true", "1", "on")
+        for key, value in update_data.items():
+            setattr(user, key, value)
+        if stored:
+            user.resume_filename = stored.url
+            await link_resume(db, user.id, stored.sha256, upload["filename"])
+            schedule_resume_extraction(db, user.id, stored.key)
+            logging.info(f"File stored successfully: {stored.url}")
+
+        await db.commit()
+        await db.refresh(user)
+        active_user_counter.invalidate()
+        await profile_cache.invalidate(id)
 
         logging.info(f"User with ID: {id} updated successfully.")
+        return user, streamed
+
+    except HTTPException as e:
+        logging.error(f"HTTP Exception occurred: {e.detail}")
+        raise e
+
+    except Exception as e:
+        logging.error(f"Unexpected error occurred: {e}")
+        raise HTTPException(status_code=500, detail="An unexpected error occurred")
+
+
+async def get_active_careeruser(db: AsyncSession, id: int) -> CareersUsers:
+    result = await db.execute(
+        select(CareersUsers).filter(CareersUsers.id == id, CareersUsers.is_active == True)
+    )
+    user = result.scalar_one_or_none()
+    if not user:
+        raise HTTPException(status_code=404, detail="User not found")
+    return user
+
+
+async def presign_resume_upload(
+    db: AsyncSession, id: int, filename: str, content_type: str
+) -> dict:
+    """Presigned POST for uploading a user's resume straight to S3.
+
+    The bytes never pass through this service; the client calls
+    ``confirm_resume_upload`` once S3 has accepted them.
+    """
+    if content_type not in settings.RESUME_ALLOWED_CONTENT_TYPES:
+        raise HTTPException(status_code=415, detail="Unsupported resume content type")
+    filename = os.path.basename(filename.replace("\\", "/"))
+    if not filename:
+        raise HTTPException(status_code=400, detail="Invalid resume filename")
+
+    user = await get_active_careeruser(db, id)
+    file_name = f"{user.user_id}_{filename}"
+    presigned = storage.presigned_upload(file_name, content_type)
+    logging.info(f"Issued presigned resume upload for user {id}: {file_name}")
+    return {
+        "key": file_name,
+        "url": presigned["url"],
+        "fields": presigned["fields"],
+        "expires_in": settings.PRESIGNED_URL_EXPIRES_SECONDS,
+    }
+
+
+async def confirm_resume_upload(db: AsyncSession, id: int, key: str) -> CareersUsers:
+    """Point a user's record at a resume uploaded with a presigned POST.
+
+    The object is checked with a HEAD request; S3 already enforced the
+    size and type conditions of the policy, so this guards against keys
+    that were never uploaded or belong to another user.
+    """
+    try:
+        user = await get_active_careeruser(db, id)
+        if not key.startswith(f"{user.user_id}_") or "/" in key:
+            raise HTTPException(status_code=400, detail="Resume key does not belong to this user")
+
+        stored = await storage.stat(key)
+        if stored is None:
+            raise HTTPException(status_code=404, detail="Uploaded resume not found")
+        if not 0 < stored["size"] <= settings.MAX_RESUME_SIZE_BYTES:
+            raise HTTPException(status_code=413, detail="Uploaded resume has an invalid size")
+        if stored["content_type"] not in settings.RESUME_ALLOWED_CONTENT_TYPES:
+            raise HTTPException(status_code=415, detail="Unsupported resume content type")
+
+        user.resume_filename = storage.url(key)
+        # Presigned uploads bypass resume_blobs, so the old link is stale
+        await unlink_resume(db, user.id)
+        schedule_resume_extraction(db, user.id, key)
+        await db.commit()
+        await db.refresh(user)
+        await profile_cache.invalidate(id)
+
+        logging.info(f"Confirmed presigned resume upload for user {id}: {key}")
         return user
 
     except HTTPException as e:
@@ -191,6 +694,8 @@ async def soft_delete_careeruser(db: AsyncSession, id: int):
         # Mark the user as inactive (soft delete)
         user.is_active = False
         await db.commit()
+        active_user_counter.invalidate()
+        await profile_cache.invalidate(id)
 
         logging.info(f"User with id: {id} soft deleted successfully.")
         return {"message": "User soft deleted successfully"}
@@ -0,0 +1,48 @@
+import hashlib
+from datetime import datetime
+from typing import Optional
+from fastapi import Request, Response
+
+# Clients must revalidate, but may reuse their copy after a 304
+REVALIDATE = "no-cache"
+
+
+def make_etag(*parts) -> str:
+    digest = hashlib.blake2b(
+        "|".join(str(part) for part in parts).encode(), digest_size=12
+    ).hexdigest()
+    return f'W/"{digest}"'
+
+
+def user_etag(id: int, created_on: datetime, updated_on: Optional[datetime]) -> str:
+    """ETag of one user's profile; every write sets updated_on."""
+    return make_etag("user", id, (updated_on or created_on).isoformat())
+
+
+def etag_matches(request: Request, etag: str) -> bool:
+    """Weak If-None-Match comparison, as RFC 9110 requires for GET."""
+    header = request.headers.get("if-none-match")
+    if not header:
+        return False
+    if header.strip() == "*":
+        return True
+    wanted = etag.removeprefix("W/")
+    return any(tag.strip().removeprefix("W/") == wanted for tag in header.split(","))
+
+
+def not_modified(etag: str) -> Response:
+    return Response(status_code=304, headers={"ETag": etag, "Cache-Control": REVALIDATE})
+
+
+def listing_etag(count_mode: str, total, users, next_cursor: Optional[str]) -> str:
+    """ETag of a listing page, derived from exactly what the page returns.
+
+    Every field of every row goes in, along with the total and where it
+    came from, so a cached or estimated total (which can lag the rows) and
+    rows from a lagging replica each get their own tag. Computing it costs
+    a pass over rows already in memory; a 304 saves serialization and the
+    transfer, not the query.
+    """
+    return make_etag(
+        "listing", count_mode, total, next_cursor, *(tuple(user.values()) for user in users)
+    )
@@ -0,0 +1,108 @@
+import asyncio
+import os
+import shutil
+import smtplib
+import uuid
+from email.message import EmailMessage
+from email.utils import formataddr
+from fastapi import UploadFile
+from fastapi.concurrency import run_in_threadpool
+from sqlalchemy import update
+from app.core.config import settings
+from app.core.database import async_session
+from app.core.logging import logging
+from app.models.careersModel import CareersUsers
+from app.services.job_queue import dead_job_handler, job_handler
+from app.services.resume_text import extract_and_store, schedule_resume_extraction
+from app.services.resume_store import link_resume, store_resume
+
+
+def _copy_to_staging(file: UploadFile) -> str:
+    os.makedirs(settings.RESUME_STAGING_DIR, exist_ok=True)
+    staged_path = os.path.join(
+        settings.RESUME_STAGING_DIR,
+        f"{uuid.uuid4().hex}_{os.path.basename(file.filename or 'resume')}",
+    )
+    file.file.seek(0)
+    with open(staged_path, "wb") as staged:
+        shutil.copyfileobj(file.file, staged)
+    return staged_path
+
+
+async def stage_resume(file: UploadFile) -> str:
+    """Copy an uploaded resume to RESUME_STAGING_DIR for the upload job.
+
+    The job may run on any worker, so the directory must be shared by every
+    host running the API or `python -m app.worker`.
+    """
+    return await run_in_threadpool(_copy_to_staging, file)
+
+
+def discard_staged_resume(staged_path: str):
+    try:
+        os.remove(staged_path)
+    except FileNotFoundError:
+        pass
+
+
+@job_handler("upload_resume")
+async def upload_resume(payload: dict):
+    """Store a staged resume and point the user's record at it."""
+    staged_path = payload["staged_path"]
+    # Jobs queued before content-addressed storage only carry the old key
+    filename = payload.get("filename") or payload["key"]
+    async with async_session() as db:
+        with open(staged_path, "rb") as staged:
+            stored = await store_resume(db, staged, filename, payload.get("content_type"))
+        await db.execute(
+            update(CareersUsers)
+            .where(CareersUsers.id == payload["careersuser_id"])
+            .values(resume_filename=stored.url)
+        )
+        await link_resume(db, payload["careersuser_id"], stored.sha256, filename)
+        schedule_resume_extraction(db, payload["careersuser_id"], stored.key)
+        await db.commit()
+
+    # Only removed once the record is updated, so a retry can re-upload it
+    await run_in_threadpool(discard_staged_resume, staged_path)
+    logging.info(f"Staged resume stored at {stored.url}.")
+
+
+@dead_job_handler("upload_resume")
+async def discard_dead_upload(payload: dict):
+    """No retry will read the staged copy again; replaying the dead job
+    needs the resume uploaded anew."""
+    await run_in_threadpool(discard_staged_resume, payload["staged_path"])
+    logging.info(f"Discarded staged resume of a dead upload: {payload['staged_path']}")
+
+
+@job_handler("extract_resume_text")
+async def extract_resume_text(payload: dict):
+    await extract_and_store(payload["careersuser_id"], payload["key"])
+
+
+def send_email(to_address: str, subject: str, body: str):
+    message = EmailMessage()
+    message["From"] = formataddr((settings.MAIN_FROM_NAME, settings.EMAIL_HOST_USER))
+    message["To"] = to_address
+    message["Subject"] = subject
+    message.set_content(body)
+
+    with smtplib.SMTP(settings.EMAIL_HOST, settings.EMAIL_PORT, timeout=30) as smtp:
+        if settings.EMAIL_USE_TLS:
+            smtp.starttls()
+        if settings.EMAIL_HOST_USER:
+            smtp.login(settings.EMAIL_HOST_USER, settings.EMAIL_HOST_PASSWORD)
+        smtp.send_message(message)
+
+
+@job_handler("send_registration_email")
+async def send_registration_email(payload: dict):
+    body = (
+        f"Hi {payload['name']},\n\n"
+        f"Thank you for registering. Your candidate ID is {payload['user_id']}.\n"
+        "We will get in touch once we have reviewed your resume.\n\n"
+        f"{settings.MAIN_FROM_NAME}"
+    )
+    await asyncio.to_thread(send_email, payload["email"], "Registration received", body)
+    logging.info(f"Registration email sent for {payload['user_id']}.")
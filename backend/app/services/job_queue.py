@@ -0,0 +1,188 @@
+import asyncio
+import random
+import traceback
+from datetime import timedelta
+from sqlalchemy import delete, func, or_, select, update
+from sqlalchemy.ext.asyncio import AsyncSession
+from app.core.config import settings
+from app.core.database import async_session
+from app.core.logging import logging
+from app.models.jobModel import DeadJob, Job
+
+# kind -> async handler(payload: dict); filled by app.services.job_handlers
+JOB_HANDLERS = {}
+# kind -> async cleanup(payload: dict), run once a job of that kind is
+# dead-lettered; for resources (staged files, ...) no retry will use again
+DEAD_JOB_HANDLERS = {}
+
+
+def job_handler(kind: str):
+    def register(func):
+        JOB_HANDLERS[kind] = func
+        return func
+
+    return register
+
+
+def dead_job_handler(kind: str):
+    def register(func):
+        DEAD_JOB_HANDLERS[kind] = func
+        return func
+
+    return register
+
+
+def enqueue_job(
+    db: AsyncSession, kind: str, payload: dict, max_attempts: int = None
+) -> Job:
+    """Add a job to the caller's transaction.
+
+    Nothing runs until the caller commits, so a job is never picked up for
+    a row whose insert was rolled back (and never lost if the insert sticks).
+    """
+    job = Job(
+        kind=kind,
+        payload=payload,
+        attempts=0,
+        max_attempts=max_attempts or settings.JOB_MAX_ATTEMPTS,
+    )
+    db.add(job)
+    logging.info(f"Enqueued job '{kind}'.")
+    return job
+
+
+class ClaimedJob:
+    def __init__(self, job: Job):
+        self.id = job.id
+        self.kind = job.kind
+        self.payload = job.payload
+        self.attempts = job.attempts
+        self.max_attempts = job.max_attempts
+        self.created_on = job.created_on
+
+
+async def claim_job(db: AsyncSession):
+    """Lease the next due job, skipping rows other workers hold locked.
+
+    The lease (locked_at) lasts JOB_LEASE_SECONDS; a worker that dies
+    mid-job leaves it to be reclaimed after that, as another attempt.
+    """
+    lease_expired = func.now() - timedelta(seconds=settings.JOB_LEASE_SECONDS)
+    due = (
+        select(Job.id)
+        .where(
+            Job.run_after <= func.now(),
+            or_(Job.locked_at.is_(None), Job.locked_at < lease_expired),
+        )
+        .order_by(Job.run_after)
+        .limit(1)
+        .with_for_update(skip_locked=True)
+    )
+    result = await db.execute(
+        update(Job)
+        .where(Job.id.in_(due))
+        .values(locked_at=func.now(), attempts=Job.attempts + 1)
+        .returning(Job)
+        .execution_options(synchronize_session=False)
+    )
+    job = result.scalar_one_or_none()
+    claimed = ClaimedJob(job) if job is not None else None
+    await db.commit()
+    return claimed
+
+
+async def complete_job(db: AsyncSession, job: ClaimedJob):
+    await db.execute(delete(Job).where(Job.id == job.id))
+    await db.commit()
+
+
+async def fail_job(db: AsyncSession, job: ClaimedJob, error: str) -> bool:
+    """Schedule a retry with exponential backoff, or dead-letter the job.
+
+    Returns True when the job was dead-lettered.
+    """
+    dead = job.attempts >= job.max_attempts
+    if dead:
+        db.add(
+            DeadJob(
+                id=job.id,
+                kind=job.kind,
+                payload=job.payload,
+                attempts=job.attempts,
+                last_error=error,
+                created_on=job.created_on,
+            )
+        )
+        await db.execute(delete(Job).where(Job.id == job.id))
+        logging.error(f"Job {job.id} ({job.kind}) moved to dead_jobs: {error}")
+    else:
+        delay = min(
+            settings.JOB_RETRY_BASE_SECONDS * 2 ** (job.attempts - 1),
+            settings.JOB_RETRY_MAX_SECONDS,
+        ) * random.uniform(0.8, 1.2)
+        await db.execute(
+            update(Job)
+            .where(Job.id == job.id)
+            .values(
+                locked_at=None,
+                run_after=func.now() + timedelta(seconds=delay),
+                last_error=error,
+            )
+        )
+        logging.warning(
+            f"Job {job.id} ({job.kind}) failed attempt {job.attempts}, "
+            f"retrying in {delay:.0f}s: {error}"
+        )
+    await db.commit()
+    return dead
+
+
+async def run_job(job: ClaimedJob):
+    handler = JOB_HANDLERS.get(job.kind)
+    try:
+        if handler is None:
+            raise LookupError(f"No handler registered for job kind '{job.kind}'")
+        await handler(job.payload)
+    except Exception as e:
+        error = "".join(traceback.format_exception_only(type(e), e)).strip()
+        async with async_session() as db:
+            dead = await fail_job(db, job, error[:2000])
+        cleanup = DEAD_JOB_HANDLERS.get(job.kind)
+        if dead and cleanup is not None:
+            try:
+                await cleanup(job.payload)
+            except Exception as e:
+                logging.error(f"Cleanup of dead job {job.id} ({job.kind}) failed: {e}")
+        return
+    async with async_session() as db:
+        await complete_job(db, job)
+    logging.info(f"Job {job.id} ({job.kind}) completed.")
+
+
+async def run_worker(stop: asyncio.Event, concurrency: int = None):
+    """Process jobs until ``stop`` is set, ``concurrency`` at a time."""
+
+    async def worker_loop():
+        while not stop.is_set():
+            try:
+                async with async_session() as db:
+                    job = await claim_job(db)
+            except Exception as e:
+                logging.error(f"Failed to claim a job: {e}")
+                job = None
+            if job is None:
+                try:
+                    await asyncio.wait_for(stop.wait(), settings.JOB_POLL_SECONDS)
+                except asyncio.TimeoutError:
+                    pass
+                continue
+            try:
+                await run_job(job)
+            except Exception as e:
+                # Its lease expires and another claim retries it
+                logging.error(f"Job {job.id} ({job.kind}) could not be settled: {e}")
+
+    concurrency = concurrency or settings.JOB_WORKER_CONCURRENCY
+    logging.info(f"Job worker started with concurrency {concurrency}.")
+    await asyncio.gather(*(worker_loop() for _ in range(concurrency)))
+    logging.info("Job worker stopped.")
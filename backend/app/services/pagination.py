@@ -0,0 +1,43 @@
+import base64
+import binascii
+import json
+import math
+from fastapi import HTTPException
+
+
+def encode_cursor(position: dict) -> str:
+    """Opaque, URL-safe token for a keyset position such as ``{"id": 42}``."""
+    raw = json.dumps(position, separators=(",", ":")).encode()
+    return base64.urlsafe_b64encode(raw).rstrip(b"=").decode()
+
+
+# Cursor ids are compared with Postgres integer columns
+MAX_CURSOR_ID = 2**31 - 1
+
+
+def _valid(value, kind: type) -> bool:
+    if isinstance(value, bool):
+        return False
+    if kind is int:
+        return isinstance(value, int) and abs(value) <= MAX_CURSOR_ID
+    if kind is float:
+        return isinstance(value, (int, float)) and math.isfinite(value)
+    return isinstance(value, kind)
+
+
+def decode_cursor(token: str, **keys: type) -> dict:
+    """Position of an encode_cursor token, e.g. ``decode_cursor(t, id=int)``.
+
+    A token that does not hold every key with a value of its type is a 400,
+    never a database error.
+    """
+    try:
+        padded = token + "=" * (-len(token) % 4)
+        position = json.loads(base64.urlsafe_b64decode(padded))
+        if not isinstance(position, dict) or not all(
+            _valid(position.get(key), kind) for key, kind in keys.items()
+        ):
+            raise ValueError("missing or mistyped cursor keys")
+        return position
+    except (ValueError, binascii.Error, UnicodeDecodeError):
+        raise HTTPException(status_code=400, detail="Invalid pagination cursor")
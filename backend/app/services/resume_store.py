@@ -0,0 +1,216 @@
+import hashlib
+import os
+import uuid
+from datetime import timedelta
+from typing import Optional
+from fastapi import HTTPException
+from fastapi.concurrency import run_in_threadpool
+from sqlalchemy import delete, exists, func, select, update
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.ext.asyncio import AsyncSession
+from app.core.config import settings
+from app.core.logging import logging
+from app.models.resumeBlobModel import CareersUserResume, ResumeBlob
+from app.services.s3_upload import StreamedFile
+from app.services.storage import storage
+
+HASH_CHUNK_SIZE = 1024 * 1024
+
+
+class StoredResume:
+    def __init__(self, sha256: str, key: str, size: int, deduplicated: bool):
+        self.sha256 = sha256
+        self.key = key
+        self.url = storage.url(key)
+        self.size = size
+        self.deduplicated = deduplicated
+
+
+def hash_fileobj(fileobj):
+    """SHA-256 and size of a seekable file object, rewound afterwards."""
+    digest = hashlib.sha256()
+    size = 0
+    for chunk in iter(lambda: fileobj.read(HASH_CHUNK_SIZE), b""):
+        digest.update(chunk)
+        size += len(chunk)
+    fileobj.seek(0)
+    return digest.hexdigest(), size
+
+
+def blob_key(sha256: str, filename: Optional[str]) -> str:
+    # The extension is kept because text extraction picks its parser by it
+    extension = os.path.splitext(filename or "")[1].lower()
+    if len(extension) > 10 or not extension[1:].isalnum():
+        extension = ""
+    return f"resumes/{sha256}{extension}"
+
+
+def incoming_key() -> str:
+    """Temporary key for a streamed upload whose hash is not known yet."""
+    return f"incoming/{uuid.uuid4().hex}"
+
+
+async def find_blobs(db: AsyncSession, sha256s) -> dict:
+    """Keys of the already stored blobs among ``sha256s``, by hash.
+
+    Each hit also refreshes the blob's last_seen_on, so the purge of
+    unreferenced blobs leaves it alone while it is being linked.
+    """
+    if not sha256s:
+        return {}
+    result = await db.execute(
+        update(ResumeBlob)
+        .where(ResumeBlob.sha256.in_(list(sha256s)))
+        .values(last_seen_on=func.now())
+        .returning(ResumeBlob.sha256, ResumeBlob.key)
+        .execution_options(synchronize_session=False)
+    )
+    return {sha256: key for sha256, key in result.all()}
+
+
+async def record_blobs(db: AsyncSession, blobs: list) -> dict:
+    """Register stored objects and return the key holding each hash.
+
+    ``blobs`` are dicts of sha256, key, size and content_type. When a
+    concurrent upload of the same content registered first, its key is
+    returned and the caller's copy is redundant. Not committed here.
+    """
+    if not blobs:
+        return {}
+    await db.execute(
+        insert(ResumeBlob)
+        .values(blobs)
+        .on_conflict_do_nothing(index_elements=[ResumeBlob.sha256])
+    )
+    result = await db.execute(
+        select(ResumeBlob.sha256, ResumeBlob.key).where(
+            ResumeBlob.sha256.in_([blob["sha256"] for blob in blobs])
+        )
+    )
+    return {sha256: key for sha256, key in result.all()}
+
+
+async def register_blob(
+    db: AsyncSession, sha256: str, key: str, size: int, content_type: Optional[str]
+) -> str:
+    """record_blobs for one object, committed, dropping a redundant copy."""
+    recorded = await record_blobs(
+        db, [{"sha256": sha256, "key": key, "size": size, "content_type": content_type}]
+    )
+    await db.commit()
+    if recorded[sha256] != key:
+        await storage.delete(key)
+    return recorded[sha256]
+
+
+async def store_resume(
+    db: AsyncSession, fileobj, filename: Optional[str], content_type: str = None
+) -> StoredResume:
+    """Store a resume under the hash of its content.
+
+    Bytes that were stored before are not uploaded again: the lookup is a
+    primary key read of resume_blobs instead of an S3 round trip. Runs on
+    the caller's session and commits it once the blob is registered, so
+    call it before making changes of your own there; a blob left behind by
+    a failed registration is then simply reused by the next identical upload.
+    """
+    sha256, size = await run_in_threadpool(hash_fileobj, fileobj)
+    if size > settings.MAX_RESUME_SIZE_BYTES:
+        raise HTTPException(
+            status_code=413,
+            detail=f"Resume file exceeds the maximum size of {settings.MAX_RESUME_SIZE_BYTES} bytes.",
+        )
+
+    existing = (await find_blobs(db, [sha256])).get(sha256)
+    if existing:
+        await db.commit()
+        logging.info(f"Resume {sha256} already stored at '{existing}'; upload skipped.")
+        return StoredResume(sha256, existing, size, deduplicated=True)
+
+    # No connection is held while the bytes go to storage
+    await db.commit()
+    key = blob_key(sha256, filename)
+    await storage.save(fileobj, key, content_type)
+    recorded = await register_blob(db, sha256, key, size, content_type)
+    logging.info(f"Resume {sha256} stored at '{recorded}' ({size} bytes).")
+    return StoredResume(sha256, recorded, size, deduplicated=False)
+
+
+async def adopt_streamed_resume(
+    db: AsyncSession, streamed: StreamedFile, filename: Optional[str], content_type: str = None
+) -> StoredResume:
+    """Move a streamed upload (stored under incoming_key()) to its blob.
+
+    The hash is only known once the stream is complete, so the bytes are
+    uploaded either way; a duplicate is dropped, anything new is copied
+    (server-side on S3) to its content-addressed key. Commits the caller's
+    session like store_resume.
+    """
+    existing = (await find_blobs(db, [streamed.sha256])).get(streamed.sha256)
+    await db.commit()
+    if existing:
+        await storage.delete(streamed.key)
+        logging.info(f"Streamed resume {streamed.sha256} already stored at '{existing}'.")
+        return StoredResume(streamed.sha256, existing, streamed.size, deduplicated=True)
+
+    key = blob_key(streamed.sha256, filename)
+    await storage.copy(streamed.key, key)
+    await storage.delete(streamed.key)
+    recorded = await register_blob(db, streamed.sha256, key, streamed.size, content_type)
+    return StoredResume(streamed.sha256, recorded, streamed.size, deduplicated=False)
+
+
+async def link_resume(db: AsyncSession, careersuser_id: int, sha256: str, filename: str):
+    """Make a blob the user's current resume; committed by the caller."""
+    statement = insert(CareersUserResume).values(
+        careersuser_id=careersuser_id, sha256=sha256, filename=filename[:255]
+    )
+    await db.execute(
+        statement.on_conflict_do_update(
+            index_elements=[CareersUserResume.careersuser_id],
+            set_={
+                "sha256": statement.excluded.sha256,
+                "filename": statement.excluded.filename,
+                "uploaded_on": func.now(),
+            },
+        )
+    )
+
+
+async def unlink_resume(db: AsyncSession, careersuser_id: int):
+    """Forget the user's blob, for resumes stored outside resume_blobs."""
+    await db.execute(
+        delete(CareersUserResume).where(CareersUserResume.careersuser_id == careersuser_id)
+    )
+
+
+async def purge_unreferenced_blobs(db: AsyncSession, limit: int = 500) -> int:
+    """Delete blobs no user links to and nobody looked up for
+    RESUME_BLOB_RETENTION_SECONDS, rows first and then their objects.
+
+    They come from replaced resumes and failed registrations. Returns how
+    many were purged; the worker calls it every RESUME_BLOB_PURGE_INTERVAL_SECONDS.
+    """
+    cutoff = func.now() - timedelta(seconds=settings.RESUME_BLOB_RETENTION_SECONDS)
+    unreferenced = (
+        select(ResumeBlob.sha256)
+        .where(
+            ResumeBlob.last_seen_on < cutoff,
+            ~exists().where(CareersUserResume.sha256 == ResumeBlob.sha256),
+        )
+        .limit(limit)
+        .with_for_update(skip_locked=True)
+    )
+    result = await db.execute(
+        delete(ResumeBlob).where(ResumeBlob.sha256.in_(unreferenced)).returning(ResumeBlob.key)
+    )
+    keys = result.scalars().all()
+    await db.commit()
+    for key in keys:
+        try:
+            await storage.delete(key)
+        except Exception as e:
+            logging.error(f"Failed to delete purged resume blob '{key}': {e}")
+    if keys:
+        logging.info(f"Purged {len(keys)} unreferenced resume blobs.")
+    return len(keys)
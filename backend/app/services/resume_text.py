@@ -0,0 +1,215 @@
+import asyncio
+import io
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor
+from typing import Optional
+from sqlalchemy import delete, event, func, literal, select, tuple_
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session
+from fastapi import HTTPException
+from app.core.config import settings
+from app.core.database import async_session
+from app.core.executors import BoundedExecutor
+from app.core.logging import logging
+from app.models.careersModel import CareersUsers
+from app.models.resumeTextModel import CareersResumeText
+from app.services.job_queue import enqueue_job
+from app.services.pagination import decode_cursor, encode_cursor
+from app.services.serialization import CAREER_USER_COLUMNS
+from app.services.storage import storage
+
+
+def extract_text(data: bytes, filename: str) -> str:
+    """Plain text of a PDF, DOCX or text resume (runs in a worker process)."""
+    name = filename.lower()
+    if name.endswith(".pdf"):
+        from pypdf import PdfReader
+
+        reader = PdfReader(io.BytesIO(data))
+        text = "\n".join(page.extract_text() or "" for page in reader.pages)
+    elif name.endswith(".docx"):
+        from docx import Document
+
+        document = Document(io.BytesIO(data))
+        text = "\n".join(paragraph.text for paragraph in document.paragraphs)
+    elif name.endswith((".txt", ".md")):
+        text = data.decode("utf-8", errors="replace")
+    else:
+        return ""
+    # Postgres text cannot hold NUL bytes, which some PDFs produce
+    return text.replace("\x00", " ")[: settings.RESUME_TEXT_MAX_CHARS]
+
+
+_extraction_executor = None
+# Strong references so pending extraction tasks are not garbage collected
+_pending_tasks = set()
+# session.info key of in-process extractions waiting for their transaction
+PENDING_EXTRACTIONS = "pending_resume_extractions"
+# In-process extractions that may download and parse at once; the rest
+# wait here holding only their ids, so a bulk import cannot pull every
+# resume into memory together
+_extraction_slots = asyncio.Semaphore(settings.RESUME_EXTRACTION_WORKERS)
+
+
+def get_extraction_executor() -> BoundedExecutor:
+    # Created on first use so workers that never extract spawn no processes.
+    # Spawned rather than forked: by now the process runs the logging
+    # listener and executor threads, whose locks a fork would copy mid-use.
+    global _extraction_executor
+    if _extraction_executor is None:
+        _extraction_executor = BoundedExecutor(
+            ProcessPoolExecutor(
+                max_workers=settings.RESUME_EXTRACTION_WORKERS,
+                mp_context=multiprocessing.get_context("spawn"),
+            ),
+            max_concurrency=settings.RESUME_EXTRACTION_WORKERS,
+        )
+    return _extraction_executor
+
+
+def shutdown_extraction_executor():
+    global _extraction_executor
+    if _extraction_executor is not None:
+        _extraction_executor.shutdown(wait=False)
+        _extraction_executor = None
+
+
+async def extract_and_store(careersuser_id: int, resume_key: str):
+    """Download a resume, extract its text off the event loop and index it.
+
+    A resume without extractable text removes the user's previous entry, so
+    search never matches the content of a replaced resume. Both writes only
+    happen while ``resume_key`` is still the user's resume: extractions run
+    concurrently, and one for a resume replaced meanwhile may finish last.
+    """
+    data = await storage.read(resume_key)
+    text = await get_extraction_executor().run(extract_text, data, resume_key)
+    current = select(CareersUsers.id).where(
+        CareersUsers.id == careersuser_id,
+        CareersUsers.resume_filename == storage.url(resume_key),
+    )
+    if not text.strip():
+        async with async_session() as db:
+            await db.execute(
+                delete(CareersResumeText).where(
+                    CareersResumeText.careersuser_id == careersuser_id, current.exists()
+                )
+            )
+            await db.commit()
+        logging.info(f"No text extracted from resume '{resume_key}'.")
+        return
+
+    async with async_session() as db:
+        statement = insert(CareersResumeText).from_select(
+            ["careersuser_id", "resume_key", "content"],
+            current.add_columns(literal(resume_key), literal(text)),
+        )
+        result = await db.execute(
+            statement.on_conflict_do_update(
+                index_elements=[CareersResumeText.careersuser_id],
+                set_={
+                    "resume_key": statement.excluded.resume_key,
+                    "content": statement.excluded.content,
+                    "extracted_on": func.now(),
+                },
+            ).returning(CareersResumeText.careersuser_id)
+        )
+        indexed = result.scalar_one_or_none() is not None
+        await db.commit()
+    if indexed:
+        logging.info(f"Indexed {len(text)} characters from resume '{resume_key}'.")
+    else:
+        logging.info(f"Skipped text of resume '{resume_key}', no longer the user's resume.")
+
+
+def schedule_resume_extraction(db: AsyncSession, careersuser_id: int, resume_key: str):
+    """Index a freshly uploaded resume off the request path.
+
+    Call it before committing the change that stored the resume; it never
+    commits, so callers can batch many rows into one transaction. With
+    JOB_QUEUE_ENABLED an ``extract_resume_text`` job joins that transaction;
+    otherwise a background task of this process starts once it commits.
+    Either way nothing runs if the transaction is rolled back.
+    """
+    if not settings.RESUME_EXTRACTION_ENABLED:
+        return
+    if settings.JOB_QUEUE_ENABLED:
+        enqueue_job(
+            db,
+            "extract_resume_text",
+            {"careersuser_id": careersuser_id, "key": resume_key},
+        )
+        return
+    db.info.setdefault(PENDING_EXTRACTIONS, []).append((careersuser_id, resume_key))
+
+
+def start_resume_extraction(careersuser_id: int, resume_key: str):
+    async def run():
+        try:
+            async with _extraction_slots:
+                await extract_and_store(careersuser_id, resume_key)
+        except Exception as e:
+            logging.error(f"Resume extraction failed for '{resume_key}': {e}")
+
+    task = asyncio.create_task(run())
+    _pending_tasks.add(task)
+    task.add_done_callback(_pending_tasks.discard)
+
+
+@event.listens_for(Session, "after_commit")
+def _start_pending_extractions(session: Session):
+    # Runs on the event loop thread, inside AsyncSession.commit()
+    for careersuser_id, resume_key in session.info.pop(PENDING_EXTRACTIONS, ()):
+        start_resume_extraction(careersuser_id, resume_key)
+
+
+@event.listens_for(Session, "after_rollback")
+def _drop_pending_extractions(session: Session):
+    session.info.pop(PENDING_EXTRACTIONS, None)
+
+
+async def search_resumes(
+    db: AsyncSession, q: str, limit: int = 10, after: Optional[str] = None
+):
+    """Active users whose resume text matches a web-style query, best first.
+
+    Uses the GIN index on careers_resume_texts.search_vector and keyset
+    pagination on (rank, id).
+    """
+    try:
+        logging.info(f"Searching resumes with q={q!r}, limit={limit}, after={after}")
+        query_vector = func.websearch_to_tsquery("english", q)
+        rank = func.ts_rank(CareersResumeText.search_vector, query_vector).label("rank")
+
+        query = (
+            select(*CAREER_USER_COLUMNS, rank)
+            .join(CareersResumeText, CareersResumeText.careersuser_id == CareersUsers.id)
+            .where(
+                CareersUsers.is_active,
+                CareersResumeText.search_vector.op("@@")(query_vector),
+            )
+            .order_by(rank.desc(), CareersUsers.id.desc())
+            .limit(limit + 1)
+        )
+        if after:
+            position = decode_cursor(after, rank=float, id=int)
+            query = query.where(
+                tuple_(rank, CareersUsers.id) < tuple_(position["rank"], position["id"])
+            )
+
+        rows = (await db.execute(query)).mappings().all()
+        next_cursor = None
+        if len(rows) > limit:
+            rows = rows[:limit]
+            next_cursor = encode_cursor({"rank": rows[-1]["rank"], "id": rows[-1]["id"]})
+
+        logging.info(f"Resume search for {q!r} returned {len(rows)} users.")
+        return rows, next_cursor
+
+    except HTTPException:
+        raise
+
+    except Exception as e:
+        logging.error(f"Failed to search resumes: {str(e)}", exc_info=True)
+        raise HTTPException(status_code=500, detail="Failed to search resumes.")
@@ -1,67 +1,320 @@
 import boto3
+import hashlib
+from botocore.config import Config
 from botocore.exceptions import NoCredentialsError, ClientError, BotoCoreError
-from fastapi import HTTPException, UploadFile
+from concurrent.futures import ThreadPoolExecutor
+from fastapi import HTTPException
 from app.core.config import settings
+from app.core.executors import BoundedExecutor
 from app.core.logging import logging
+from app.core.metrics import S3_BYTES, observe_s3_call
 
-# Initialize S3 client
+# Initialize S3 client (boto3 clients are thread-safe, so one is shared by
+# every upload thread; its HTTP pool is sized to match)
 s3_client = boto3.client(
     "s3",
     aws_access_key_id=settings.AWS_ACCESS_KEY_ID,
     aws_secret_access_key=settings.AWS_SECRET_ACCESS_KEY,
     region_name=settings.AWS_REGION,
+    endpoint_url=settings.AWS_S3_ENDPOINT_URL,
+    config=Config(
+        max_pool_connections=settings.S3_MAX_POOL_CONNECTIONS,
+        retries={"max_attempts": 3, "mode": "standard"},
+    ),
 )
 
+# boto3 is blocking; every S3 call goes through this pool so the event loop
+# keeps serving other requests while uploads are in flight
+s3_executor = BoundedExecutor(
+    ThreadPoolExecutor(
+        max_workers=settings.S3_MAX_CONCURRENCY, thread_name_prefix="s3-upload"
+    ),
+    max_concurrency=settings.S3_MAX_CONCURRENCY,
+)
 
-async def upload_file_to_s3(file: UploadFile, file_name: str) -> str:
-    logging.info(
-        f"Attempting to upload file '{file.filename}' to S3 bucket '{settings.AWS_BUCKET}' with name '{file_name}'."
-    )
 
-    try:
-        # Check if the file already exists in the S3 bucket
-        try:
-            s3_client.head_object(Bucket=settings.AWS_BUCKET, Key=file_name)
-            logging.info(f"File '{file_name}' already exists. It will be replaced.")
-        except ClientError as e:
-            # If the file does not exist, it will throw a "Not Found" error (404)
-            if e.response["Error"]["Code"] == "404":
-                logging.info(f"File '{file_name}' does not exist. Uploading new file.")
-            else:
-                raise
+def build_file_url(file_name: str) -> str:
+    if settings.AWS_S3_ENDPOINT_URL:
+        endpoint = settings.AWS_S3_ENDPOINT_URL.rstrip("/")
+        return f"{endpoint}/{settings.AWS_BUCKET}/{file_name}"
+    return f"https://{settings.AWS_BUCKET}.s3.{settings.AWS_REGION}.amazonaws.com/{file_name}"
 
-        # Attempt to upload the file to S3 (this will overwrite the existing file)
-        with file.file as f:
-            s3_client.upload_fileobj(f, settings.AWS_BUCKET, file_name)
 
-        file_url = f"https://{settings.AWS_BUCKET}.s3.{settings.AWS_REGION}.amazonaws.com/{file_name}"
-        logging.info(f"File uploaded successfully. File URL: {file_url}")
-        return file_url
+def shutdown_s3_executor():
+    s3_executor.shutdown(wait=True)
 
-    except NoCredentialsError as no_cred_err:
-        logging.error("AWS credentials are missing or invalid.")
-        raise HTTPException(status_code=403, detail="AWS credentials not available.")
 
+async def upload_fileobj_to_s3(fileobj, file_name: str, content_type: str = None) -> str:
+    """Upload any readable binary file object, overwriting ``file_name``.
+
+    Callers decide whether the upload is needed (see app.services.resume_store).
+    """
+    extra_args = {"ContentType": content_type} if content_type else None
+    sent = S3_BYTES.labels("out")
+
+    def count_sent(amount: int):
+        # Retries report negative amounts to rewind progress; bytes sent
+        # twice are still bytes sent
+        if amount > 0:
+            sent.inc(amount)
+
+    try:
+        await s3_executor.run(
+            observe_s3_call,
+            "upload_fileobj",
+            s3_client.upload_fileobj,
+            fileobj,
+            settings.AWS_BUCKET,
+            file_name,
+            ExtraArgs=extra_args,
+            # Counted as it goes: upload_fileobj closes the file object when done
+            Callback=count_sent,
+        )
+    except NoCredentialsError:
+        raise HTTPException(status_code=403, detail="AWS credentials not available.")
     except ClientError as client_err:
         error_message = client_err.response["Error"]["Message"]
-        logging.error(
-            f"ClientError occurred while uploading file to S3: {error_message}"
-        )
         raise HTTPException(
-            status_code=500,
-            detail=f"Error uploading file to S3: {error_message}",
+            status_code=500, detail=f"Error uploading file to S3: {error_message}"
         )
-
-    except BotoCoreError as boto_err:
-        logging.error(f"BotoCoreError occurred while using boto3: {str(boto_err)}")
+    except BotoCoreError:
         raise HTTPException(
             status_code=500,
             detail="An unexpected error occurred while uploading the file to S3.",
         )
+    return build_file_url(file_name)
 
-    except Exception as general_err:
-        logging.exception(f"Unexpected error during file upload: {str(general_err)}")
-        raise HTTPException(
-            status_code=500,
-            detail="An unexpected error occurred while uploading the file to S3.",
+
+def generate_presigned_upload(file_name: str, content_type: str) -> dict:
+    """Presigned POST letting a client upload one resume straight to S3.
+
+    S3 itself rejects bodies over MAX_RESUME_SIZE_BYTES or with a different
+    Content-Type. Signing is local, so no executor is needed.
+    """
+    try:
+        return s3_client.generate_presigned_post(
+            Bucket=settings.AWS_BUCKET,
+            Key=file_name,
+            Fields={"Content-Type": content_type},
+            Conditions=[
+                {"Content-Type": content_type},
+                ["content-length-range", 1, settings.MAX_RESUME_SIZE_BYTES],
+            ],
+            ExpiresIn=settings.PRESIGNED_URL_EXPIRES_SECONDS,
+        )
+    except (ClientError, BotoCoreError) as err:
+        logging.error(f"Failed to presign upload for '{file_name}': {err}")
+        raise HTTPException(status_code=500, detail="Could not create upload URL")
+
+
+def generate_presigned_download(file_name: str, filename: str, content_type: str = None) -> str:
+    """Short-lived GET URL that downloads the object as ``filename``."""
+    safe_name = filename.replace('"', "")
+    params = {
+        "Bucket": settings.AWS_BUCKET,
+        "Key": file_name,
+        "ResponseContentDisposition": f'attachment; filename="{safe_name}"',
+    }
+    if content_type:
+        params["ResponseContentType"] = content_type
+    try:
+        return s3_client.generate_presigned_url(
+            "get_object", Params=params, ExpiresIn=settings.PRESIGNED_URL_EXPIRES_SECONDS
         )
+    except (ClientError, BotoCoreError) as err:
+        logging.error(f"Failed to presign download for '{file_name}': {err}")
+        raise HTTPException(status_code=500, detail="Could not create download URL")
+
+
+async def read_file_from_s3(file_name: str) -> bytes:
+    response = await s3_executor.run(
+        observe_s3_call,
+        "get_object",
+        s3_client.get_object,
+        Bucket=settings.AWS_BUCKET,
+        Key=file_name,
+    )
+    data = await s3_executor.run(observe_s3_call, "read_body", response["Body"].read)
+    S3_BYTES.labels("in").inc(len(data))
+    return data
+
+
+async def head_file_in_s3(file_name: str):
+    """Object metadata, or None when the object does not exist."""
+    try:
+        return await s3_executor.run(
+            observe_s3_call,
+            "head_object",
+            s3_client.head_object,
+            Bucket=settings.AWS_BUCKET,
+            Key=file_name,
+        )
+    except ClientError as e:
+        if e.response["Error"]["Code"] in ("404", "NoSuchKey"):
+            return None
+        logging.error(f"Failed to inspect '{file_name}' in S3: {e}")
+        raise HTTPException(status_code=500, detail="Error checking file in S3")
+
+
+async def copy_file_in_s3(source: str, destination: str):
+    """Server-side copy; the bytes never leave S3."""
+    try:
+        await s3_executor.run(
+            observe_s3_call,
+            "copy_object",
+            s3_client.copy_object,
+            Bucket=settings.AWS_BUCKET,
+            Key=destination,
+            CopySource={"Bucket": settings.AWS_BUCKET, "Key": source},
+        )
+    except (ClientError, BotoCoreError) as err:
+        logging.error(f"Failed to copy '{source}' to '{destination}' in S3: {err}")
+        raise HTTPException(status_code=500, detail="Error storing file in S3")
+
+
+async def delete_file_from_s3(file_name: str):
+    """Best-effort removal of an object that ended up unreferenced."""
+    try:
+        await s3_executor.run(
+            observe_s3_call,
+            "delete_object",
+            s3_client.delete_object,
+            Bucket=settings.AWS_BUCKET,
+            Key=file_name,
+        )
+        logging.info(f"Deleted orphaned file '{file_name}' from S3.")
+    except (ClientError, BotoCoreError) as err:
+        logging.error(f"Failed to delete '{file_name}' from S3: {err}")
+
+
+class StreamedFile:
+    def __init__(self, key: str, url: str, size: int, sha256: str):
+        self.key = key
+        self.url = url
+        self.size = size
+        self.sha256 = sha256
+
+
+class S3StreamingUpload:
+    """Pipe chunks of an incoming file straight into S3.
+
+    Bytes are hashed and counted as they pass and buffered only up to one
+    part, so memory stays constant whatever the file size. Files smaller
+    than a part end up as a single ``put_object``; larger ones become a
+    multipart upload that is aborted if anything goes wrong midway.
+    """
+
+    def __init__(self, key: str, content_type: str = None, max_size: int = None):
+        self.key = key
+        self.content_type = content_type or "application/octet-stream"
+        self.max_size = max_size or settings.MAX_RESUME_SIZE_BYTES
+        self.part_size = max(settings.S3_MULTIPART_PART_SIZE, 5 * 1024 * 1024)
+        self.size = 0
+        self._sha256 = hashlib.sha256()
+        self._buffer = bytearray()
+        self._upload_id = None
+        self._parts = []
+
+    async def write(self, chunk: bytes):
+        self.size += len(chunk)
+        if self.size > self.max_size:
+            logging.warning(
+                f"Upload '{self.key}' exceeded the {self.max_size} byte limit."
+            )
+            raise HTTPException(
+                status_code=413,
+                detail=f"Resume file exceeds the maximum size of {self.max_size} bytes.",
+            )
+        self._sha256.update(chunk)
+        self._buffer += chunk
+        while len(self._buffer) >= self.part_size:
+            part = bytes(self._buffer[: self.part_size])
+            del self._buffer[: self.part_size]
+            await self._upload_part(part)
+
+    async def complete(self) -> StreamedFile:
+        try:
+            if self._upload_id is None:
+                await s3_executor.run(
+                    observe_s3_call,
+                    "put_object",
+                    s3_client.put_object,
+                    Bucket=settings.AWS_BUCKET,
+                    Key=self.key,
+                    Body=bytes(self._buffer),
+                    ContentType=self.content_type,
+                )
+                S3_BYTES.labels("out").inc(len(self._buffer))
+            else:
+                if self._buffer:
+                    await self._upload_part(bytes(self._buffer))
+                await s3_executor.run(
+                    observe_s3_call,
+                    "complete_multipart_upload",
+                    s3_client.complete_multipart_upload,
+                    Bucket=settings.AWS_BUCKET,
+                    Key=self.key,
+                    UploadId=self._upload_id,
+                    MultipartUpload={"Parts": self._parts},
+                )
+        except (ClientError, BotoCoreError) as err:
+            logging.error(f"Error completing streamed upload '{self.key}': {err}")
+            raise HTTPException(status_code=500, detail="Error uploading file to S3")
+        self._buffer.clear()
+
+        streamed = StreamedFile(
+            key=self.key,
+            url=build_file_url(self.key),
+            size=self.size,
+            sha256=self._sha256.hexdigest(),
+        )
+        logging.info(
+            f"Streamed '{self.key}' to S3 ({streamed.size} bytes, sha256={streamed.sha256})."
+        )
+        return streamed
+
+    async def abort(self):
+        self._buffer.clear()
+        if self._upload_id is None:
+            return
+        try:
+            await s3_executor.run(
+                observe_s3_call,
+                "abort_multipart_upload",
+                s3_client.abort_multipart_upload,
+                Bucket=settings.AWS_BUCKET,
+                Key=self.key,
+                UploadId=self._upload_id,
+            )
+            logging.info(f"Aborted multipart upload for '{self.key}'.")
+        except (ClientError, BotoCoreError) as err:
+            logging.error(f"Failed to abort multipart upload '{self.key}': {err}")
+
+    async def _upload_part(self, part: bytes):
+        try:
+            if self._upload_id is None:
+                response = await s3_executor.run(
+                    observe_s3_call,
+                    "create_multipart_upload",
+                    s3_client.create_multipart_upload,
+                    Bucket=settings.AWS_BUCKET,
+                    Key=self.key,
+                    ContentType=self.content_type,
+                )
+                self._upload_id = response["UploadId"]
+            part_number = len(self._parts) + 1
+            response = await s3_executor.run(
+                observe_s3_call,
+                "upload_part",
+                s3_client.upload_part,
+                Bucket=settings.AWS_BUCKET,
+                Key=self.key,
+                UploadId=self._upload_id,
+                PartNumber=part_number,
+                Body=part,
+            )
+            S3_BYTES.labels("out").inc(len(part))
+            self._parts.append({"ETag": response["ETag"], "PartNumber": part_number})
+        except (ClientError, BotoCoreError) as err:
+            logging.error(f"Error uploading part for '{self.key}': {err}")
+            raise HTTPException(status_code=500, detail="Error uploading file to S3")
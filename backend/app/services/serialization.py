@@ -0,0 +1,47 @@
+from typing import Dict, Optional
+from fastapi import Response
+from pydantic import BaseModel, TypeAdapter
+from app.models.careersModel import CareersUsers
+from app.schemas.careersSchemas import (
+    CareerUserResponse,
+    CareerUserSearchResponse,
+    PaginatedCareerUsersResponse,
+)
+
+# Columns behind CareerUserResponse; selecting these as plain rows skips
+# building ORM instances (identity map, attribute instrumentation)
+CAREER_USER_COLUMNS = tuple(
+    getattr(CareersUsers, field) for field in CareerUserResponse.model_fields
+)
+
+
+class CareerUserEnvelope(BaseModel):
+    msg: str
+    status_code: int
+    data: Optional[CareerUserResponse] = None
+
+
+paginated_users_adapter = TypeAdapter(PaginatedCareerUsersResponse)
+search_results_adapter = TypeAdapter(CareerUserSearchResponse)
+career_user_envelope_adapter = TypeAdapter(CareerUserEnvelope)
+
+
+def json_response(
+    adapter: TypeAdapter,
+    data,
+    status_code: int = 200,
+    headers: Optional[Dict[str, str]] = None,
+) -> Response:
+    """Validate ``data`` once and encode it straight to JSON bytes.
+
+    Both steps run in pydantic-core over the whole payload. Returning a
+    Response also bypasses FastAPI's response_model pass, which would
+    validate and serialize everything a second time.
+    """
+    content = adapter.dump_json(adapter.validate_python(data))
+    return Response(
+        content=content,
+        status_code=status_code,
+        headers=headers,
+        media_type="application/json",
+    )
@@ -0,0 +1,311 @@
+import hashlib
+import mimetypes
+import os
+import shutil
+import uuid
+from abc import ABC, abstractmethod
+from pathlib import Path
+from typing import Optional
+from fastapi import HTTPException
+from fastapi.concurrency import run_in_threadpool
+from starlette.datastructures import Headers
+from starlette.responses import FileResponse, RedirectResponse, Response
+from starlette.staticfiles import StaticFiles
+from app.core.config import settings
+from app.core.logging import logging
+from app.services.s3_upload import (
+    S3StreamingUpload,
+    StreamedFile,
+    build_file_url,
+    copy_file_in_s3,
+    delete_file_from_s3,
+    generate_presigned_download,
+    generate_presigned_upload,
+    head_file_in_s3,
+    read_file_from_s3,
+    upload_fileobj_to_s3,
+)
+
+
+class StorageBackend(ABC):
+    """Where resume files live, addressed by relative keys such as
+    ``resumes/<sha256>.pdf``. Selected with STORAGE_BACKEND."""
+
+    name = ""
+
+    @abstractmethod
+    def url(self, key: str) -> str: ...
+
+    def key_from_url(self, url: Optional[str]) -> Optional[str]:
+        """Key behind a URL produced by ``url``, for rows without a blob link."""
+        prefix = self.url("")
+        if not url or not url.startswith(prefix) or len(url) == len(prefix):
+            return None
+        return url[len(prefix):]
+
+    @abstractmethod
+    async def save(self, fileobj, key: str, content_type: str = None) -> str: ...
+
+    @abstractmethod
+    async def read(self, key: str) -> bytes: ...
+
+    @abstractmethod
+    async def stat(self, key: str) -> Optional[dict]:
+        """``{"size", "content_type"}`` of a stored file, or None."""
+
+    @abstractmethod
+    async def copy(self, source: str, destination: str): ...
+
+    @abstractmethod
+    async def delete(self, key: str):
+        """Best-effort removal; a missing file is not an error."""
+
+    @abstractmethod
+    def open_writer(self, key: str, content_type: str = None):
+        """Writer for parse_streaming_form: async write, complete, abort."""
+
+    def mount(self, app):
+        """Serve the URLs handed out by ``url`` from ``app``, if it must."""
+
+    def presigned_upload(self, key: str, content_type: str) -> dict:
+        raise HTTPException(
+            status_code=501, detail="Direct uploads are not supported by this storage backend"
+        )
+
+    @abstractmethod
+    async def download_response(
+        self, key: str, filename: str, content_type: Optional[str]
+    ) -> Response: ...
+
+
+class S3Storage(StorageBackend):
+    name = "s3"
+
+    def __init__(self):
+        if not settings.AWS_BUCKET:
+            raise ValueError("AWS_BUCKET must be set when STORAGE_BACKEND is 's3'")
+
+    def url(self, key: str) -> str:
+        return build_file_url(key)
+
+    async def save(self, fileobj, key: str, content_type: str = None) -> str:
+        return await upload_fileobj_to_s3(fileobj, key, content_type)
+
+    async def read(self, key: str) -> bytes:
+        return await read_file_from_s3(key)
+
+    async def stat(self, key: str) -> Optional[dict]:
+        head = await head_file_in_s3(key)
+        if head is None:
+            return None
+        return {"size": head["ContentLength"], "content_type": head.get("ContentType")}
+
+    async def copy(self, source: str, destination: str):
+        await copy_file_in_s3(source, destination)
+
+    async def delete(self, key: str):
+        await delete_file_from_s3(key)
+
+    def open_writer(self, key: str, content_type: str = None):
+        return S3StreamingUpload(key, content_type)
+
+    def presigned_upload(self, key: str, content_type: str) -> dict:
+        return generate_presigned_upload(key, content_type)
+
+    async def download_response(
+        self, key: str, filename: str, content_type: Optional[str]
+    ) -> Response:
+        # The client fetches the bytes from S3 itself
+        return RedirectResponse(
+            generate_presigned_download(key, filename, content_type), status_code=307
+        )
+
+
+class ZeroCopyFileResponse(FileResponse):
+    """FileResponse that hands the file to the server when it can sendfile.
+
+    Servers advertising the ASGI ``http.response.zerocopysend`` extension
+    get the open file and copy it to the socket in the kernel. Range and
+    HEAD requests, and servers without the extension, use FileResponse's
+    own (chunked, Range-aware) path.
+    """
+
+    async def __call__(self, scope, receive, send):
+        if (
+            "http.response.zerocopysend" not in scope.get("extensions", {})
+            or scope["method"] != "GET"
+            or "range" in Headers(scope=scope)
+        ):
+            await super().__call__(scope, receive, send)
+            return
+
+        try:
+            stat_result = await run_in_threadpool(os.stat, self.path)
+        except FileNotFoundError:
+            raise HTTPException(status_code=404, detail="File not found")
+        self.set_stat_headers(stat_result)
+        await send(
+            {
+                "type": "http.response.start",
+                "status": self.status_code,
+                "headers": self.raw_headers,
+            }
+        )
+        with open(self.path, "rb") as file:
+            await send(
+                {
+                    "type": "http.response.zerocopysend",
+                    "file": file,
+                    "offset": 0,
+                    "count": stat_result.st_size,
+                    "more_body": False,
+                }
+            )
+        if self.background is not None:
+            await self.background()
+
+
+def _write_atomically(path: Path, write):
+    path.parent.mkdir(parents=True, exist_ok=True)
+    partial = path.with_name(f".{path.name}.{uuid.uuid4().hex}.part")
+    try:
+        with open(partial, "wb") as out:
+            write(out)
+        os.replace(partial, path)
+    except BaseException:
+        partial.unlink(missing_ok=True)
+        raise
+
+
+class LocalStreamingUpload:
+    """Local-disk counterpart of S3StreamingUpload."""
+
+    def __init__(self, storage: "LocalStorage", key: str, max_size: int = None):
+        self.storage = storage
+        self.key = key
+        self.path = storage.path(key)
+        self.max_size = max_size or settings.MAX_RESUME_SIZE_BYTES
+        self.size = 0
+        self._sha256 = hashlib.sha256()
+        self._partial = self.path.with_name(f".{self.path.name}.part")
+        self._file = None
+
+    def _open(self):
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        return open(self._partial, "wb")
+
+    async def write(self, chunk: bytes):
+        self.size += len(chunk)
+        if self.size > self.max_size:
+            logging.warning(f"Upload '{self.key}' exceeded the {self.max_size} byte limit.")
+            raise HTTPException(
+                status_code=413,
+                detail=f"Resume file exceeds the maximum size of {self.max_size} bytes.",
+            )
+        self._sha256.update(chunk)
+        if self._file is None:
+            self._file = await run_in_threadpool(self._open)
+        await run_in_threadpool(self._file.write, chunk)
+
+    async def complete(self) -> StreamedFile:
+        if self._file is None:
+            self._file = await run_in_threadpool(self._open)
+        await run_in_threadpool(self._file.close)
+        await run_in_threadpool(os.replace, self._partial, self.path)
+        streamed = StreamedFile(
+            key=self.key,
+            url=self.storage.url(self.key),
+            size=self.size,
+            sha256=self._sha256.hexdigest(),
+        )
+        logging.info(f"Streamed '{self.key}' to disk ({streamed.size} bytes).")
+        return streamed
+
+    async def abort(self):
+        if self._file is not None:
+            await run_in_threadpool(self._file.close)
+        await run_in_threadpool(self._partial.unlink, True)
+
+
+class LocalStorage(StorageBackend):
+    """Files under MEDIA_ROOT; downloads are served by this app."""
+
+    name = "local"
+
+    def __init__(self, root: str, url_prefix: str):
+        self.root = Path(root).resolve()
+        self.url_prefix = url_prefix.rstrip("/")
+
+    def path(self, key: str) -> Path:
+        path = (self.root / key).resolve()
+        if self.root not in path.parents:
+            raise HTTPException(status_code=400, detail="Invalid file key")
+        return path
+
+    def url(self, key: str) -> str:
+        return f"{self.url_prefix}/{key}"
+
+    async def save(self, fileobj, key: str, content_type: str = None) -> str:
+        await run_in_threadpool(
+            _write_atomically, self.path(key), lambda out: shutil.copyfileobj(fileobj, out)
+        )
+        return self.url(key)
+
+    async def read(self, key: str) -> bytes:
+        return await run_in_threadpool(self.path(key).read_bytes)
+
+    async def stat(self, key: str) -> Optional[dict]:
+        try:
+            stat_result = await run_in_threadpool(os.stat, self.path(key))
+        except FileNotFoundError:
+            return None
+        return {"size": stat_result.st_size, "content_type": mimetypes.guess_type(key)[0]}
+
+    async def copy(self, source: str, destination: str):
+        def copy_into(out):
+            with open(self.path(source), "rb") as src:
+                shutil.copyfileobj(src, out)
+
+        await run_in_threadpool(_write_atomically, self.path(destination), copy_into)
+
+    async def delete(self, key: str):
+        try:
+            await run_in_threadpool(self.path(key).unlink, True)
+        except OSError as err:
+            logging.error(f"Failed to delete '{key}' from {self.root}: {err}")
+
+    def open_writer(self, key: str, content_type: str = None):
+        return LocalStreamingUpload(self, key)
+
+    def mount(self, app):
+        """Serve stored resumes at MEDIA_URL/resumes/..., with Range support.
+
+        Only the resumes/ directory is exposed: partial streamed uploads
+        (incoming/) and anything else under MEDIA_ROOT stay private.
+        """
+        directory = self.root / "resumes"
+        directory.mkdir(parents=True, exist_ok=True)
+        app.mount(f"{self.url_prefix}/resumes", StaticFiles(directory=directory), name="media")
+
+    async def download_response(
+        self, key: str, filename: str, content_type: Optional[str]
+    ) -> Response:
+        path = self.path(key)
+        if not await run_in_threadpool(path.is_file):
+            raise HTTPException(status_code=404, detail="Resume file not found")
+        return ZeroCopyFileResponse(
+            path,
+            media_type=content_type or mimetypes.guess_type(filename)[0],
+            filename=filename,
+        )
+
+
+def build_storage() -> StorageBackend:
+    """Backend configured by STORAGE_BACKEND: ``s3`` or ``local``."""
+    if settings.STORAGE_BACKEND.lower() == "local":
+        logging.info(f"Storing resumes under {settings.MEDIA_ROOT}.")
+        return LocalStorage(settings.MEDIA_ROOT, settings.MEDIA_URL)
+    return S3Storage()
+
+
+storage = build_storage()
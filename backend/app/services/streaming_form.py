@@ -0,0 +1,129 @@
+from fastapi import HTTPException, Request
+from app.core.config import settings
+from app.core.logging import logging
+
+try:
+    from python_multipart.multipart import MultipartParser, parse_options_header
+except ImportError:  # python-multipart < 0.0.13
+    from multipart.multipart import MultipartParser, parse_options_header
+
+# Plain form fields (name, email, ...) are tiny; anything bigger is abuse
+MAX_FIELD_SIZE = 64 * 1024
+# Room for the non-file parts and multipart framing on top of the resume
+FORM_OVERHEAD_BYTES = 1024 * 1024
+
+
+async def parse_streaming_form(request: Request, file_field: str, open_writer):
+    """Parse a multipart body chunk by chunk as it arrives.
+
+    Text fields are collected into a dict. The part named ``file_field`` is
+    never buffered: ``await open_writer(filename, content_type, fields)`` is
+    called when its headers arrive, with the fields that came before the
+    file, and must return a writer with async ``write``, ``complete`` and
+    ``abort`` methods; every chunk of the file goes straight to it. Returns
+    ``(fields, completed_file_or_None)``.
+    """
+    content_type, params = parse_options_header(request.headers.get("content-type", ""))
+    boundary = params.get(b"boundary")
+    if content_type != b"multipart/form-data" or not boundary:
+        raise HTTPException(status_code=400, detail="Expected a multipart/form-data body")
+
+    content_length = request.headers.get("content-length")
+    if content_length and content_length.isdigit():
+        if int(content_length) > settings.MAX_RESUME_SIZE_BYTES + FORM_OVERHEAD_BYTES:
+            raise HTTPException(
+                status_code=413,
+                detail=f"Resume file exceeds the maximum size of {settings.MAX_RESUME_SIZE_BYTES} bytes.",
+            )
+
+    # The parser's callbacks are synchronous, so they only record events;
+    # the events are then replayed asynchronously after each chunk.
+    events = []
+    header = {"field": b"", "value": b""}
+
+    def on_header_field(data, start, end):
+        header["field"] += data[start:end]
+
+    def on_header_value(data, start, end):
+        header["value"] += data[start:end]
+
+    def on_header_end():
+        events.append(("header", header["field"].lower(), header["value"]))
+        header["field"], header["value"] = b"", b""
+
+    callbacks = {
+        "on_part_begin": lambda: events.append(("begin",)),
+        "on_part_data": lambda data, start, end: events.append(("data", data[start:end])),
+        "on_part_end": lambda: events.append(("end",)),
+        "on_header_field": on_header_field,
+        "on_header_value": on_header_value,
+        "on_header_end": on_header_end,
+        "on_headers_finished": lambda: events.append(("headers_finished",)),
+    }
+    parser = MultipartParser(boundary, callbacks)
+
+    fields = {}
+    part_headers = {}
+    part_name = None
+    field_buffer = bytearray()
+    writer = None
+    streamed = None
+
+    try:
+        async for chunk in request.stream():
+            parser.write(chunk)
+            for event in events:
+                kind = event[0]
+                if kind == "begin":
+                    part_headers, part_name = {}, None
+                    field_buffer.clear()
+                elif kind == "header":
+                    part_headers[event[1]] = event[2]
+                elif kind == "headers_finished":
+                    _, disposition = parse_options_header(
+                        part_headers.get(b"content-disposition", b"")
+                    )
+                    part_name = disposition.get(b"name", b"").decode()
+                    filename = disposition.get(b"filename")
+                    if filename and part_name == file_field:
+                        if writer is not None:
+                            raise HTTPException(
+                                status_code=400,
+                                detail=f"Only one '{file_field}' file is allowed",
+                            )
+                        writer = await open_writer(
+                            filename.decode(),
+                            part_headers.get(b"content-type", b"").decode() or None,
+                            fields,
+                        )
+                    elif filename:
+                        raise HTTPException(
+                            status_code=400, detail=f"Unexpected file field '{part_name}'"
+                        )
+                elif kind == "data":
+                    if writer is not None and streamed is None and part_name == file_field:
+                        await writer.write(event[1])
+                    else:
+                        field_buffer += event[1]
+                        if len(field_buffer) > MAX_FIELD_SIZE:
+                            raise HTTPException(
+                                status_code=413, detail=f"Form field '{part_name}' is too large"
+                            )
+                elif kind == "end":
+                    if writer is not None and streamed is None and part_name == file_field:
+                        streamed = await writer.complete()
+                    elif part_name:
+                        fields[part_name] = field_buffer.decode("utf-8")
+            events.clear()
+        parser.finalize()
+    except Exception:
+        if writer is not None and streamed is None:
+            await writer.abort()
+        raise
+
+    if writer is not None and streamed is None:
+        await writer.abort()
+        raise HTTPException(status_code=400, detail="Incomplete multipart body")
+
+    logging.info(f"Parsed streaming form with fields: {sorted(fields)}")
+    return fields, streamed
@@ -0,0 +1,82 @@
+import asyncio
+import time
+from typing import Literal, Optional, get_args
+from sqlalchemy import func, select, text
+from sqlalchemy.ext.asyncio import AsyncSession
+from app.core.config import settings
+from app.core.logging import logging
+from app.models.careersModel import CareersUsers
+
+CountMode = Literal["exact", "cached", "estimate", "none"]
+COUNT_MODES = get_args(CountMode)
+
+
+class ActiveUserCounter:
+    """Total of active users for the listing endpoint.
+
+    ``exact`` runs count(*) and refreshes the cache, ``cached`` reuses that
+    value for USER_COUNT_CACHE_TTL_SECONDS (writes in this process invalidate
+    it earlier), ``estimate`` reads the planner statistics of the partial
+    index over active users and ``none`` skips counting altogether.
+    """
+
+    def __init__(self, ttl_seconds: int):
+        self.ttl_seconds = ttl_seconds
+        self._value = None
+        self._expires_at = 0.0
+        # Bumped by invalidate(), so a count that was already running when
+        # a write happened is returned but not cached
+        self._generation = 0
+        self._lock = asyncio.Lock()
+
+    def invalidate(self):
+        self._value = None
+        self._expires_at = 0.0
+        self._generation += 1
+
+    async def get(self, db: AsyncSession, mode: CountMode = "cached") -> Optional[int]:
+        if mode == "none":
+            return None
+        if mode == "estimate":
+            estimate = await self._estimate(db)
+            if estimate is not None:
+                return estimate
+            mode = "cached"
+        if mode == "cached" and self._fresh():
+            return self._value
+
+        # One count at a time per process; waiters reuse the fresh result
+        async with self._lock:
+            if mode == "cached" and self._fresh():
+                return self._value
+            generation = self._generation
+            result = await db.execute(
+                select(func.count(CareersUsers.id)).where(CareersUsers.is_active == True)
+            )
+            value = result.scalar()
+            # A replica may lag behind writes this process already saw;
+            # only counts from the primary are shared through the cache
+            if generation == self._generation and not db.info.get("replica"):
+                self._value = value
+                self._expires_at = time.monotonic() + self.ttl_seconds
+            return value
+
+    def _fresh(self) -> bool:
+        return self._value is not None and time.monotonic() < self._expires_at
+
+    async def _estimate(self, db: AsyncSession) -> Optional[int]:
+        result = await db.execute(
+            text(
+                "SELECT reltuples::bigint FROM pg_class "
+                "WHERE relname = 'ix_careersusers_active_id'"
+            )
+        )
+        estimate = result.scalar()
+        # reltuples is -1 (or 0 on old servers) until the table is analyzed
+        if estimate is None or estimate < 1:
+            logging.info("No planner estimate for active users yet, counting.")
+            return None
+        return int(estimate)
+
+
+active_user_counter = ActiveUserCounter(settings.USER_COUNT_CACHE_TTL_SECONDS)
@@ -0,0 +1,86 @@
+import argparse
+import asyncio
+import multiprocessing
+import signal
+from app.core.config import settings
+from app.core.database import async_session
+from app.core.logging import logging, stop_logging
+import app.services.job_handlers  # noqa: F401  (registers the job handlers)
+from app.services.job_queue import run_worker
+from app.services.resume_store import purge_unreferenced_blobs
+from app.services.resume_text import shutdown_extraction_executor
+from app.services.s3_upload import shutdown_s3_executor
+
+
+async def purge_blobs_periodically(stop: asyncio.Event):
+    """Delete unreferenced resume blobs every RESUME_BLOB_PURGE_INTERVAL_SECONDS."""
+    interval = settings.RESUME_BLOB_PURGE_INTERVAL_SECONDS
+    while interval > 0 and not stop.is_set():
+        try:
+            async with async_session() as db:
+                await purge_unreferenced_blobs(db)
+        except Exception as e:
+            logging.error(f"Resume blob purge failed: {e}")
+        try:
+            await asyncio.wait_for(stop.wait(), interval)
+        except asyncio.TimeoutError:
+            pass
+
+
+async def serve(concurrency: int):
+    stop = asyncio.Event()
+    loop = asyncio.get_running_loop()
+    for signum in (signal.SIGINT, signal.SIGTERM):
+        loop.add_signal_handler(signum, stop.set)
+    await asyncio.gather(run_worker(stop, concurrency), purge_blobs_periodically(stop))
+
+
+def run_process(concurrency: int):
+    try:
+        asyncio.run(serve(concurrency))
+    finally:
+        shutdown_extraction_executor()
+        shutdown_s3_executor()
+        stop_logging()
+
+
+def start_processes(count: int, target, *args) -> list:
+    """Start ``count`` processes running ``target(*args)``.
+
+    They are spawned, not forked: a forked child would inherit the root
+    QueueHandler but not the listener thread draining its queue, and every
+    record it logged would be lost. A spawned child imports app.core.logging
+    afresh and starts its own listener.
+    """
+    context = multiprocessing.get_context("spawn")
+    processes = [context.Process(target=target, args=args) for _ in range(count)]
+    for process in processes:
+        process.start()
+    return processes
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Run background job workers.")
+    parser.add_argument("--processes", type=int, default=1)
+    parser.add_argument(
+        "--concurrency",
+        type=int,
+        default=settings.JOB_WORKER_CONCURRENCY,
+        help="Jobs processed at once by each process",
+    )
+    args = parser.parse_args()
+
+    if args.processes <= 1:
+        run_process(args.concurrency)
+        return
+
+    logging.info(f"Starting {args.processes} job worker processes.")
+    workers = start_processes(args.processes, run_process, args.concurrency)
+    # SIGINT/SIGTERM reach the children through the process group
+    signal.signal(signal.SIGINT, signal.SIG_IGN)
+    for worker in workers:
+        worker.join()
+
+
+if __name__ == "__main__":
+    main()
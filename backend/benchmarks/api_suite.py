@@ -0,0 +1,273 @@
+"""End-to-end load test of the careers API with per-endpoint baselines.
+
+Seeds DATABASE_URL with synthetic users (see pagination_depth), starts a
+moto S3 server and drives the real app through httpx's ASGI transport:
+register, list (first page, deep OFFSET page, deep cursor page),
+get-by-id, update and soft-delete, each with ``--concurrency`` clients.
+Reports throughput, p50/p95/p99 latency and SQL statements per request,
+and can save the results as a baseline and diff later runs against it.
+
+    cd backend
+    python -m benchmarks.api_suite --rows 100000 --save baseline.json
+    python -m benchmarks.api_suite --skip-seed --compare baseline.json
+    python -m benchmarks.api_suite --cleanup
+
+Requires ``moto[server]`` and ``httpx`` on top of requirements.txt.
+"""
+import argparse
+import asyncio
+import random
+import subprocess
+import time
+from collections import Counter
+from datetime import datetime, timezone
+
+from benchmarks.common import (
+    QueryCounter,
+    compare_to_baseline,
+    fake_candidate,
+    print_summary,
+    save_baseline,
+    start_fake_s3,
+    summarize,
+)
+
+API = "/api/v1/careers"
+SCENARIOS = (
+    "register",
+    "list_shallow",
+    "list_deep_offset",
+    "list_deep_cursor",
+    "get_by_id",
+    "update",
+    "soft_delete",
+)
+COMPARED_METRICS = ("throughput_rps", "p50_ms", "p95_ms", "p99_ms", "queries_per_request")
+RESUME = b"%PDF-1.4\n" + b"0" * 20_000
+
+
+async def seeded_ids(limit: int) -> list:
+    from sqlalchemy import func, select
+    from app.core.database import async_session
+    from app.models.careersModel import CareersUsers
+
+    async with async_session() as db:
+        result = await db.execute(
+            select(CareersUsers.id)
+            .where(CareersUsers.is_active, CareersUsers.user_id.like("seed\\_%"))
+            .order_by(func.random())
+            .limit(limit)
+        )
+        return list(result.scalars())
+
+
+async def deep_cursor(skip: int):
+    from sqlalchemy import select
+    from app.core.database import async_session
+    from app.models.careersModel import CareersUsers
+    from app.services.pagination import encode_cursor
+
+    async with async_session() as db:
+        boundary = (
+            await db.execute(
+                select(CareersUsers.id)
+                .where(CareersUsers.is_active)
+                .order_by(CareersUsers.id.desc())
+                .offset(max(skip - 1, 0))
+                .limit(1)
+            )
+        ).scalar()
+    return encode_cursor({"id": boundary}) if boundary is not None else None
+
+
+async def cleanup_registered():
+    from sqlalchemy import text
+    from app.core.database import async_session
+
+    async with async_session() as db:
+        await db.execute(text("DELETE FROM careersusers WHERE email LIKE 'suite\\_%'"))
+        await db.commit()
+
+
+async def run_scenario(client, counter, name: str, request_factory, requests: int, concurrency: int):
+    """Run ``requests`` calls of one endpoint from ``concurrency`` clients."""
+    latencies, statuses = [], Counter()
+    remaining = iter(range(requests))
+
+    async def worker():
+        for index in remaining:
+            method, url, kwargs = request_factory(index)
+            started = time.perf_counter()
+            response = await client.request(method, url, **kwargs)
+            latencies.append(time.perf_counter() - started)
+            statuses[response.status_code] += 1
+
+    counter.reset()
+    started = time.perf_counter()
+    await asyncio.gather(*(worker() for _ in range(concurrency)))
+    elapsed = time.perf_counter() - started
+
+    stats = summarize(latencies)
+    stats.update(
+        throughput_rps=round(requests / elapsed, 2),
+        queries_per_request=round(counter.count / requests, 2),
+        sql_ms_per_request=round(counter.seconds / requests * 1000, 3),
+        errors=sum(n for status, n in statuses.items() if status >= 400),
+        statuses={str(status): n for status, n in statuses.items()},
+    )
+    print_summary(name, latencies)
+    print(
+        f"{'':<32} {stats['throughput_rps']:>8.1f} req/s  "
+        f"{stats['queries_per_request']:.2f} queries/req  "
+        f"{stats['sql_ms_per_request']:.2f}ms SQL/req  statuses={stats['statuses']}"
+    )
+    return stats
+
+
+async def run(args) -> dict:
+    import httpx
+    from app.core.database import engine
+    from app.main import app
+
+    counter = QueryCounter(engine)
+    ids = await seeded_ids(max(args.requests * 2, 1))
+    if not ids:
+        raise SystemExit("No seeded users found; run without --skip-seed first.")
+    deep_skip = int(args.rows * args.deep_fraction)
+    after = await deep_cursor(deep_skip)
+    registered = []
+
+    def register(index):
+        return (
+            "POST",
+            f"{API}/",
+            {
+                "data": fake_candidate("suite"),
+                "files": {"resume_file": (f"resume_{index}.pdf", RESUME, "application/pdf")},
+            },
+        )
+
+    def update(index):
+        return ("PUT", f"{API}/{ids[index % len(ids)]}/", {"data": {"name": f"Updated {index}"}})
+
+    def soft_delete(index):
+        # Delete the users this run registered, so the seeded data survives
+        pool = registered or ids
+        return ("DELETE", f"{API}/{pool[index % len(pool)]}", {})
+
+    factories = {
+        "register": register,
+        "list_shallow": lambda index: ("GET", f"{API}/", {"params": {"limit": 10}}),
+        "list_deep_offset": lambda index: (
+            "GET",
+            f"{API}/",
+            {"params": {"skip": deep_skip, "limit": 10}},
+        ),
+        "list_deep_cursor": lambda index: (
+            "GET",
+            f"{API}/",
+            {"params": {"after": after, "limit": 10}} if after else {"params": {"limit": 10}},
+        ),
+        "get_by_id": lambda index: ("GET", f"{API}/{random.choice(ids)}", {}),
+        "update": update,
+        "soft_delete": soft_delete,
+    }
+
+    results = {}
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(
+        transport=transport, base_url="http://bench", timeout=300
+    ) as client:
+        for name in args.scenarios:
+            results[name] = await run_scenario(
+                client, counter, name, factories[name], args.requests, args.concurrency
+            )
+            if name == "register":
+                registered.extend(await registered_ids())
+    return results
+
+
+async def registered_ids() -> list:
+    from sqlalchemy import select
+    from app.core.database import async_session
+    from app.models.careersModel import CareersUsers
+
+    async with async_session() as db:
+        result = await db.execute(
+            select(CareersUsers.id).where(
+                CareersUsers.is_active, CareersUsers.email.like("suite\\_%")
+            )
+        )
+        return list(result.scalars())
+
+
+async def suite(args) -> dict:
+    # One event loop for everything, so pooled connections stay usable
+    from benchmarks.pagination_depth import seed
+
+    if not args.skip_seed:
+        await seed(args.rows)
+    try:
+        return await run(args)
+    finally:
+        await cleanup_registered()
+
+
+async def cleanup_all():
+    from benchmarks.pagination_depth import cleanup
+
+    await cleanup()
+    await cleanup_registered()
+
+
+def git_revision() -> str:
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"], capture_output=True, text=True
+        ).stdout.strip()
+    except OSError:
+        return ""
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--rows", type=int, default=100_000, help="seeded users")
+    parser.add_argument("--requests", type=int, default=500, help="requests per scenario")
+    parser.add_argument("--concurrency", type=int, default=20)
+    parser.add_argument(
+        "--deep-fraction", type=float, default=0.9, help="deep page position, 0..1"
+    )
+    parser.add_argument(
+        "--scenarios", nargs="+", choices=SCENARIOS, default=list(SCENARIOS)
+    )
+    parser.add_argument("--save", metavar="PATH", help="write results as a baseline")
+    parser.add_argument("--compare", metavar="PATH", help="diff against a baseline")
+    parser.add_argument("--skip-seed", action="store_true")
+    parser.add_argument("--cleanup", action="store_true")
+    args = parser.parse_args()
+
+    if args.cleanup:
+        asyncio.run(cleanup_all())
+        return
+
+    server = start_fake_s3()
+    try:
+        results = asyncio.run(suite(args))
+    finally:
+        server.stop()
+
+    meta = {
+        "recorded_at": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+        "revision": git_revision(),
+        "rows": args.rows,
+        "requests": args.requests,
+        "concurrency": args.concurrency,
+    }
+    if args.compare:
+        compare_to_baseline(args.compare, results, COMPARED_METRICS)
+    if args.save:
+        save_baseline(args.save, meta, results)
+
+
+if __name__ == "__main__":
+    main()
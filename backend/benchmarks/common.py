@@ -0,0 +1,122 @@
+import json
+import os
+import time
+import uuid
+
+FAKE_S3_BUCKET = "benchmark-resumes"
+
+
+def percentile(samples, pct: float) -> float:
+    if not samples:
+        return 0.0
+    ordered = sorted(samples)
+    index = min(len(ordered) - 1, max(0, round(pct / 100 * len(ordered)) - 1))
+    return ordered[index]
+
+
+def summarize(samples) -> dict:
+    """Latency summary in milliseconds for a list of durations in seconds."""
+    return {
+        "count": len(samples),
+        "mean_ms": round(sum(samples) / len(samples) * 1000, 2) if samples else 0.0,
+        "p50_ms": round(percentile(samples, 50) * 1000, 2),
+        "p95_ms": round(percentile(samples, 95) * 1000, 2),
+        "p99_ms": round(percentile(samples, 99) * 1000, 2),
+    }
+
+
+def print_summary(label: str, samples):
+    stats = summarize(samples)
+    print(
+        f"{label:<32} n={stats['count']:<6} mean={stats['mean_ms']:>9.2f}ms "
+        f"p50={stats['p50_ms']:>9.2f}ms p95={stats['p95_ms']:>9.2f}ms "
+        f"p99={stats['p99_ms']:>9.2f}ms"
+    )
+
+
+def start_fake_s3(port: int = 5055):
+    """Start a moto S3 server and point the app settings at it.
+
+    Must run before anything imports ``app.*`` because the settings and the
+    boto3 client are created at import time.
+    """
+    from moto.server import ThreadedMotoServer
+
+    server = ThreadedMotoServer(port=port)
+    server.start()
+    endpoint = f"http://127.0.0.1:{port}"
+    os.environ["AWS_S3_ENDPOINT_URL"] = endpoint
+    os.environ["AWS_BUCKET"] = FAKE_S3_BUCKET
+    os.environ.setdefault("AWS_ACCESS_KEY_ID", "testing")
+    os.environ.setdefault("AWS_SECRET_ACCESS_KEY", "testing")
+    os.environ.setdefault("AWS_REGION", "us-east-1")
+
+    import boto3
+
+    boto3.client(
+        "s3",
+        endpoint_url=endpoint,
+        aws_access_key_id=os.environ["AWS_ACCESS_KEY_ID"],
+        aws_secret_access_key=os.environ["AWS_SECRET_ACCESS_KEY"],
+        region_name=os.environ["AWS_REGION"],
+    ).create_bucket(Bucket=FAKE_S3_BUCKET)
+    return server
+
+
+def fake_candidate(prefix: str = "bench") -> dict:
+    token = uuid.uuid4().hex[:12]
+    return {
+        "name": f"{prefix} {token}",
+        "email": f"{prefix}_{token}@example.com",
+        "mobile": str(uuid.uuid4().int)[:12],
+    }
+
+
+class QueryCounter:
+    """Counts SQL statements (and their time) run through an async engine."""
+
+    def __init__(self, async_engine):
+        from sqlalchemy import event
+
+        self.count = 0
+        self.seconds = 0.0
+        sync_engine = async_engine.sync_engine
+        event.listen(sync_engine, "before_cursor_execute", self._before)
+        event.listen(sync_engine, "after_cursor_execute", self._after)
+
+    def _before(self, conn, cursor, statement, parameters, context, executemany):
+        conn.info.setdefault("bench_query_started", []).append(time.perf_counter())
+
+    def _after(self, conn, cursor, statement, parameters, context, executemany):
+        started = conn.info["bench_query_started"].pop()
+        self.count += 1
+        self.seconds += time.perf_counter() - started
+
+    def reset(self):
+        self.count = 0
+        self.seconds = 0.0
+
+
+def save_baseline(path: str, meta: dict, results: dict):
+    with open(path, "w") as fh:
+        json.dump({"meta": meta, "results": results}, fh, indent=2, sort_keys=True)
+    print(f"baseline saved to {path}")
+
+
+def compare_to_baseline(path: str, results: dict, metrics):
+    """Print the relative change of each metric against a saved baseline."""
+    with open(path) as fh:
+        baseline = json.load(fh)
+    print(f"\nchange vs {path} (recorded {baseline['meta'].get('recorded_at', '?')})")
+    for name, stats in results.items():
+        before = baseline["results"].get(name)
+        if before is None:
+            print(f"{name:<24} not in baseline")
+            continue
+        deltas = []
+        for metric in metrics:
+            old, new = before.get(metric), stats.get(metric)
+            if not old or new is None:
+                continue
+            deltas.append(f"{metric}={(new - old) / old * 100:+.1f}%")
+        print(f"{name:<24} {' '.join(deltas)}")
@@ -0,0 +1,101 @@
+"""Request throughput with synchronous file handlers vs the queue pipeline.
+
+Serves a tiny endpoint that logs like the careers routes do (several
+f-string lines per request) and drives it in-process with httpx, first
+with FileHandlers on the root logger (the previous setup), then with
+app.core.logging's QueueHandler/QueueListener pipeline.
+
+    cd backend
+    python -m benchmarks.logging_throughput --requests 5000 --concurrency 50
+"""
+import argparse
+import asyncio
+import logging
+import tempfile
+import time
+
+from benchmarks.common import print_summary
+
+
+def build_app():
+    from fastapi import FastAPI
+
+    app = FastAPI()
+
+    @app.get("/work/{id}")
+    async def work(id: int):
+        logging.info(f"Request to fetch user with ID: {id}")
+        logging.info(f"Fetching user with ID: {id}")
+        logging.info(f"Successfully retrieved user: {id}")
+        logging.info(f"User retrieved successfully: {id}")
+        return {"id": id}
+
+    return app
+
+
+async def drive(app, requests: int, concurrency: int):
+    import httpx
+
+    latencies = []
+    counter = iter(range(requests))
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://bench") as client:
+
+        async def worker():
+            for index in counter:
+                started = time.perf_counter()
+                await client.get(f"/work/{index}")
+                latencies.append(time.perf_counter() - started)
+
+        started = time.perf_counter()
+        await asyncio.gather(*(worker() for _ in range(concurrency)))
+        elapsed = time.perf_counter() - started
+    return requests / elapsed, latencies
+
+
+def use_sync_handlers(directory: str):
+    from app.core.logging import stop_logging
+
+    stop_logging()
+    root = logging.getLogger()
+    root.setLevel(logging.DEBUG)
+    formatter = logging.Formatter(
+        "{levelname} {asctime} {name} {message}", datefmt="%Y-%m-%d %H:%M:%S", style="{"
+    )
+    for name, level in (("logger_app.log", logging.DEBUG), ("error_app.log", logging.ERROR)):
+        handler = logging.FileHandler(f"{directory}/{name}")
+        handler.setLevel(level)
+        handler.setFormatter(formatter)
+        root.addHandler(handler)
+
+
+def use_queue_pipeline(directory: str):
+    root = logging.getLogger()
+    for handler in list(root.handlers):
+        root.removeHandler(handler)
+        handler.close()
+    from app.core.logging import configure_logging
+
+    configure_logging(directory)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--requests", type=int, default=5000)
+    parser.add_argument("--concurrency", type=int, default=50)
+    args = parser.parse_args()
+
+    app = build_app()
+    for label, configure in (("sync FileHandler", use_sync_handlers), ("queue pipeline", use_queue_pipeline)):
+        with tempfile.TemporaryDirectory() as directory:
+            configure(directory)
+            throughput, latencies = asyncio.run(drive(app, args.requests, args.concurrency))
+            print(f"{label:<20} {throughput:>10.1f} req/s")
+            print_summary(f"  {label} latency", latencies)
+            from app.core.logging import stop_logging
+
+            stop_logging()
+
+
+if __name__ == "__main__":
+    main()
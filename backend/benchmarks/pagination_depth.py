@@ -0,0 +1,121 @@
+"""Offset vs keyset (cursor) listing latency by page depth.
+
+Seeds the careersusers table in DATABASE_URL with synthetic rows (user_id
+``seed_<n>``), then times get_all_users (OFFSET) and get_users_by_cursor at
+increasing page depths.
+
+    cd backend
+    python -m benchmarks.pagination_depth --rows 1000000
+    python -m benchmarks.pagination_depth --cleanup   # drop the seeded rows
+"""
+import argparse
+import asyncio
+import time
+
+from sqlalchemy import text
+
+from benchmarks.common import print_summary
+
+SEED_SQL = text(
+    """
+    INSERT INTO careersusers
+        (user_id, name, email, mobile, resume_filename, is_active, created_on)
+    SELECT 'seed_' || g, 'Seed User ' || g, 'seed_' || g || '@example.com',
+           'seed' || g, 'https://example.com/seed_' || g || '.pdf',
+           g % 20 <> 0, now()
+    FROM generate_series(:start, :stop) AS g
+    """
+)
+
+
+async def seed(rows: int):
+    from app.core.database import async_session
+
+    async with async_session() as db:
+        existing = (
+            await db.execute(
+                text("SELECT count(*) FROM careersusers WHERE user_id LIKE 'seed\\_%'")
+            )
+        ).scalar()
+        batch = 100_000
+        for start in range(existing + 1, rows + 1, batch):
+            stop = min(start + batch - 1, rows)
+            await db.execute(SEED_SQL, {"start": start, "stop": stop})
+            await db.commit()
+            print(f"seeded rows {start}..{stop}")
+        await db.execute(text("ANALYZE careersusers"))
+        await db.commit()
+
+
+async def cleanup():
+    from app.core.database import async_session
+
+    async with async_session() as db:
+        await db.execute(text("DELETE FROM careersusers WHERE user_id LIKE 'seed\\_%'"))
+        await db.commit()
+
+
+async def measure(args):
+    from app.core.database import async_session
+    from app.models.careersModel import CareersUsers
+    from app.services.careersServices import get_all_users, get_users_by_cursor
+    from app.services.pagination import encode_cursor
+    from sqlalchemy import select
+
+    async with async_session() as db:
+        for page in args.pages:
+            skip = (page - 1) * args.limit
+            offset_samples, cursor_samples = [], []
+
+            # Cursor a real client would hold after walking to this page
+            after = None
+            if skip:
+                boundary = (
+                    await db.execute(
+                        select(CareersUsers.id)
+                        .where(CareersUsers.is_active)
+                        .order_by(CareersUsers.id.desc())
+                        .offset(skip - 1)
+                        .limit(1)
+                    )
+                ).scalar()
+                if boundary is None:
+                    print(f"page {page}: beyond the seeded data, skipping")
+                    continue
+                after = encode_cursor({"id": boundary})
+
+            for _ in range(args.repeat):
+                started = time.perf_counter()
+                await get_all_users(db, skip, args.limit)
+                offset_samples.append(time.perf_counter() - started)
+
+                started = time.perf_counter()
+                await get_users_by_cursor(db, after, args.limit)
+                cursor_samples.append(time.perf_counter() - started)
+
+            print_summary(f"page {page:>6} offset", offset_samples)
+            print_summary(f"page {page:>6} cursor", cursor_samples)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--rows", type=int, default=1_000_000)
+    parser.add_argument("--limit", type=int, default=10)
+    parser.add_argument("--repeat", type=int, default=20)
+    parser.add_argument(
+        "--pages", type=int, nargs="+", default=[1, 10, 100, 1_000, 10_000, 50_000]
+    )
+    parser.add_argument("--skip-seed", action="store_true")
+    parser.add_argument("--cleanup", action="store_true")
+    args = parser.parse_args()
+
+    if args.cleanup:
+        asyncio.run(cleanup())
+        return
+    if not args.skip_seed:
+        asyncio.run(seed(args.rows))
+    asyncio.run(measure(args))
+
+
+if __name__ == "__main__":
+    main()
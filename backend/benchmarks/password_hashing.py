@@ -0,0 +1,87 @@
+"""Login storm: inline bcrypt vs the bounded password pool.
+
+Serves a login-like endpoint that verifies a bcrypt hash, either inline
+(verify_password) or through verify_password_async, floods it with
+concurrent requests and measures both login throughput and the latency of
+an unrelated endpoint probed at the same time.
+
+    cd backend
+    python -m benchmarks.password_hashing --logins 200 --concurrency 50
+"""
+import argparse
+import asyncio
+import time
+
+from benchmarks.common import print_summary
+
+PASSWORD = "correct horse battery staple"
+
+
+def build_app():
+    from fastapi import FastAPI
+    from app.core.security import hash_password, verify_password, verify_password_async
+
+    app = FastAPI()
+    hashed = hash_password(PASSWORD)
+
+    @app.post("/login-inline")
+    async def login_inline():
+        return {"ok": verify_password(PASSWORD, hashed)}
+
+    @app.post("/login-pool")
+    async def login_pool():
+        return {"ok": await verify_password_async(PASSWORD, hashed)}
+
+    @app.get("/ping")
+    async def ping():
+        return {"status": "ok"}
+
+    return app
+
+
+async def storm(app, path: str, logins: int, concurrency: int):
+    import httpx
+
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(
+        transport=transport, base_url="http://bench", timeout=600
+    ) as client:
+        remaining = iter(range(logins))
+        done = asyncio.Event()
+        probes = []
+
+        async def login_worker():
+            for _ in remaining:
+                await client.post(path)
+
+        async def probe():
+            while not done.is_set():
+                started = time.perf_counter()
+                await client.get("/ping")
+                probes.append(time.perf_counter() - started)
+                await asyncio.sleep(0.01)
+
+        prober = asyncio.create_task(probe())
+        started = time.perf_counter()
+        await asyncio.gather(*(login_worker() for _ in range(concurrency)))
+        elapsed = time.perf_counter() - started
+        done.set()
+        await prober
+    return logins / elapsed, probes
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--logins", type=int, default=200)
+    parser.add_argument("--concurrency", type=int, default=50)
+    args = parser.parse_args()
+
+    app = build_app()
+    for label, path in (("inline bcrypt", "/login-inline"), ("password pool", "/login-pool")):
+        throughput, probes = asyncio.run(storm(app, path, args.logins, args.concurrency))
+        print(f"{label:<16} {throughput:>8.1f} logins/s")
+        print_summary(f"  GET /ping during {label}", probes)
+
+
+if __name__ == "__main__":
+    main()
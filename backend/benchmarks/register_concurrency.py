@@ -0,0 +1,70 @@
+"""Fire many registrations at once and check that no user_id collides.
+
+    cd backend
+    python -m benchmarks.register_concurrency --registrations 300
+
+Uses the Postgres in DATABASE_URL and a moto S3 server; requires
+``moto[server]`` and ``httpx`` on top of requirements.txt.
+"""
+import argparse
+import asyncio
+import sys
+import time
+from collections import Counter
+
+from benchmarks.common import fake_candidate, print_summary, start_fake_s3
+
+
+async def run(args) -> bool:
+    import httpx
+    from app.main import app
+
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(
+        transport=transport, base_url="http://bench", timeout=300
+    ) as client:
+        latencies = []
+
+        async def register(index: int):
+            started = time.perf_counter()
+            response = await client.post(
+                "/api/v1/careers/",
+                data=fake_candidate("concurrency"),
+                files={"resume_file": (f"resume_{index}.pdf", b"%PDF-1.4\n", "application/pdf")},
+            )
+            latencies.append(time.perf_counter() - started)
+            return response
+
+        responses = await asyncio.gather(
+            *(register(i) for i in range(args.registrations))
+        )
+
+    statuses = Counter(response.status_code for response in responses)
+    user_ids = Counter(
+        response.json()["user_data"]["user_id"]
+        for response in responses
+        if response.status_code == 200
+    )
+    duplicates = {user_id: n for user_id, n in user_ids.items() if n > 1}
+
+    print(f"status codes: {dict(statuses)}")
+    print_summary("POST /careers/", latencies)
+    print(f"distinct user_ids: {len(user_ids)}, duplicates: {duplicates or 'none'}")
+    return statuses == Counter({200: args.registrations}) and not duplicates
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--registrations", type=int, default=300)
+    args = parser.parse_args()
+
+    server = start_fake_s3()
+    try:
+        ok = asyncio.run(run(args))
+    finally:
+        server.stop()
+    sys.exit(0 if ok else 1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,96 @@
+"""Listing latency while resume uploads are in flight.
+
+Runs the app in-process against the Postgres in DATABASE_URL and a moto S3
+server, fires concurrent registrations with large resumes and measures
+``GET /api/v1/careers/`` latency at the same time.
+
+    cd backend
+    python -m benchmarks.s3_upload_latency --uploads 20 --file-size-mb 5
+    python -m benchmarks.s3_upload_latency --blocking   # old inline boto3 calls
+
+Requires ``moto[server]`` and ``httpx`` on top of requirements.txt.
+"""
+import argparse
+import asyncio
+import time
+
+from benchmarks.common import fake_candidate, print_summary, start_fake_s3
+
+
+async def run(args):
+    import httpx
+    from app.main import app
+    from app.services import s3_upload
+
+    if args.blocking:
+        # Reproduce the previous behaviour: boto3 runs on the event loop
+        async def run_inline(func, *f_args, **f_kwargs):
+            return func(*f_args, **f_kwargs)
+
+        s3_upload.s3_executor.run = run_inline
+
+    payload = b"%PDF-1.4\n" + b"0" * (args.file_size_mb * 1024 * 1024)
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(
+        transport=transport, base_url="http://bench", timeout=300
+    ) as client:
+        idle = []
+        for _ in range(args.requests):
+            started = time.perf_counter()
+            await client.get("/api/v1/careers/")
+            idle.append(time.perf_counter() - started)
+
+        uploads_done = asyncio.Event()
+        busy = []
+
+        async def upload(index: int):
+            await client.post(
+                "/api/v1/careers/",
+                data=fake_candidate(),
+                # Distinct bytes per upload, or resume dedup would skip them
+                files={
+                    "resume_file": (
+                        f"resume_{index}.pdf",
+                        payload + str(index).encode(),
+                        "application/pdf",
+                    )
+                },
+            )
+
+        async def reader():
+            while not uploads_done.is_set():
+                started = time.perf_counter()
+                await client.get("/api/v1/careers/")
+                busy.append(time.perf_counter() - started)
+
+        readers = [asyncio.create_task(reader()) for _ in range(args.readers)]
+        started = time.perf_counter()
+        await asyncio.gather(*(upload(i) for i in range(args.uploads)))
+        upload_seconds = time.perf_counter() - started
+        uploads_done.set()
+        await asyncio.gather(*readers)
+
+    mode = "blocking" if args.blocking else "executor"
+    print(f"mode={mode} uploads={args.uploads} x {args.file_size_mb}MB in {upload_seconds:.2f}s")
+    print_summary("GET /careers/ idle", idle)
+    print_summary("GET /careers/ during uploads", busy)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--uploads", type=int, default=20)
+    parser.add_argument("--file-size-mb", type=int, default=5)
+    parser.add_argument("--readers", type=int, default=10)
+    parser.add_argument("--requests", type=int, default=50)
+    parser.add_argument("--blocking", action="store_true")
+    args = parser.parse_args()
+
+    server = start_fake_s3()
+    try:
+        asyncio.run(run(args))
+    finally:
+        server.stop()
+
+
+if __name__ == "__main__":
+    main()
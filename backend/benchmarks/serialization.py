@@ -0,0 +1,101 @@
+"""Response serialization cost for one listing page.
+
+Serves a synthetic 100-row page two ways and times full requests through
+the ASGI stack (no database):
+
+* ``orm``: ORM instances, ``CareerUserResponse.from_orm`` per row and a
+  dict returned through ``response_model`` (the previous route code);
+* ``rows``: plain row mappings encoded by ``json_response`` in one
+  validate + dump_json pass.
+
+    cd backend
+    python -m benchmarks.serialization --rows 100 --requests 2000
+"""
+import argparse
+import asyncio
+import time
+from datetime import datetime, timedelta
+
+from benchmarks.common import print_summary
+
+
+def build_app(rows: int):
+    from fastapi import FastAPI
+    from app.models.careersModel import CareersUsers
+    from app.schemas.careersSchemas import CareerUserResponse, PaginatedCareerUsersResponse
+    from app.services.serialization import json_response, paginated_users_adapter
+
+    created = datetime(2024, 1, 1)
+    records = [
+        {
+            "id": n,
+            "user_id": f"user_{n}",
+            "name": f"Bench User {n}",
+            "email": f"bench_{n}@example.com",
+            "mobile": f"98{n:08d}",
+            "resume_filename": f"https://example.com/user_{n}_resume.pdf",
+            "is_active": True,
+            "created_on": created + timedelta(minutes=n),
+            "updated_on": None,
+        }
+        for n in range(rows, 0, -1)
+    ]
+
+    app = FastAPI()
+
+    @app.get("/orm", response_model=PaginatedCareerUsersResponse)
+    async def orm_page():
+        # Built per request, as the session would for each query
+        users = [CareersUsers(**record) for record in records]
+        return {
+            "status_code": 200,
+            "message": "Users retrieved successfully",
+            "total_users": rows,
+            "users": [CareerUserResponse.from_orm(user) for user in users],
+            "next_cursor": "eyJpZCI6IDF9",
+        }
+
+    @app.get("/rows", response_model=PaginatedCareerUsersResponse)
+    async def rows_page():
+        return json_response(
+            paginated_users_adapter,
+            {"total_users": rows, "users": records, "next_cursor": "eyJpZCI6IDF9"},
+        )
+
+    return app
+
+
+async def run(app, path: str, requests: int):
+    import httpx
+
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://bench") as client:
+        first = (await client.get(path)).json()
+        samples = []
+        for _ in range(requests):
+            started = time.perf_counter()
+            response = await client.get(path)
+            samples.append(time.perf_counter() - started)
+            response.raise_for_status()
+    return first, samples
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--rows", type=int, default=100)
+    parser.add_argument("--requests", type=int, default=2000)
+    args = parser.parse_args()
+
+    app = build_app(args.rows)
+    bodies = {}
+    for label, path in (("orm + response_model", "/orm"), ("rows + json_response", "/rows")):
+        bodies[path], samples = asyncio.run(run(app, path, args.requests))
+        print_summary(f"GET {args.rows}-row page, {label}", samples)
+        total = sum(samples)
+        print(f"  {args.requests / total:>8.1f} pages/s")
+    if bodies["/orm"] != bodies["/rows"]:
+        print("WARNING: the two paths produced different JSON bodies")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,77 @@
+import uuid
+from datetime import datetime, timedelta, timezone
+from jose import jwt
+from app.core.revocation import PostgresRevocationStore
+from app.core.security import ALGORITHM, SECRET_KEY
+from app.services.authServices import create_user
+
+PASSWORD = "correct horse battery staple"
+
+
+async def log_in(client, email: str, password: str = PASSWORD):
+    return await client.post(
+        "/api/v1/auth/token", data={"username": email, "password": password}
+    )
+
+
+async def test_login_issues_tokens_for_the_user(db, client):
+    user = await create_user(db, "staff@example.com", PASSWORD)
+
+    response = await log_in(client, "staff@example.com")
+
+    assert response.status_code == 200
+    body = response.json()
+    assert body["token_type"] == "bearer"
+    claims = jwt.decode(body["access_token"], SECRET_KEY, algorithms=[ALGORITHM])
+    assert claims["sub"] == user.user_id
+    assert user.hashed_password != PASSWORD
+
+
+async def test_login_rejects_bad_credentials_and_inactive_users(db, client):
+    user = await create_user(db, "staff@example.com", PASSWORD)
+
+    assert (await log_in(client, "staff@example.com", "wrong")).status_code == 401
+    assert (await log_in(client, "nobody@example.com")).status_code == 401
+
+    user.is_active = False
+    await db.commit()
+    assert (await log_in(client, "staff@example.com")).status_code == 401
+
+
+async def test_deactivation_takes_effect_despite_the_principal_cache(db, client):
+    await create_user(db, "staff@example.com", PASSWORD)
+    token = (await log_in(client, "staff@example.com")).json()["access_token"]
+    headers = {"Authorization": f"Bearer {token}"}
+
+    # Caches the principal
+    me = await client.get("/api/v1/auth/me", headers=headers)
+    assert me.status_code == 200
+    assert me.json()["email"] == "staff@example.com"
+
+    assert (await client.delete("/api/v1/auth/me", headers=headers)).status_code == 200
+    assert (await client.get("/api/v1/auth/me", headers=headers)).status_code == 403
+
+
+async def test_logout_revokes_the_token(db, client):
+    await create_user(db, "staff@example.com", PASSWORD)
+    token = (await log_in(client, "staff@example.com")).json()["access_token"]
+    headers = {"Authorization": f"Bearer {token}"}
+    assert (await client.get("/api/v1/auth/me", headers=headers)).status_code == 200
+
+    assert (await client.post("/api/v1/auth/logout", headers=headers)).status_code == 200
+
+    me = await client.get("/api/v1/auth/me", headers=headers)
+    assert me.status_code == 401
+    assert me.json()["detail"] == "Token has been revoked"
+
+
+async def test_postgres_store_keeps_aware_expiry_times(db):
+    store = PostgresRevocationStore()
+    live, expired = uuid.uuid4().hex, uuid.uuid4().hex
+    now = datetime.now(timezone.utc)
+
+    await store.revoke(live, now + timedelta(minutes=5))
+    await store.revoke(expired, now - timedelta(seconds=1))
+
+    assert await store.is_revoked(live)
+    assert not await store.is_revoked(expired)
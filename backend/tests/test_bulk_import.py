@@ -0,0 +1,59 @@
+import io
+import zipfile
+from fastapi import UploadFile
+from app.core.config import settings
+from app.services.bulk_import import ImportRow, ResumeSource, parse_manifest, validate_rows
+
+
+def upload(name: str, content: bytes) -> UploadFile:
+    return UploadFile(file=io.BytesIO(content), filename=name)
+
+
+def zipped(members: dict) -> UploadFile:
+    buffer = io.BytesIO()
+    with zipfile.ZipFile(buffer, "w") as archive:
+        for name, content in members.items():
+            archive.writestr(name, content)
+    buffer.seek(0)
+    return upload("resumes.zip", buffer.getvalue())
+
+
+def test_jsonl_values_are_coerced_and_non_objects_rejected():
+    records = parse_manifest(
+        b'{"name": "Ann", "email": "ann@example.com", "mobile": 9876543210, "resume": "a.pdf"}\n'
+        b'["not", "an", "object"]\n',
+        "rows.jsonl",
+    )
+    rows = [ImportRow(number, record) for number, record in enumerate(records, start=1)]
+    resumes = ResumeSource(None, [upload("a.pdf", b"%PDF")])
+    validate_rows(rows, resumes)
+
+    assert rows[0].mobile == "9876543210"
+    assert rows[0].error is None
+    assert rows[1].error == "Manifest row must be a JSON object"
+
+
+def test_uploaded_files_are_size_checked(monkeypatch):
+    monkeypatch.setattr(settings, "MAX_RESUME_SIZE_BYTES", 4)
+    resumes = ResumeSource(None, [upload("big.pdf", b"12345"), upload("ok.pdf", b"1234")])
+
+    assert "exceeds" in resumes.check("big.pdf")
+    assert resumes.check("ok.pdf") is None
+
+
+def test_colliding_zip_basenames_are_ambiguous():
+    resumes = ResumeSource(zipped({"a/cv.pdf": b"one", "b/cv.pdf": b"two", "c.pdf": b"x"}), [])
+
+    assert "more than one" in resumes.check("cv.pdf")
+    assert resumes.check("c.pdf") is None
+
+
+def test_rows_sharing_an_upload_get_independent_handles():
+    resumes = ResumeSource(None, [upload("cv.pdf", b"abcdef")])
+    first, second = resumes.open("cv.pdf"), resumes.open("cv.pdf")
+
+    assert first.read(3) == b"abc"
+    assert second.read() == b"abcdef"
+    first.close()
+    assert resumes.open("cv.pdf").read() == b"abcdef"
+
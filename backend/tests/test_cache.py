@@ -0,0 +1,87 @@
+from app.core import cache
+from app.core.cache import FakeSharedCache, LRUCache, ReadThroughCache, build_cache
+
+
+class BrokenCache(FakeSharedCache):
+    async def get(self, key):
+        raise ConnectionError("down")
+
+    async def set(self, key, value, ttl_seconds):
+        raise ConnectionError("down")
+
+    async def delete(self, key):
+        raise ConnectionError("down")
+
+
+async def test_lru_evicts_least_recently_used_and_expires_entries():
+    lru = LRUCache(max_entries=2)
+    await lru.set("a", 1, 60)
+    await lru.set("b", 2, 60)
+    assert await lru.get("a") == 1
+    await lru.set("c", 3, 60)
+
+    assert await lru.get("b") is None
+    assert await lru.get("a") == 1 and await lru.get("c") == 3
+
+    await lru.set("old", 4, 0)
+    assert len(lru) == 2
+    assert await lru.get("old") is None
+    assert len(lru) == 1
+
+
+async def test_shared_hits_fill_the_local_lru_and_invalidation_reaches_both():
+    shared = FakeSharedCache()
+    writer = ReadThroughCache("user", LRUCache(10), shared)
+    reader = ReadThroughCache("user", LRUCache(10), shared)
+
+    await writer.set(1, {"name": "Ada"})
+    assert await reader.get(1) == {"name": "Ada"}
+    assert await reader.local.get("user:1") == {"name": "Ada"}
+
+    await writer.invalidate(1)
+    assert await writer.get(1) is None
+    assert await shared.get("user:1") is None
+    assert writer.stats()["misses"] == 1
+
+
+async def test_shared_backend_errors_are_misses():
+    broken = ReadThroughCache("user", LRUCache(10), BrokenCache())
+
+    await broken.set(1, {"name": "Ada"})
+    await broken.invalidate(1)
+    assert await broken.get(1) is None
+
+
+async def test_value_loaded_before_an_invalidation_is_not_cached():
+    profiles = ReadThroughCache("user", LRUCache(10))
+
+    version = profiles.version()
+    await profiles.invalidate(1)
+    await profiles.set(1, {"name": "stale"}, version=version)
+    await profiles.set(2, {"name": "other"}, version=version)
+
+    assert await profiles.get(1) is None
+    assert await profiles.get(2) == {"name": "other"}
+
+    await profiles.set(1, {"name": "fresh"}, version=profiles.version())
+    assert await profiles.get(1) == {"name": "fresh"}
+
+
+async def test_forgotten_invalidations_still_reject_older_reads():
+    profiles = ReadThroughCache("user", LRUCache(1))
+
+    version = profiles.version()
+    await profiles.invalidate(1)
+    await profiles.invalidate(2)
+    await profiles.set(1, {"name": "stale"}, version=version)
+
+    assert await profiles.get(1) is None
+
+
+def test_redis_backend_without_url_falls_back_to_memory(monkeypatch):
+    monkeypatch.setattr(cache.settings, "CACHE_BACKEND", "redis")
+    monkeypatch.setattr(cache.settings, "REDIS_URL", None)
+
+    profiles = build_cache("user")
+
+    assert profiles.shared is None and profiles.local is not None
@@ -0,0 +1,37 @@
+"""ETag revalidation of the listing endpoint."""
+from app.models.careersModel import CareersUsers
+
+API = "/api/v1/careers/"
+
+
+async def test_listing_revalidates_until_the_page_changes(db, client):
+    user = CareersUsers(name="Ada", email="ada@example.com", mobile="9000000001")
+    db.add(user)
+    await db.commit()
+
+    first = await client.get(API, params={"count": "exact"})
+    etag = first.headers["etag"]
+    assert first.status_code == 200
+
+    again = await client.get(API, params={"count": "exact"}, headers={"If-None-Match": etag})
+    assert again.status_code == 304
+
+    user.name = "Ada Lovelace"
+    await db.commit()
+    changed = await client.get(API, params={"count": "exact"}, headers={"If-None-Match": etag})
+    assert changed.status_code == 200
+    assert changed.json()["users"][0]["name"] == "Ada Lovelace"
+    assert changed.headers["etag"] != etag
+
+
+async def test_count_source_is_part_of_the_listing_etag(db, client):
+    db.add(CareersUsers(name="Ada", email="ada@example.com", mobile="9000000001"))
+    await db.commit()
+
+    exact = await client.get(API, params={"count": "exact"})
+    cached = await client.get(
+        API, params={"count": "cached"}, headers={"If-None-Match": exact.headers["etag"]}
+    )
+
+    assert cached.status_code == 200
+    assert cached.headers["etag"] != exact.headers["etag"]
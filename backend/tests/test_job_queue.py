@@ -0,0 +1,51 @@
+import asyncio
+import os
+from types import SimpleNamespace
+from sqlalchemy import select
+from app.models.jobModel import DeadJob
+from app.services import job_queue
+from app.services.job_queue import claim_job, enqueue_job, run_job
+import app.services.job_handlers  # noqa: F401  (registers the job handlers)
+
+
+async def test_dead_upload_job_discards_its_staged_file(db, tmp_path, monkeypatch):
+    staged = tmp_path / "staged_resume.pdf"
+    staged.write_bytes(b"%PDF-1.4")
+
+    async def broken_upload(payload):
+        raise RuntimeError("storage is down")
+
+    monkeypatch.setitem(job_queue.JOB_HANDLERS, "upload_resume", broken_upload)
+    enqueue_job(db, "upload_resume", {"staged_path": str(staged)}, max_attempts=1)
+    await db.commit()
+
+    await run_job(await claim_job(db))
+
+    dead = (await db.execute(select(DeadJob))).scalar_one()
+    assert dead.kind == "upload_resume"
+    assert "storage is down" in dead.last_error
+    assert not os.path.exists(staged)
+
+
+async def test_worker_keeps_running_when_a_job_cannot_be_settled(monkeypatch):
+    stop = asyncio.Event()
+    jobs = [SimpleNamespace(id=1, kind="send_registration_email"), None]
+    ran = []
+
+    async def claim(db):
+        if not jobs:
+            stop.set()
+            return None
+        return jobs.pop(0)
+
+    async def unsettled(job):
+        ran.append(job.id)
+        raise OSError("database went away")
+
+    monkeypatch.setattr(job_queue, "claim_job", claim)
+    monkeypatch.setattr(job_queue, "run_job", unsettled)
+    monkeypatch.setattr(job_queue.settings, "JOB_POLL_SECONDS", 0.01)
+
+    await job_queue.run_worker(stop, concurrency=1)
+
+    assert ran == [1] and not jobs
@@ -0,0 +1,41 @@
+import io
+import httpx
+from fastapi import FastAPI
+from app.services.storage import LocalStorage
+
+
+def local_app(tmp_path):
+    storage = LocalStorage(str(tmp_path), "/media")
+    app = FastAPI()
+    storage.mount(app)
+
+    @app.get("/download/{key:path}")
+    async def download(key: str):
+        return await storage.download_response(key, "cv.txt", "text/plain")
+
+    return storage, httpx.AsyncClient(transport=httpx.ASGITransport(app=app), base_url="http://test")
+
+
+async def test_saved_resume_is_served_at_its_url_with_ranges(tmp_path):
+    storage, client = local_app(tmp_path)
+    url = await storage.save(io.BytesIO(b"0123456789"), "resumes/abc.txt")
+
+    assert url == "/media/resumes/abc.txt"
+    assert await storage.stat("resumes/abc.txt") == {"size": 10, "content_type": "text/plain"}
+    async with client:
+        full = await client.get(url)
+        assert full.status_code == 200 and full.content == b"0123456789"
+
+        for path in (url, "/download/resumes/abc.txt"):
+            part = await client.get(path, headers={"Range": "bytes=2-5"})
+            assert part.status_code == 206
+            assert part.content == b"2345"
+
+
+async def test_only_resumes_are_exposed(tmp_path):
+    storage, client = local_app(tmp_path)
+    await storage.save(io.BytesIO(b"partial"), "incoming/upload")
+
+    async with client:
+        assert (await client.get("/media/incoming/upload")).status_code == 404
+        assert (await client.get("/media/resumes/../incoming/upload")).status_code == 404
@@ -0,0 +1,32 @@
+import logging
+import queue
+from app.core.logging import DeferredQueueHandler, JsonFormatter
+
+
+class ExplodingFormatter(logging.Formatter):
+    def format(self, record):
+        raise AssertionError("formatted on the calling thread")
+
+
+def test_records_are_enqueued_with_args_and_traceback_resolved():
+    log_queue = queue.SimpleQueue()
+    handler = DeferredQueueHandler(log_queue)
+    handler.setFormatter(ExplodingFormatter())
+    logger = logging.getLogger("tests.deferred")
+    logger.addHandler(handler)
+    pending = ["upload"]
+    try:
+        try:
+            raise ValueError("boom")
+        except ValueError:
+            logger.error("failed %s", pending, exc_info=True)
+        pending.append("retry")
+    finally:
+        logger.removeHandler(handler)
+
+    record = log_queue.get_nowait()
+    assert record.args is None and record.exc_info is None
+    text = logging.Formatter().format(record)
+    assert text.startswith("failed ['upload']")
+    assert "ValueError: boom" in text
+    assert "ValueError: boom" in JsonFormatter().format(record)
@@ -0,0 +1,14 @@
+async def test_requests_are_labelled_by_their_full_route_template(db, client):
+    assert (await client.get("/")).status_code == 200
+    assert (await client.get("/api/v1/careers/")).status_code == 200
+    await client.get("/api/v1/careers/999999")
+
+    scrape = (await client.get("/metrics")).text
+
+    assert 'http_request_duration_seconds_count{method="GET",route="/",status="200"}' in scrape
+    assert (
+        'http_request_duration_seconds_count{method="GET",route="/api/v1/careers/",status="200"}'
+        in scrape
+    )
+    assert 'route="/api/v1/careers/{id}"' in scrape
+    assert 'http_request_sql_statements_count{route="/api/v1/careers/"}' in scrape
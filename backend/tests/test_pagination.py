@@ -0,0 +1,47 @@
+"""Keyset cursors and the listing's paging parameters."""
+import base64
+import json
+import pytest
+from fastapi import HTTPException
+from app.services.pagination import decode_cursor, encode_cursor
+
+
+def raw_cursor(position) -> str:
+    return base64.urlsafe_b64encode(json.dumps(position).encode()).decode()
+
+
+def test_cursor_round_trip():
+    token = encode_cursor({"score": 1.25, "id": 42})
+
+    assert decode_cursor(token, score=float, id=int) == {"score": 1.25, "id": 42}
+
+
+@pytest.mark.parametrize(
+    "token",
+    [
+        raw_cursor({"id": "42"}),
+        raw_cursor({"id": 4.2}),
+        raw_cursor({"id": True}),
+        raw_cursor({"id": 2**40}),
+        raw_cursor({"other": 1}),
+        raw_cursor([42]),
+        "not a cursor",
+    ],
+)
+def test_invalid_cursor_is_a_400(token):
+    with pytest.raises(HTTPException) as raised:
+        decode_cursor(token, id=int)
+
+    assert raised.value.status_code == 400
+
+
+def test_float_keys_accept_integers_but_not_infinity():
+    assert decode_cursor(raw_cursor({"score": 1, "id": 1}), score=float, id=int)
+    with pytest.raises(HTTPException):
+        decode_cursor(raw_cursor({"score": float("inf"), "id": 1}), score=float, id=int)
+
+
+async def test_listing_rejects_zero_limit(client):
+    response = await client.get("/api/v1/careers/", params={"limit": 0})
+
+    assert response.status_code == 422
@@ -0,0 +1,87 @@
+"""Direct-to-S3 resume uploads: presign, then confirm."""
+import httpx
+from app.core.config import settings
+from app.models.careersModel import CareersUsers
+
+API = "/api/v1/careers"
+
+
+async def candidate(db, email: str = "ada@example.com") -> CareersUsers:
+    user = CareersUsers(name="Ada", email=email, mobile=email.split("@")[0], is_active=True)
+    db.add(user)
+    await db.commit()
+    return user
+
+
+async def presign(client, user, filename="cv.pdf", content_type="application/pdf"):
+    return await client.post(
+        f"{API}/{user.id}/resume/presign",
+        json={"filename": filename, "content_type": content_type},
+    )
+
+
+async def confirm(client, user, key: str):
+    return await client.post(f"{API}/{user.id}/resume/confirm", json={"key": key})
+
+
+async def test_presigned_upload_round_trip(db, client, s3):
+    user = await candidate(db)
+
+    response = await presign(client, user)
+    assert response.status_code == 200
+    presigned = response.json()
+    assert presigned["key"] == f"{user.user_id}_cv.pdf"
+
+    upload = httpx.post(
+        presigned["url"],
+        data=presigned["fields"],
+        files={"file": ("cv.pdf", b"%PDF-1.4 ada", "application/pdf")},
+    )
+    assert upload.status_code in (200, 204)
+
+    confirmed = await confirm(client, user, presigned["key"])
+    assert confirmed.status_code == 200
+    assert confirmed.json()["user_data"]["resume_filename"].endswith(presigned["key"])
+
+
+async def test_presign_rejects_unsupported_content_type(db, client, s3):
+    user = await candidate(db)
+
+    assert (await presign(client, user, "cv.html", "text/html")).status_code == 415
+
+
+async def test_confirm_rejects_another_users_key(db, client, s3):
+    owner = await candidate(db, "ada@example.com")
+    other = await candidate(db, "grace@example.com")
+    s3_client, bucket = s3
+    key = f"{owner.user_id}_cv.pdf"
+    s3_client.put_object(Bucket=bucket, Key=key, Body=b"%PDF", ContentType="application/pdf")
+
+    response = await confirm(client, other, key)
+
+    assert response.status_code == 400
+
+
+async def test_confirm_requires_the_object(db, client, s3):
+    user = await candidate(db)
+
+    assert (await confirm(client, user, f"{user.user_id}_never-uploaded.pdf")).status_code == 404
+
+
+async def test_confirm_rejects_oversize_objects(db, client, s3, monkeypatch):
+    monkeypatch.setattr(settings, "MAX_RESUME_SIZE_BYTES", 4)
+    user = await candidate(db)
+    s3_client, bucket = s3
+    key = f"{user.user_id}_big.pdf"
+    s3_client.put_object(Bucket=bucket, Key=key, Body=b"%PDF-1.4", ContentType="application/pdf")
+
+    assert (await confirm(client, user, key)).status_code == 413
+
+
+async def test_confirm_rejects_wrong_content_type(db, client, s3):
+    user = await candidate(db)
+    s3_client, bucket = s3
+    key = f"{user.user_id}_cv.pdf"
+    s3_client.put_object(Bucket=bucket, Key=key, Body=b"<html>", ContentType="text/html")
+
+    assert (await confirm(client, user, key)).status_code == 415
@@ -0,0 +1,31 @@
+import os
+import sys
+from pathlib import Path
+import pytest
+from app.core.profiling import ProfileStore, load_profiler
+
+
+def test_load_profiler_fails_fast_without_pyinstrument(monkeypatch):
+    monkeypatch.setitem(sys.modules, "pyinstrument", None)
+
+    with pytest.raises(RuntimeError, match="pyinstrument"):
+        load_profiler()
+
+
+def test_store_keeps_newest_and_tolerates_vanished_files(tmp_path, monkeypatch):
+    store = ProfileStore(str(tmp_path), max_profiles=3)
+    for number in range(3):
+        store.save(f"p{number}", "{}", {"id": f"p{number}"})
+        os.utime(tmp_path / f"p{number}.meta.json", (number, number))
+    store.max_profiles = 2
+    store._prune()
+
+    assert [meta["id"] for meta in store.list()] == ["p2", "p1"]
+
+    # Another worker pruning between the glob and the stat must not break us
+    real_glob = Path.glob
+    monkeypatch.setattr(
+        Path, "glob", lambda self, pattern: [*real_glob(self, pattern), tmp_path / "gone.meta.json"]
+    )
+    assert [meta["id"] for meta in store.list()] == ["p2", "p1"]
+    store._prune()
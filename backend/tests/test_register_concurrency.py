@@ -0,0 +1,26 @@
+"""Concurrent registrations, the test counterpart of
+benchmarks/register_concurrency."""
+import asyncio
+from sqlalchemy import select
+from app.models.careersModel import CareersUsers
+from benchmarks.common import fake_candidate
+
+REGISTRATIONS = 40
+
+
+async def test_concurrent_registrations_get_distinct_user_ids(client, db, s3):
+    async def register(index: int):
+        return await client.post(
+            "/api/v1/careers/",
+            data=fake_candidate("concurrency"),
+            files={"resume_file": (f"resume_{index}.pdf", b"%PDF-1.4\n", "application/pdf")},
+        )
+
+    responses = await asyncio.gather(*(register(i) for i in range(REGISTRATIONS)))
+
+    assert [response.status_code for response in responses] == [200] * REGISTRATIONS
+    returned = [response.json()["user_data"]["user_id"] for response in responses]
+    assert len(set(returned)) == REGISTRATIONS
+
+    stored = (await db.execute(select(CareersUsers.user_id))).scalars().all()
+    assert sorted(stored) == sorted(returned)
@@ -0,0 +1,93 @@
+"""Content-addressed resume storage (resume_blobs)."""
+import io
+from sqlalchemy import func, select, update
+from app.models.careersModel import CareersUsers
+from app.models.resumeBlobModel import CareersUserResume, ResumeBlob
+from app.services.resume_store import link_resume, purge_unreferenced_blobs, store_resume
+from tests.test_streaming_registration import bucket_keys
+
+API = "/api/v1/careers"
+
+
+async def blob_count(db) -> int:
+    return (await db.execute(select(func.count()).select_from(ResumeBlob))).scalar()
+
+
+async def register(client, email: str, mobile: str, resume: bytes):
+    return await client.post(
+        f"{API}/",
+        data={"name": "Ada Lovelace", "email": email, "mobile": mobile},
+        files={"resume_file": ("resume.pdf", resume, "application/pdf")},
+    )
+
+
+async def test_identical_resumes_are_stored_once(db, s3):
+    first = await store_resume(db, io.BytesIO(b"%PDF-1.4 same"), "a.pdf")
+    second = await store_resume(db, io.BytesIO(b"%PDF-1.4 same"), "b.pdf")
+
+    assert not first.deduplicated
+    assert second.deduplicated
+    assert second.key == first.key
+    assert first.key in bucket_keys(s3)
+    assert await blob_count(db) == 1
+
+
+async def test_blob_of_a_failed_registration_is_kept_and_reused(db, client, s3):
+    assert (await register(client, "ada@example.com", "9000000001", b"%PDF one")).status_code == 200
+
+    failed = await register(client, "ada@example.com", "9000000002", b"%PDF two")
+    assert failed.status_code == 409
+    assert await blob_count(db) == 2
+    keys_after_failure = bucket_keys(s3)
+
+    retried = await register(client, "grace@example.com", "9000000002", b"%PDF two")
+    assert retried.status_code == 200
+    assert bucket_keys(s3) == keys_after_failure
+    assert await blob_count(db) == 2
+
+
+async def test_bulk_rows_sharing_a_resume_upload_it_once(db, client, s3):
+    manifest = (
+        "name,email,mobile,resume\n"
+        "Ada,ada@example.com,9000000001,cv.pdf\n"
+        "Grace,grace@example.com,9000000002,cv.pdf\n"
+    )
+    keys_before = bucket_keys(s3)
+
+    response = await client.post(
+        f"{API}/bulk",
+        files=[
+            ("manifest", ("rows.csv", manifest.encode(), "text/csv")),
+            ("resume_files", ("cv.pdf", b"%PDF-1.4 shared", "application/pdf")),
+        ],
+    )
+
+    assert response.status_code == 200
+    assert response.json()["created"] == 2
+    assert len(bucket_keys(s3) - keys_before) == 1
+    links = (await db.execute(select(CareersUserResume.sha256))).scalars().all()
+    assert len(links) == 2 and len(set(links)) == 1
+
+
+async def test_purge_deletes_only_old_unreferenced_blobs(db, s3):
+    linked = await store_resume(db, io.BytesIO(b"%PDF linked"), "linked.pdf")
+    orphan = await store_resume(db, io.BytesIO(b"%PDF orphan"), "orphan.pdf")
+    recent = await store_resume(db, io.BytesIO(b"%PDF recent"), "recent.pdf")
+    user = CareersUsers(name="Ada", email="ada@example.com", mobile="9000000001")
+    db.add(user)
+    await db.flush()
+    await link_resume(db, user.id, linked.sha256, "linked.pdf")
+    await db.execute(
+        update(ResumeBlob)
+        .where(ResumeBlob.sha256.in_([linked.sha256, orphan.sha256]))
+        .values(last_seen_on=func.now() - func.make_interval(0, 0, 0, 30))
+    )
+    await db.commit()
+
+    assert await purge_unreferenced_blobs(db) == 1
+
+    remaining = set((await db.execute(select(ResumeBlob.sha256))).scalars().all())
+    assert remaining == {linked.sha256, recent.sha256}
+    keys = bucket_keys(s3)
+    assert orphan.key not in keys
+    assert {linked.key, recent.key} <= keys
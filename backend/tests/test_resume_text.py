@@ -0,0 +1,103 @@
+"""Resume text indexing (extract_and_store)."""
+from sqlalchemy import func, select
+from app.core.config import settings
+from app.core.database import async_session
+from app.models.jobModel import Job
+from app.models.careersModel import CareersUsers
+from app.models.resumeTextModel import CareersResumeText
+from app.services import resume_text
+from app.services.resume_text import extract_and_store, schedule_resume_extraction
+from app.services.storage import storage
+
+
+async def indexed_text(db, careersuser_id: int):
+    result = await db.execute(
+        select(CareersResumeText.content).where(
+            CareersResumeText.careersuser_id == careersuser_id
+        )
+    )
+    return result.scalar_one_or_none()
+
+
+async def test_resume_without_text_clears_the_previous_index(db, s3):
+    client, bucket = s3
+    client.put_object(Bucket=bucket, Key="resumes/old.txt", Body=b"Python and Postgres")
+    client.put_object(Bucket=bucket, Key="resumes/new.txt", Body=b"   \n")
+    user = CareersUsers(
+        name="Ada",
+        email="ada@example.com",
+        mobile="9000000001",
+        resume_filename=storage.url("resumes/old.txt"),
+    )
+    db.add(user)
+    await db.commit()
+    user_id = user.id
+
+    await extract_and_store(user_id, "resumes/old.txt")
+    assert await indexed_text(db, user_id) == "Python and Postgres"
+
+    user.resume_filename = storage.url("resumes/new.txt")
+    await db.commit()
+    await extract_and_store(user_id, "resumes/new.txt")
+    assert await indexed_text(db, user_id) is None
+
+
+async def test_extraction_of_a_replaced_resume_finishing_last_is_dropped(db, s3):
+    client, bucket = s3
+    client.put_object(Bucket=bucket, Key="resumes/first.txt", Body=b"COBOL")
+    client.put_object(Bucket=bucket, Key="resumes/second.txt", Body=b"Rust")
+    client.put_object(Bucket=bucket, Key="resumes/blank.txt", Body=b" ")
+    user = CareersUsers(
+        name="Ada",
+        email="ada@example.com",
+        mobile="9000000001",
+        resume_filename=storage.url("resumes/second.txt"),
+    )
+    db.add(user)
+    await db.commit()
+    user_id = user.id
+
+    await extract_and_store(user_id, "resumes/second.txt")
+    await extract_and_store(user_id, "resumes/first.txt")
+    await extract_and_store(user_id, "resumes/blank.txt")
+
+    assert await indexed_text(db, user_id) == "Rust"
+
+
+async def queued_jobs(kind: str) -> int:
+    async with async_session() as other:
+        result = await other.execute(select(func.count(Job.id)).where(Job.kind == kind))
+        return result.scalar()
+
+
+async def test_queued_extractions_join_the_callers_transaction(db, monkeypatch):
+    monkeypatch.setattr(settings, "RESUME_EXTRACTION_ENABLED", True)
+    monkeypatch.setattr(settings, "JOB_QUEUE_ENABLED", True)
+
+    schedule_resume_extraction(db, 1, "resumes/a.txt")
+    await db.rollback()
+    for number in range(3):
+        schedule_resume_extraction(db, number, f"resumes/{number}.txt")
+    assert await queued_jobs("extract_resume_text") == 0
+
+    await db.commit()
+    assert await queued_jobs("extract_resume_text") == 3
+
+
+async def test_in_process_extractions_start_only_after_commit(db, monkeypatch):
+    started = []
+    monkeypatch.setattr(settings, "RESUME_EXTRACTION_ENABLED", True)
+    monkeypatch.setattr(settings, "JOB_QUEUE_ENABLED", False)
+    monkeypatch.setattr(
+        resume_text, "start_resume_extraction", lambda *args: started.append(args)
+    )
+
+    await db.execute(select(1))
+    schedule_resume_extraction(db, 1, "resumes/rolled-back.txt")
+    await db.rollback()
+    await db.execute(select(1))
+    schedule_resume_extraction(db, 2, "resumes/kept.txt")
+    assert started == []
+
+    await db.commit()
+    assert started == [(2, "resumes/kept.txt")]
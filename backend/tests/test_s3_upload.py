@@ -0,0 +1,13 @@
+import io
+from app.core.metrics import S3_BYTES
+from app.services.s3_upload import upload_fileobj_to_s3
+
+
+async def test_upload_counts_bytes_of_a_file_boto3_closes(s3):
+    client, bucket = s3
+    sent_before = S3_BYTES.labels("out")._value.get()
+
+    await upload_fileobj_to_s3(io.BytesIO(b"%PDF-1.4 hello"), "uploads/hello.pdf", "application/pdf")
+
+    assert client.get_object(Bucket=bucket, Key="uploads/hello.pdf")["Body"].read() == b"%PDF-1.4 hello"
+    assert S3_BYTES.labels("out")._value.get() - sent_before == len(b"%PDF-1.4 hello")
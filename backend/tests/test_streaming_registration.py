@@ -0,0 +1,41 @@
+"""Streamed registration, POST /careers/stream."""
+API = "/api/v1/careers"
+
+
+def bucket_keys(s3) -> set:
+    client, bucket = s3
+    response = client.list_objects_v2(Bucket=bucket)
+    return {item["Key"] for item in response.get("Contents", [])}
+
+
+async def register(client, email: str, mobile: str, resume: bytes):
+    # httpx sends the text fields before the file, as browsers do
+    return await client.post(
+        f"{API}/stream",
+        data={"name": "Ada Lovelace", "email": email, "mobile": mobile},
+        files={"resume_file": ("resume.pdf", resume, "application/pdf")},
+    )
+
+
+async def test_streamed_registration_stores_resume(client, db, s3):
+    response = await register(client, "ada@example.com", "9000000001", b"%PDF-1.4 ada")
+
+    assert response.status_code == 200
+    user = response.json()["user_data"]
+    assert user["email"] == "ada@example.com"
+    assert user["user_id"].startswith("user_")
+    assert user["resume_filename"].split("/")[-1] in {
+        key.split("/")[-1] for key in bucket_keys(s3)
+    }
+
+
+async def test_duplicate_is_rejected_before_upload(client, db, s3):
+    first = await register(client, "grace@example.com", "9000000002", b"%PDF-1.4 one")
+    assert first.status_code == 200
+    keys_before = bucket_keys(s3)
+
+    duplicate = await register(client, "grace@example.com", "9000000003", b"%PDF-1.4 two")
+
+    assert duplicate.status_code == 409
+    assert duplicate.json()["detail"] == "Email already registered"
+    assert bucket_keys(s3) == keys_before
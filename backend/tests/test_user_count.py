@@ -0,0 +1,64 @@
+from app.services.user_count import ActiveUserCounter
+
+
+class CountResult:
+    def __init__(self, value):
+        self.value = value
+
+    def scalar(self):
+        return self.value
+
+
+class InvalidatingSession:
+    """Answers a count while a write invalidates the counter mid-query."""
+
+    info = {}
+
+    def __init__(self, counter, value):
+        self.counter = counter
+        self.value = value
+
+    async def execute(self, query):
+        self.counter.invalidate()
+        return CountResult(self.value)
+
+
+async def test_count_started_before_invalidate_is_not_cached():
+    counter = ActiveUserCounter(ttl_seconds=60)
+
+    assert await counter.get(InvalidatingSession(counter, 5), "cached") == 5
+    assert counter._value is None
+
+    class FreshSession:
+        info = {}
+
+        async def execute(self, query):
+            return CountResult(6)
+
+    assert await counter.get(FreshSession(), "cached") == 6
+    assert counter._value == 6
+
+
+async def test_count_from_a_replica_is_not_cached():
+    counter = ActiveUserCounter(ttl_seconds=60)
+
+    class ReplicaSession:
+        info = {"replica": "replica1"}
+
+        async def execute(self, query):
+            return CountResult(4)
+
+    assert await counter.get(ReplicaSession(), "cached") == 4
+    assert counter._value is None
+
+
+async def test_uncommitted_registration_keeps_the_cached_count(db):
+    from app.services.careersServices import insert_careeruser
+    from app.services.user_count import active_user_counter
+
+    assert await active_user_counter.get(db, "exact") == 0
+    await insert_careeruser(db, "Ada", "ada@example.com", "5550001", None, commit=False)
+
+    # Other transactions still count 0 rows until the caller commits
+    assert active_user_counter._fresh()
+    await db.rollback()
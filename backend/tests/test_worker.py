@@ -0,0 +1,21 @@
+import uuid
+from app.core.logging import log_file_path
+from app.worker import start_processes
+
+
+def log_line(marker: str):
+    from app.core.logging import logging, stop_logging
+
+    logging.warning(f"worker child says {marker}")
+    stop_logging()
+
+
+def test_child_process_logs_reach_the_log_file():
+    marker = uuid.uuid4().hex
+
+    for process in start_processes(2, log_line, marker):
+        process.join(timeout=60)
+        assert process.exitcode == 0
+
+    with open(log_file_path, encoding="utf-8") as log_file:
+        assert sum(marker in line for line in log_file) == 2